@@ -0,0 +1,60 @@
+"""
+Cost of cache operations in the tree-walking `RecursiveCacheHandler` against the flat `FlatCacheHandler`.
+
+Fills both with the same paths, shaped like the preference cache ('channel', guild, channel), then times hits,
+misses, refreshes, register + unregister of a single entry, and unregistering whole guild subtrees.
+"""
+import argparse
+import random as _r
+from time import perf_counter
+
+from data.implementation.utilities.caching import FlatCacheHandler, RecursiveCacheHandler
+
+
+def _time(name: str, func, items: list) -> None:
+    start = perf_counter()
+    for item in items:
+        func(item)
+    elapsed = perf_counter() - start
+    print(f'{name:<28} {elapsed / len(items) * 1e9:9.0f} ns per op')
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--guilds', type=int, default=1_000)
+    parser.add_argument('--channels', type=int, default=20, help='Cached channels per guild.')
+    parser.add_argument('--ops', type=int, default=200_000, help='Operations to time per case.')
+    parser.add_argument('--seed', type=int, default=1123)
+    args = parser.parse_args()
+
+    rng = _r.Random(args.seed)
+    paths: list[tuple[str, ...]] = [('channel', str(g), str(c)) for g in range(args.guilds)
+                                    for c in range(args.channels)]
+    hits: list[tuple[str, ...]] = [rng.choice(paths) for _ in range(args.ops)]
+    misses: list[tuple[str, ...]] = [('channel', str(rng.randrange(args.guilds)), f'missing{i}')
+                                     for i in range(args.ops)]
+    fresh: list[tuple[str, ...]] = [('channel', str(rng.randrange(args.guilds)), f'new{i}') for i in range(args.ops)]
+    guilds: list[tuple[str, ...]] = [('channel', str(g)) for g in range(args.guilds)]
+
+    for name, cache_type in (('tree', RecursiveCacheHandler), ('flat', FlatCacheHandler)):
+        cache: RecursiveCacheHandler = cache_type()
+        start = perf_counter()
+        for path in paths:
+            cache.register(path, 0, 600)
+        print(f'{name}: {len(paths)} entries registered in {(perf_counter() - start) * 1e3:.1f} ms')
+
+        _time(f'{name} get_cached hit', lambda k: cache.get_cached(k, int), hits)
+        _time(f'{name} get_cached miss', lambda k: cache.get_cached(k, int), misses)
+        _time(f'{name} is_cached', cache.is_cached, hits)
+        _time(f'{name} refresh', lambda k: cache.refresh(k, 600), hits)
+
+        def churn(k: tuple[str, ...]) -> None:
+            cache.register(k, 0, 600)
+            cache.unregister(k)
+        _time(f'{name} register + unregister', churn, fresh)
+        _time(f'{name} unregister guild', cache.unregister, guilds)
+        assert cache.size()[0] == 0, 'Entries left behind after unregistering every guild'
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,121 @@
+"""
+Concurrency stress test for `RecursiveCacheHandler.get_or_load`.
+
+Fires many concurrent readers at a handful of cold paths and checks that every path is loaded exactly once per
+expiry, that invalidating a path mid-load does not store the stale value, that cancelled readers do not cancel the
+load for the others, and that a failing load reaches every reader. Exits non-zero on the first violated check.
+"""
+import argparse
+import asyncio
+import random as _r
+from collections import Counter
+from time import perf_counter
+
+from data.implementation.utilities.caching import RecursiveCacheHandler
+
+
+async def stampede(readers: int, paths: int, rounds: int, seed: int) -> None:
+    rng = _r.Random(seed)
+    cache = RecursiveCacheHandler()
+    loads: Counter[tuple[str, ...]] = Counter()
+
+    def loader(keys: tuple[str, ...], version: int):
+        async def load() -> int:
+            loads[keys] += 1
+            await asyncio.sleep(rng.random() * 0.01)
+            return version
+        return load
+
+    start = perf_counter()
+    for version in range(rounds):
+        keys: list[tuple[str, ...]] = [('guild', str(rng.randrange(paths)), 'prefs') for _ in range(readers)]
+        # ttl=0 expires every value right away, so each round is a cold miss on every path again.
+        results: list[int] = await asyncio.gather(*(cache.get_or_load(k, loader(k, version), 0) for k in keys))
+        assert all(r == version for r in results), f'Stale value served in round {version}'
+    elapsed = perf_counter() - start
+
+    expected: int = rounds
+    wrong: dict = {k: n for k, n in loads.items() if n != expected}
+    assert not wrong, f'Paths loaded more than once per round: {wrong}'
+    print(f'stampede      {readers * rounds} reads, {sum(loads.values())} loads over {len(loads)} paths '
+          f'in {elapsed * 1e3:.1f} ms')
+
+
+async def invalidation() -> None:
+    cache = RecursiveCacheHandler()
+    release: asyncio.Event = asyncio.Event()
+
+    async def slow() -> str:
+        await release.wait()
+        return 'stale'
+
+    async def fresh() -> str:
+        return 'fresh'
+
+    first: asyncio.Task = asyncio.create_task(cache.get_or_load(('a', 'b'), slow, 60))
+    await asyncio.sleep(0)
+    cache.unregister(('a',))  # Invalidate while the load is in flight.
+    second: str = await cache.get_or_load(('a', 'b'), fresh, 60)
+    release.set()
+    assert await first == 'stale', 'Reader before invalidation should get the value it waited for'
+    assert second == 'fresh', 'Reader after invalidation must not join the stale load'
+    assert cache.get_cached(('a', 'b'), str) == 'fresh', 'Stale load overwrote the fresh value'
+    print('invalidation  ok')
+
+
+async def cancellation(readers: int) -> None:
+    cache = RecursiveCacheHandler()
+    calls: int = 0
+
+    async def load() -> int:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return 1
+
+    tasks: list[asyncio.Task] = [asyncio.create_task(cache.get_or_load(('k',), load, 60)) for _ in range(readers)]
+    await asyncio.sleep(0)
+    for task in tasks[::2]:
+        task.cancel()
+    results = await asyncio.gather(*tasks, return_exceptions=True)
+    survivors = [r for r in results if not isinstance(r, asyncio.CancelledError)]
+    assert calls == 1 and survivors and all(r == 1 for r in survivors), 'Cancelled readers disturbed the load'
+    print('cancellation  ok')
+
+
+async def failure(readers: int) -> None:
+    cache = RecursiveCacheHandler()
+    calls: int = 0
+
+    async def load() -> int:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0)
+        raise LookupError('boom')
+
+    results = await asyncio.gather(*(cache.get_or_load(('k',), load, 60) for _ in range(readers)),
+                                   return_exceptions=True)
+    assert calls == 1 and all(isinstance(r, LookupError) for r in results), 'Failure not shared by all readers'
+    assert not cache.is_cached(('k',)), 'Failed load left an entry behind'
+    print('failure       ok')
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--readers', type=int, default=2_000, help='Concurrent readers per round.')
+    parser.add_argument('--paths', type=int, default=20, help='Distinct cache paths the readers spread over.')
+    parser.add_argument('--rounds', type=int, default=20)
+    parser.add_argument('--seed', type=int, default=1123)
+    args = parser.parse_args()
+
+    async def run() -> None:
+        await stampede(args.readers, args.paths, args.rounds, args.seed)
+        await invalidation()
+        await cancellation(args.readers)
+        await failure(args.readers)
+
+    asyncio.run(run())
+
+
+if __name__ == '__main__':
+    main()
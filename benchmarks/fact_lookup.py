@@ -0,0 +1,54 @@
+"""
+Cost of a fact lookup as the pools grow.
+
+Compares the COUNT + OFFSET queries `FactDatabase.get_fact` used to run against its in-memory order-statistic index,
+for random lookups and for indexed lookups of the oldest facts, the worst case for OFFSET.
+"""
+import argparse
+import os
+import random as _r
+import tempfile
+from time import perf_counter
+
+from benchmarks.sql_connections import FactLookup, fill
+from data.implementation.fact import FactDatabase
+
+
+def _time(name: str, func, lookups: int) -> None:
+    start = perf_counter()
+    for _ in range(lookups):
+        func()
+    elapsed = perf_counter() - start
+    print(f'{name:<16} {elapsed / lookups * 1e6:9.1f} us per get_fact')
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--global-facts', type=int, default=20_000)
+    parser.add_argument('--local-facts', type=int, default=100_000)
+    parser.add_argument('--guilds', type=int, default=10)
+    parser.add_argument('--lookups', type=int, default=500, help='Number of get_fact calls to time per case.')
+    parser.add_argument('--seed', type=int, default=1123)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        path: str = os.path.join(directory, 'facts.db')
+        FactLookup(path).close()  # Creates the schema.
+        fill(path, args.global_facts, args.local_facts, args.guilds, args.seed)
+
+        rng = _r.Random(args.seed)
+        for name, db in (('count + offset', FactLookup(path)), ('index', FactDatabase(path))):
+            if isinstance(db, FactDatabase):
+                start = perf_counter()
+                for guild_id in [None, *range(args.guilds)]:
+                    db.get_fact_count(guild_id)  # Loads every index up front.
+                print(f'{name}: indexes loaded in {(perf_counter() - start) * 1e3:.1f} ms')
+
+            _time(f'{name} random', lambda: db.get_fact(rng.randrange(args.guilds), None), args.lookups)
+            last: int = args.global_facts + args.local_facts // args.guilds // 2  # Deep in every local pool.
+            _time(f'{name} oldest', lambda: db.get_fact(rng.randrange(args.guilds), last), args.lookups)
+            db.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,120 @@
+"""
+Per-instruction cost of the PISS executor (`piss.executing.InstructionExecutor`).
+
+Runs the same Instructions through the flat Program loop, and through the recursive walk it replaced (rebuilt here
+on the same handlers): one coroutine per instruction, and a nested, depth-checked call per choice.
+Programs hold only Instructions that run without Discord: build, memory, random number and choice, either mixed at
+random in one flat list, or as choices nested four deep.
+Needs the global config (run from the project root), as PISS errors import it.
+"""
+import argparse
+import asyncio as _asyncio
+import random as _r
+from time import perf_counter
+from typing import Any as _Any
+
+from piss._utils.mem_tools import Scope
+from piss.executing import InstructionExecutor
+from piss.executing.compiler import MAX_EXECUTION_RECURSION_DEPTH, Program, compile_instructions
+from piss.instructions.abstract import Instruction
+from piss.instructions.build import BuildInstruction
+from piss.instructions.choice import ChoiceInstruction
+from piss.instructions.memory import MemoryInstruction
+from piss.instructions.push import PushInstruction
+from piss.instructions.randnum import RandomNumberInstruction
+from piss.instructions.randuser import RandomUserInstruction
+from piss.instructions.sleep import SleepInstruction
+
+
+class RecursiveInstructionExecutor(InstructionExecutor):
+    """
+    Execution as it was before Programs: handlers looked up per type and awaited one by one, choices recursing.
+    """
+
+    def __init__(self, client) -> None:
+        super().__init__(client)
+        self._type_handlers = {
+            BuildInstruction: self._build,
+            MemoryInstruction: self._memory,
+            RandomNumberInstruction: self._rnd_num,
+            RandomUserInstruction: self._rnd_usr,
+            PushInstruction: self._push_build,
+            SleepInstruction: self._sleep,
+        }
+
+    @staticmethod
+    async def _call(handler, *args) -> None:
+        result = handler(*args)
+        if result is not None:
+            await result
+
+    async def walk(self, instructions: list[Instruction], memory_stack: Scope[_Any], build: list[str],
+                   recursion_depth: int = -1) -> None:
+        recursion_depth += 1
+        if recursion_depth > MAX_EXECUTION_RECURSION_DEPTH:
+            raise RecursionError(recursion_depth)
+        for instruction in instructions:
+            if type(instruction) is ChoiceInstruction:
+                await self.walk(_r.choice(instruction.options), memory_stack, build, recursion_depth)
+            else:
+                await self._call(self._type_handlers[type(instruction)], instruction, None, memory_stack, build)
+
+
+def flat(count: int, rng: _r.Random) -> list[Instruction]:
+    kinds = (
+        lambda: BuildInstruction(text='word '),
+        lambda: ChoiceInstruction([[BuildInstruction(text='option ')]]),
+        lambda: MemoryInstruction(key='user'),
+        lambda: RandomNumberInstruction(1, 6),
+    )
+    return [rng.choice(kinds)() for _ in range(count)]
+
+
+def nested(count: int, rng: _r.Random) -> list[Instruction]:
+    def choice(depth: int) -> Instruction:
+        if depth == 0:
+            return BuildInstruction(text='leaf ')
+        return ChoiceInstruction([[BuildInstruction(text='a '), choice(depth - 1)],
+                                  [MemoryInstruction(key='user'), choice(depth - 1)]])
+    # Every choice runs two instructions per level down to its leaf: nine in all.
+    return [choice(4) for _ in range(count // 9)]
+
+
+async def _time(run, runs: int) -> float:
+    best: float = float('inf')
+    for _ in range(runs):
+        start = perf_counter()
+        await run()
+        best = min(best, perf_counter() - start)
+    return best
+
+
+async def _main(args: argparse.Namespace) -> None:
+    rng = _r.Random(args.seed)
+    memory_stack: Scope[_Any] = Scope({'user': 'patrick'})
+
+    for name, build in (('flat', flat), ('nested', nested)):
+        instructions: list[Instruction] = build(args.instructions, rng)
+        start = perf_counter()
+        program: Program = compile_instructions(instructions)
+        print(f'{name}: compiled into {len(program)} steps in {(perf_counter() - start) * 1e3:.1f} ms')
+
+        recursive = RecursiveInstructionExecutor(None)
+        vm = InstructionExecutor(None)
+        walked: float = await _time(lambda: recursive.walk(instructions, memory_stack, []), args.runs)
+        looped: float = await _time(lambda: vm._exec(program, None, memory_stack, False, []), args.runs)
+        print(f'{name} recursive walk  {walked / args.instructions * 1e9:7.0f} ns per instruction')
+        print(f'{name} program loop    {looped / args.instructions * 1e9:7.0f} ns per instruction')
+        print(f'{name} speedup         {walked / looped:7.2f}x')
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--instructions', type=int, default=100_000, help='Instructions run per program, roughly.')
+    parser.add_argument('--runs', type=int, default=5, help='Runs per executor; the fastest counts.')
+    parser.add_argument('--seed', type=int, default=1123)
+    _asyncio.run(_main(parser.parse_args()))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,91 @@
+"""
+Cost of PISS memory lookups (`piss._utils.mem_tools.Scope`) with scope depth.
+
+Reads one key through scopes nested 1 to MAX_RECURSION_DEPTH + 1 deep, once with `Scope`, and once with the list of
+dicts it replaced (rebuilt here), which flattened every scope into a new dict on each read. Then parses `choice`
+nested to the maximum recursion depth, every level ending in a memory call, with either memory for the parser's
+type scopes.
+Needs the global config (run from the project root), as PISS errors import it.
+"""
+import argparse
+from time import perf_counter
+from types import MappingProxyType
+from typing import Any as _Any, Callable as _Callable
+
+from benchmarks.piss_parse import nested
+from piss._utils.mem_tools import INITIAL_MEMORY_SCOPE, INITIAL_MEMORY_TYPES, Scope
+from piss.parsing import MAX_RECURSION_DEPTH, _parse_top_level
+
+
+class FlatteningScope(Scope):
+    """
+    Scope read as before: the chain of scopes, outermost first, flattened into one dict on every read.
+    """
+
+    def _stack(self) -> list[dict[str, _Any]]:
+        stack: list[dict[str, _Any]] = []
+        scope: Scope | None = self
+        while scope is not None:
+            stack.append(scope.entries)
+            scope = scope.parent
+        stack.reverse()
+        return stack
+
+    def child(self) -> Scope:
+        return FlatteningScope(parent=self)
+
+    def fetch(self, key: str) -> _Any | None:
+        mem: dict[str, _Any] = {}
+        for entries in reversed(self._stack()):
+            for k, v in entries.items():
+                mem[k] = v
+        return mem[key] if key in mem.keys() else None
+
+
+def _chain(root: Scope, depth: int) -> Scope:
+    scope: Scope = root
+    for _ in range(depth - 1):
+        scope = scope.child()
+        scope.assign('local', 0)
+    return scope
+
+
+def _best(run: _Callable[[], None], runs: int) -> float:
+    best: float = float('inf')
+    for _ in range(runs):
+        start = perf_counter()
+        run()
+        best = min(best, perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--reads', type=int, default=20_000, help='Reads per depth and memory.')
+    parser.add_argument('--units', type=int, default=64, help='Repeated units per level of the nested parse input.')
+    parser.add_argument('--runs', type=int, default=5, help='Runs per measurement; the fastest counts.')
+    args = parser.parse_args()
+
+    for depth in range(1, MAX_RECURSION_DEPTH + 2):
+        times: list[float] = []
+        for root in (FlatteningScope(dict(INITIAL_MEMORY_TYPES)), Scope(dict(INITIAL_MEMORY_TYPES))):
+            scope: Scope = _chain(root, depth)
+            fetch = scope.fetch
+
+            def reads() -> None:
+                for _ in range(args.reads):
+                    fetch('user.name')
+            times.append(_best(reads, args.runs) / args.reads)
+        print(f'depth {depth}: flattened {times[0] * 1e9:8.0f} ns  scope {times[1] * 1e9:6.0f} ns  '
+              f'{times[0] / times[1]:6.1f}x')
+
+    # Every block of the nested input ends in a memory call.
+    source: str = nested(args.units)
+    for name, root in (('flattened', FlatteningScope(MappingProxyType(INITIAL_MEMORY_TYPES))),
+                       ('scope', INITIAL_MEMORY_SCOPE)):
+        best: float = _best(lambda: _parse_top_level(source, 0, root, False), args.runs)
+        print(f'nested choice parse, {name:<9} {len(source):>7} chars {best * 1e3:8.2f} ms')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,60 @@
+"""
+Scaling of the PISS lexer and parser (`piss.parsing`) with input size.
+
+Parses inputs of doubling size in two shapes: long, flat strings of text and blocks, and strings of `choice` nested
+to the maximum recursion depth, whose options grow with the input. Parse time per character should stay flat for
+both; the last column is the time per character relative to the smallest input.
+Needs the global config (run from the project root), as PISS errors import it.
+"""
+import argparse
+from time import perf_counter
+
+from piss.parsing import MAX_RECURSION_DEPTH, parse_instructions_from_string
+
+_FLAT_UNIT: str = (r'Hello {user}, you rolled {rand(1, 6)} \{not a block\}. '
+                   r"{choice('a {user.name}', 'b', 'c {guild}')} {sleep(1); push(1); tru(3, name)} ")
+
+
+def _quote(text: str) -> str:
+    return "'" + text.replace('\\', '\\\\').replace("'", "\\'") + "'"
+
+
+def flat(units: int) -> str:
+    return _FLAT_UNIT * units
+
+
+def nested(units: int) -> str:
+    """
+    `choice` nested MAX_RECURSION_DEPTH deep, every level carrying `units` pieces of text and blocks of its own.
+    """
+    text: str = 'x {user} ' * units
+    for _ in range(MAX_RECURSION_DEPTH):
+        text = f'{{choice({_quote(text)}, {_quote("y {guild} " * units)})}} ' + 'z {rand(1, 2)} ' * units
+    return text
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--units', type=int, default=16, help='Repeated units in the smallest input.')
+    parser.add_argument('--steps', type=int, default=7, help='Input sizes, doubling every step.')
+    parser.add_argument('--runs', type=int, default=5, help='Parses per input; the fastest counts.')
+    args = parser.parse_args()
+
+    for name, build in (('flat', flat), ('nested', nested)):
+        base: float | None = None
+        for step in range(args.steps):
+            source: str = build(args.units << step)
+            best: float = float('inf')
+            for _ in range(args.runs):
+                start = perf_counter()
+                parse_instructions_from_string(source)
+                best = min(best, perf_counter() - start)
+
+            per_char: float = best / len(source)
+            base = base or per_char
+            print(f'{name:<7} {len(source):>9} chars {best * 1e3:9.2f} ms {per_char * 1e9:7.0f} ns/char '
+                  f'{per_char / base:5.2f}x')
+
+
+if __name__ == '__main__':
+    main()
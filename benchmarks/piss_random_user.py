@@ -0,0 +1,83 @@
+"""
+Cost of the first `tru(n)` of an execution with guild size (`piss.executing.InstructionExecutor._member_attribute`).
+
+Resolves a few random members in a fresh executor per execution, once through a keyed permutation of member indices
+(`piss._utils.permutation.Permutation`) walked to in the member cache, and once by shuffling a copy of the member list as
+before (rebuilt here). Reports the time per execution and the peak memory allocated by it: the shuffle copies the whole
+member list, the permutation allocates nothing that grows with the guild.
+Guilds are stand-ins that keep their members the way discord.py's `Guild` does: a member cache dict, handed out as a
+fresh `SequenceProxy` on every `members` access, which copies the cache once it is indexed or iterated.
+Needs the global config (run from the project root), as PISS errors import it.
+"""
+import argparse
+import random as _r
+import tracemalloc
+from time import perf_counter
+from types import SimpleNamespace
+
+from discord.utils import SequenceProxy
+
+from piss.executing import InstructionExecutor
+from piss.instructions.randuser import RandomUserInstruction
+
+
+class ShufflingInstructionExecutor(InstructionExecutor):
+    """
+    Random members as before permutations: the whole member list copied and shuffled on the first `tru(n)`.
+    """
+
+    def __init__(self, client) -> None:
+        super().__init__(client)
+        self._shuffled_member_list: list = []
+
+    def _member_attribute(self, instruction: RandomUserInstruction, interaction) -> str:
+        if not self._shuffled_member_list:
+            self._shuffled_member_list = list(interaction.guild.members)
+            _r.shuffle(self._shuffled_member_list)
+        return str(self._shuffled_member_list[instruction.index % len(self._shuffled_member_list)].id)
+
+
+class Guild:
+    def __init__(self, size: int) -> None:
+        self._members: dict[int, SimpleNamespace] = {i: SimpleNamespace(id=i) for i in range(size)}
+
+    @property
+    def members(self) -> SequenceProxy:
+        return SequenceProxy(self._members.values())
+
+
+def _execution(executor_type: type[InstructionExecutor], interaction, instructions: list[RandomUserInstruction]) -> None:
+    executor: InstructionExecutor = executor_type(None)
+    for instruction in instructions:
+        executor._member_attribute(instruction, interaction)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--members', type=int, default=1_000, help='Members in the smallest guild.')
+    parser.add_argument('--steps', type=int, default=3, help='Guild sizes, ten times larger every step.')
+    parser.add_argument('--calls', type=int, default=3, help='tru(n) calls per execution, all with distinct n.')
+    parser.add_argument('--runs', type=int, default=5, help='Executions per guild; the fastest counts.')
+    args = parser.parse_args()
+    instructions = [RandomUserInstruction(n, 'id') for n in range(args.calls)]
+
+    for step in range(args.steps):
+        size: int = args.members * 10 ** step
+        interaction = SimpleNamespace(guild=Guild(size))
+
+        for name, executor_type in (('shuffled', ShufflingInstructionExecutor), ('permuted', InstructionExecutor)):
+            best: float = float('inf')
+            for _ in range(args.runs):
+                start = perf_counter()
+                _execution(executor_type, interaction, instructions)
+                best = min(best, perf_counter() - start)
+
+            tracemalloc.start()
+            _execution(executor_type, interaction, instructions)
+            peak: int = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            print(f'{size:>9} members {name}: {best * 1e3:9.3f} ms {peak / 1024:9.1f} KiB peak')
+
+
+if __name__ == '__main__':
+    main()
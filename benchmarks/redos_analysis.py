@@ -0,0 +1,102 @@
+"""
+Checks for the regex backtracking analysis (`data.interfaces.utilities.redos`) and the sandbox behind it.
+
+Every known catastrophic pattern must be rated exponential, and refused as a trigger. Common, harmless patterns must
+still be accepted and evaluated on the event loop for ordinary messages. Polynomial patterns must be sent to the
+sandbox from `SANDBOX_DEGREE` on or on long content, and the sandbox must cut off a catastrophic pattern within its time
+budget. Exits non-zero on the first violated check.
+"""
+import argparse
+import asyncio
+from time import perf_counter
+
+from data.interfaces.autoreplies import SimpleAliasData, SimpleTriggerData
+from data.interfaces.utilities.redos import RegexRisk, analyze_pattern
+from data.interfaces.utilities.triggers import SANDBOX_LONG_INPUT, CompiledTrigger, compile_trigger
+from utilities.regex_sandbox import RegexSandbox
+
+# Each of these freezes the regex engine for seconds to minutes on a short run of 'a' that fails to match.
+CATASTROPHIC: tuple[str, ...] = (
+    r'(a+)+b',
+    r'(a|aa)+b',
+    r'(\w+\s?)+$',
+    r'(?=(a+)+b)',
+    r'(?!(a+)+b)x',
+    r'(a{1,50}){1,50}b',
+    r'(.*a){12}x',
+    r'(?:a+){2,60}b',
+    r'(a*)*b',
+)
+HARMLESS: tuple[str, ...] = (
+    r'hello',
+    r'(?i)good (morning|night)',
+    r'^!\w+',
+    r'\d{1,3}(\.\d{1,3}){3}',
+    r'(\w+\s)*end',
+    r'.*patrick.*',
+    r'(?:ab){2}c',
+)
+LITERAL: tuple[str, ...] = (r'hello', r'^hi\b', r'[abc]x', r'(?:ab){2}c', r'(?!x)abc')
+# Polynomial, but of a degree that is only evaluated in the sandbox.
+STEEP: tuple[str, ...] = (r'.*a.*b.*c', r'(?i).*good.*\w+.*')
+
+
+def _trigger(pattern: str) -> SimpleTriggerData:
+    return SimpleTriggerData('regex', pattern, 256, False)
+
+
+def analysis() -> None:
+    for pattern in CATASTROPHIC:
+        risk: RegexRisk = analyze_pattern(pattern)
+        assert risk.level == 'exponential', f'{pattern} rated {risk.level} (degree {risk.degree})'
+        try:
+            compile_trigger(_trigger(pattern))
+        except ValueError:
+            pass
+        else:
+            raise AssertionError(f'{pattern} accepted as a trigger')
+    print(f'catastrophic  {len(CATASTROPHIC)} patterns rejected')
+
+    for pattern in HARMLESS:
+        compile_trigger(_trigger(pattern))
+    print(f'harmless      {len(HARMLESS)} patterns accepted')
+
+    alias: SimpleAliasData = SimpleAliasData('alias', 256)
+    short, long = 'patrick ' * 10, 'patrick ' * (SANDBOX_LONG_INPUT // 8 + 1)
+    for pattern in HARMLESS + LITERAL + STEEP:
+        trigger: CompiledTrigger = CompiledTrigger(alias, _trigger(pattern), compile_trigger(_trigger(pattern)))
+        assert trigger.needs_sandbox(short) == (pattern in STEEP), f'{pattern} evaluated in the wrong place'
+        polynomial: bool = trigger.risk.level == 'polynomial'
+        assert trigger.needs_sandbox(long) == polynomial, f'{pattern} evaluated in the wrong place on long content'
+    print(f'placement     {len(HARMLESS + LITERAL)} patterns run in-process on ordinary messages, '
+          f'{len(STEEP)} steep ones in the sandbox')
+
+
+async def sandbox(timeout: float, length: int) -> None:
+    box: RegexSandbox = RegexSandbox(timeout=timeout)
+    try:
+        assert await box.match(r'hel+o', 0, 'hello there'), 'Sandbox missed a plain match'
+        for pattern in CATASTROPHIC:
+            start = perf_counter()
+            matched: bool = await box.match(pattern, 0, 'a' * length + '!')
+            elapsed: float = perf_counter() - start
+            assert not matched, f'{pattern} matched a run of a'
+            # Worker restarts are not part of the evaluation budget, but must not take the loop down either.
+            assert elapsed < timeout + 5, f'{pattern} held the sandbox for {elapsed:.2f} s'
+        print(f'sandbox       {len(box.quarantined)} of {len(CATASTROPHIC)} patterns quarantined at {length} characters')
+    finally:
+        box.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--timeout', type=float, default=0.1, help='Sandbox budget per evaluation, in seconds.')
+    parser.add_argument('--length', type=int, default=40, help='Length of the adversarial input.')
+    args = parser.parse_args()
+
+    analysis()
+    asyncio.run(sandbox(args.timeout, args.length))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,58 @@
+"""
+Cost of picking a weighted reply for a fired Alias.
+
+Compares a linear cumulative-weight scan (what a query over the reply pool amounts to) against a prefix-sum array with
+bisect and a prebuilt `AliasTable`.
+"""
+import argparse
+import bisect
+import itertools
+import random as _r
+from time import perf_counter
+
+from data.interfaces.autoreplies import SimpleReplyData
+from data.interfaces.utilities.weighted import AliasTable
+
+
+def linear_pick(replies: list[SimpleReplyData], rng: _r.Random) -> SimpleReplyData:
+    target: int = rng.randrange(sum(r.weight for r in replies))
+    for reply in replies:
+        if target < reply.weight:
+            return reply
+        target -= reply.weight
+    raise AssertionError('unreachable')
+
+
+def _time(name: str, func, picks: int) -> None:
+    start = perf_counter()
+    for _ in range(picks):
+        func()
+    elapsed = perf_counter() - start
+    print(f'{name:<8} {elapsed / picks * 1e6:8.3f} us per pick')
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--replies', type=int, default=1_000, help='Replies in the pool of the Alias.')
+    parser.add_argument('--max-weight', type=int, default=1_024, help='Upper bound of reply weights.')
+    parser.add_argument('--picks', type=int, default=20_000, help='Number of picks to time.')
+    parser.add_argument('--seed', type=int, default=1123)
+    args = parser.parse_args()
+
+    rng = _r.Random(args.seed)
+    replies: list[SimpleReplyData] = [SimpleReplyData('text', f'reply {i}', rng.randint(1, args.max_weight))
+                                      for i in range(args.replies)]
+    weights: list[int] = [r.weight for r in replies]
+
+    start = perf_counter()
+    table: AliasTable[SimpleReplyData] = AliasTable(replies, weights)
+    print(f'{len(table)} replies; alias table built in {(perf_counter() - start) * 1e3:.2f} ms')
+    prefix: list[int] = list(itertools.accumulate(weights))
+
+    _time('linear', lambda: linear_pick(replies, rng), args.picks)
+    _time('bisect', lambda: replies[bisect.bisect_right(prefix, rng.randrange(prefix[-1]))], args.picks)
+    _time('alias', lambda: table.pick(rng.randrange), args.picks)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,100 @@
+"""
+Cost of a fact lookup per connection strategy.
+
+Compares opening a fresh, untuned connection per query (the old `AbstractSQLDatabase._connection`) against pooled
+per-thread connections, both untuned and with the WAL profile.
+"""
+import argparse
+import os
+import random as _r
+import sqlite3 as _sql
+import tempfile
+from time import perf_counter
+
+from data.implementation.utilities.abstract import AbstractSQLDatabase
+from data.implementation.utilities.connections import DEFAULT_PROFILE, WAL_PROFILE
+
+
+class FactLookup(AbstractSQLDatabase):
+    """
+    The COUNT + OFFSET read path `FactDatabase.get_fact` used before it kept an in-memory index, so every lookup hits
+    the database.
+    """
+
+    def __init__(self, path: str):
+        super().__init__(path, 'data/schemas/fact.sql')
+
+    def get_fact(self, guild_id: int | None, index: int | None) -> str:
+        with self._connection() as conn:
+            cursor = conn.cursor()
+            global_count: int = cursor.execute("SELECT COUNT(*) FROM GlobalFacts").fetchone()[0]
+            local_count: int = 0
+            if guild_id is not None:
+                local_count = cursor.execute("SELECT COUNT(*) FROM LocalFacts WHERE GuildID = ?",
+                                             (guild_id,)).fetchone()[0]
+
+            offset: int = _r.randrange(global_count + local_count) if index is None else index - 1
+            if offset < global_count:
+                cursor.execute("SELECT Text FROM GlobalFacts ORDER BY CreatedAt DESC LIMIT 1 OFFSET ?", (offset,))
+            else:
+                cursor.execute("SELECT Text FROM LocalFacts WHERE GuildID = ? ORDER BY CreatedAt DESC LIMIT 1 OFFSET ?",
+                               (guild_id, offset - global_count))
+            return cursor.fetchone()['Text']
+
+
+class LegacyFactLookup(FactLookup):
+    def _connection(self) -> _sql.Connection:
+        conn = _sql.connect(self.path)
+        conn.row_factory = _sql.Row
+        return conn
+
+
+class PooledFactLookup(FactLookup):
+    pragma_profile = DEFAULT_PROFILE
+
+
+class WALFactLookup(FactLookup):
+    pragma_profile = WAL_PROFILE
+
+
+def fill(path: str, global_facts: int, local_facts: int, guilds: int, seed: int) -> None:
+    rng = _r.Random(seed)
+    with _sql.connect(path) as conn:
+        conn.executemany('INSERT INTO GlobalFacts (Text, AuthorID, ModifiedAt, CreatedAt) VALUES (?, 0, ?, ?)',
+                         ((f'global fact {i}', i, i) for i in range(global_facts)))
+        conn.executemany('INSERT INTO LocalFacts (Text, GuildID, AuthorID, ModifiedAt, CreatedAt) '
+                         'VALUES (?, ?, 0, ?, ?)',
+                         ((f'local fact {i}', rng.randrange(guilds), i, i) for i in range(local_facts)))
+    conn.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--global-facts', type=int, default=2_000)
+    parser.add_argument('--local-facts', type=int, default=20_000)
+    parser.add_argument('--guilds', type=int, default=100)
+    parser.add_argument('--lookups', type=int, default=5_000, help='Number of get_fact calls to time.')
+    parser.add_argument('--seed', type=int, default=1123)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        path: str = os.path.join(directory, 'facts.db')
+        LegacyFactLookup(path)  # Creates the schema.
+        fill(path, args.global_facts, args.local_facts, args.guilds, args.seed)
+
+        for name, cls in (('legacy', LegacyFactLookup), ('pooled', PooledFactLookup), ('wal', WALFactLookup)):
+            db: FactLookup = cls(path)
+            rng = _r.Random(args.seed)
+            db.get_fact(0, None)  # Warm up.
+
+            start = perf_counter()
+            for _ in range(args.lookups):
+                db.get_fact(rng.randrange(args.guilds), None)
+            elapsed = perf_counter() - start
+            print(f'{name:<8} {elapsed / args.lookups * 1e6:8.1f} us per get_fact')
+
+            db.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,204 @@
+"""
+Per-message latency of text autoreply trigger matching.
+
+Compares the old per-message loop (uncompiled `re.match` for every trigger) against a prebuilt `TriggerMatcher` snapshot,
+with and without its indexes, and with the same pool written using the cheap non-regex trigger types.
+Also times `TriggerMatcher.match_async`, which is what the autoreply cog calls, against a real `RegexSandbox`: one message
+at a time, in concurrent bursts, and on long messages that push polynomial patterns into the sandbox.
+"""
+import argparse
+import asyncio
+import random as _r
+import re as _re
+import statistics
+from time import perf_counter
+
+from data.interfaces.autoreplies import SimpleAliasData, SimpleTriggerData
+from data.interfaces.utilities.triggers import SANDBOX_LONG_INPUT, TriggerMatcher
+from utilities.regex_sandbox import RegexSandbox
+
+_WORDS: list[str] = ['patrick', 'bateman', 'business', 'card', 'reservation', 'dorsia', 'huey', 'lewis', 'news',
+                     'axe', 'morning', 'workout', 'stock', 'mergers', 'acquisitions', 'sheep', 'fiddle', 'queer',
+                     'fact', 'number', 'letter', 'hello', 'there', 'cool', 'bone', 'white', 'paper', 'font']
+
+
+# Shapes admins actually write, as regex and as the equivalent cheap trigger type (None if there is no equivalent).
+_SHAPES: list[tuple[str, str, str | None, bool]] = [
+    (r'^{w}$', '{w}', 'exact', False),
+    (r'.*{w}', '{w}', 'literal', False),
+    (r'.*\b{w}\b', '{w}', 'word', False),
+    (r'^{w} {v}', '{w} {v}', 'prefix', False),
+    (r'(?i).*{w}\s+{v}', '', None, True),
+]
+
+
+def build_pool(trigger_count: int, triggers_per_alias: int, seed: int,
+               typed: bool = False) -> dict[SimpleAliasData, list[SimpleTriggerData]]:
+    """
+    Builds a synthetic trigger pool in the shapes admins actually write: anchored words, substrings and word bounds.
+    :param typed: Use the cheap trigger types where one is equivalent to the regex shape.
+    """
+    rng = _r.Random(seed)
+    pool: dict[SimpleAliasData, list[SimpleTriggerData]] = {}
+    for a in range(0, trigger_count, triggers_per_alias):
+        alias = SimpleAliasData(name=f'alias_{a}', rate=256)
+        pool[alias] = []
+        for t in range(a, min(a + triggers_per_alias, trigger_count)):
+            regex, plain, trigger_type, case_insensitive = rng.choice(_SHAPES)
+            w, v = f'{rng.choice(_WORDS)}{t}', rng.choice(_WORDS)
+            if typed and trigger_type is not None:
+                trigger = SimpleTriggerData(trigger_type=trigger_type, data=plain.format(w=w, v=v), rate=None)
+            else:
+                trigger = SimpleTriggerData(trigger_type='regex', data=regex.format(w=w, v=v), rate=None)
+            pool[alias].append(trigger)
+    return pool
+
+
+def build_messages(message_count: int, trigger_count: int, seed: int) -> list[str]:
+    """
+    Builds random chatter, where some words carry a trigger number so that triggers actually fire now and then.
+    """
+    rng = _r.Random(seed + 1)
+
+    def word() -> str:
+        return rng.choice(_WORDS) + (str(rng.randrange(trigger_count)) if rng.random() < 0.1 else '')
+
+    return [' '.join(word() for _ in range(rng.randint(1, 20))) for _ in range(message_count)]
+
+
+def legacy_match(pool: dict[SimpleAliasData, list[SimpleTriggerData]], content: str) -> list[SimpleAliasData]:
+    """
+    The per-message loop as it was inside `MessageContentAutoreplyCog.message_content_replies`.
+    """
+    firing: list[SimpleAliasData] = []
+    for alias, triggers in pool.items():
+        for trigger in triggers:
+            num: int = _r.randint(1, 256)
+            rate: int = (trigger.rate if trigger.rate else alias.rate)
+            if num > rate:
+                continue
+            if _re.match(trigger.data, content):
+                firing.append(alias)
+                break
+    return firing
+
+
+class _CountingSandbox(RegexSandbox):
+    """
+    Sandbox that counts the evaluations it is handed.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.evaluations: int = 0
+
+    async def match(self, pattern: str, flags: int, content: str) -> bool:
+        self.evaluations += 1
+        return await super().match(pattern, flags, content)
+
+
+def _time_per_message(func, messages: list[str]) -> list[float]:
+    out: list[float] = []
+    for content in messages:
+        start = perf_counter()
+        func(content)
+        out.append(perf_counter() - start)
+    return out
+
+
+def _report(name: str, samples: list[float]) -> None:
+    samples = sorted(samples)
+    p95 = samples[int(len(samples) * 0.95) - 1]
+    print(f'{name:<10} mean {statistics.fmean(samples) * 1e3:8.3f} ms   '
+          f'median {statistics.median(samples) * 1e3:8.3f} ms   p95 {p95 * 1e3:8.3f} ms')
+
+
+async def _time_async(matcher: TriggerMatcher, messages: list[str], sandbox: _CountingSandbox) -> list[float]:
+    out: list[float] = []
+    for content in messages:
+        start = perf_counter()
+        await matcher.match_async(content, sandbox)
+        out.append(perf_counter() - start)
+    return out
+
+
+async def _time_bursts(matcher: TriggerMatcher, messages: list[str], sandbox: _CountingSandbox,
+                       burst: int) -> list[float]:
+    """
+    Matches messages in bursts of concurrent tasks, as when many guilds talk at once.
+    :return: Wall time per burst.
+    """
+    out: list[float] = []
+    for i in range(0, len(messages), burst):
+        start = perf_counter()
+        await asyncio.gather(*(matcher.match_async(content, sandbox) for content in messages[i:i + burst]))
+        out.append(perf_counter() - start)
+    return out
+
+
+async def bench_async(matcher: TriggerMatcher, messages: list[str], burst: int) -> None:
+    sandbox = _CountingSandbox()
+    try:
+        await sandbox.match('warm', 0, 'warm up')  # Worker start-up is not part of any message.
+        for content in messages:
+            if await matcher.match_async(content, sandbox, roll=min) != matcher.match(content, roll=min):
+                raise AssertionError(f'Sandbox changed the outcome for {content!r}')
+
+        sandbox.evaluations = 0
+        _report('async', await _time_async(matcher, messages, sandbox))
+        print(f'{"":<10} {sandbox.evaluations / len(messages):.2f} sandboxed evaluations per message')
+
+        sandbox.evaluations = 0
+        _report(f'burst {burst}', await _time_bursts(matcher, messages, sandbox, burst))
+        print(f'{"":<10} per burst; {sandbox.evaluations / len(messages):.2f} sandboxed evaluations per message')
+
+        # Long enough for every polynomial pattern to leave the event loop.
+        long_messages: list[str] = [(content + ' ') * (SANDBOX_LONG_INPUT // (len(content) + 1) + 1)
+                                    for content in messages[:max(1, len(messages) // 10)]]
+        sandbox.evaluations = 0
+        _report('async long', await _time_async(matcher, long_messages, sandbox))
+        print(f'{"":<10} {sandbox.evaluations / len(long_messages):.2f} sandboxed evaluations per message')
+    finally:
+        sandbox.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--triggers', type=int, default=10_000, help='Total number of triggers in the pool.')
+    parser.add_argument('--per-alias', type=int, default=5, help='Triggers per alias.')
+    parser.add_argument('--messages', type=int, default=200, help='Number of messages to match.')
+    parser.add_argument('--burst', type=int, default=100, help='Concurrent messages per burst for match_async.')
+    parser.add_argument('--seed', type=int, default=1123)
+    args = parser.parse_args()
+
+    pool = build_pool(args.triggers, args.per_alias, args.seed)
+    messages = build_messages(args.messages, args.triggers, args.seed)
+
+    start = perf_counter()
+    matcher = TriggerMatcher(pool)
+    print(f'{len(matcher)} triggers over {len(pool)} aliases; snapshot built in {(perf_counter() - start) * 1e3:.1f} ms'
+          f' ({matcher.unfiltered} without a required literal)')
+    unfiltered = TriggerMatcher(pool, prefilter=False)
+
+    # Both paths must agree when every roll passes.
+    for content in messages:
+        if matcher.match(content, roll=min) != unfiltered.match(content, roll=min):
+            raise AssertionError(f'Prefilter changed the outcome for {content!r}')
+    candidates = statistics.fmean(len(matcher.candidates(c)) for c in messages)
+    firing = statistics.fmean(len(matcher.match(c, roll=min)) for c in messages)
+    print(f'{candidates:.1f} candidate triggers and {firing:.2f} firing aliases per message on average')
+
+    typed = TriggerMatcher(build_pool(args.triggers, args.per_alias, args.seed, typed=True))
+    for content in messages:
+        if matcher.match(content, roll=min) != typed.match(content, roll=min):
+            raise AssertionError(f'Typed triggers changed the outcome for {content!r}')
+
+    _report('legacy', _time_per_message(lambda c: legacy_match(pool, c), messages))
+    _report('unfiltered', _time_per_message(unfiltered.match, messages))
+    _report('prefilter', _time_per_message(matcher.match, messages))
+    _report('typed', _time_per_message(typed.match, messages))
+    asyncio.run(bench_async(matcher, messages, args.burst))
+
+
+if __name__ == '__main__':
+    main()
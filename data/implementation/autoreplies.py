@@ -1,5 +1,7 @@
 from data.implementation.utilities.abstract import AbstractSQLDatabase
-from data.interfaces.autoreplies import GlobalTextAutoreplyInterface
+from data.interfaces.autoreplies import GlobalTextAutoreplyInterface, SimpleReplyData
+from data.interfaces.utilities.triggers import TriggerMatcher
+from data.interfaces.utilities.weighted import AliasTable
 
 """
 Table(s) and design:
@@ -11,3 +13,33 @@ Table(s) and design:
 class AutoreplyDatabase(AbstractSQLDatabase, GlobalTextAutoreplyInterface):
     def __init__(self, path: str):
         super().__init__(path, 'data/schemas/autoreplies.sql')
+
+        self._trigger_matcher: TriggerMatcher | None = None  # Built on first use.
+        # Alias name -> weighted reply pool, or None if the Alias has no replies. Built per Alias on first use.
+        self._reply_tables: dict[str, AliasTable[SimpleReplyData] | None] = {}
+
+    def get_reply(self, alias: str) -> SimpleReplyData | None:
+        if alias not in self._reply_tables:
+            replies: list[SimpleReplyData] = self.get_replies_by_alias(alias)  # Raises ValueError on bad Alias.
+            self._reply_tables[alias] = AliasTable(replies, [r.weight for r in replies]) if replies else None
+
+        table: AliasTable[SimpleReplyData] | None = self._reply_tables[alias]
+        return table.pick() if table is not None else None
+
+    def _invalidate_reply_table(self, alias: str) -> None:
+        """
+        Drops the weighted reply pool of the given Alias. Call after every Reply modification on it, and after the
+        Alias itself is renamed or deleted.
+        """
+        self._reply_tables.pop(alias, None)
+
+    def get_trigger_matcher(self) -> TriggerMatcher:
+        if self._trigger_matcher is None:
+            self._trigger_matcher = TriggerMatcher(self.get_triggers_by_alias())
+        return self._trigger_matcher
+
+    def _invalidate_trigger_matcher(self) -> None:
+        """
+        Drops the compiled trigger snapshot. Call after every Alias or Trigger modification.
+        """
+        self._trigger_matcher = None
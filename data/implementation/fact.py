@@ -1,7 +1,11 @@
 import random as _r
+import sqlite3 as _sql
+from time import time
+from typing import Callable
 
 from data.implementation.utilities.abstract import AbstractSQLDatabase
-from data.interfaces.fact import GlobalAdminFactInterface
+from data.interfaces.fact import GlobalAdminFactInterface, SimpleFactEditorData, FactEditorData
+from data.interfaces.utilities.ordered import OrderStatisticIndex
 
 """
 Table(s) and design:
@@ -11,6 +15,7 @@ Table(s) and design:
 - int; CreatedAt (UNIX Timestamp) (order on for index offset; needs to remain static regardless of edits)
 - int; AuthorID (keep track of last modified user ID)
 - int; ModifiedAt (UNIX Timestamp) (Moderation purposes)
+- bytes | None; Compiled (compiled form of Text, opaque here)
 PK: Text
 
 # LocalFacts:
@@ -19,21 +24,46 @@ PK: Text
 - int; CreatedAt (UNIX Timestamp) (to order for indexing)
 - int; AuthorID (keep track of last modified user ID)
 - int; ModifiedAt (UNIX Timestamp) (Moderation purposes)
+- bytes | None; Compiled (compiled form of Text, opaque here)
 PK: (GuildID, Text)
 
-Order by CreatedAt for Indexing purposes.
+Order by CreatedAt for Indexing purposes, newest first. Ties are broken on Text.
 Disallows users adding duplicate facts, which is good.
+
+Indexing is served from an in-memory order-statistic index per pool of (CreatedAt, Text) keys, oldest first, loaded on
+first use and kept up to date by every write made through this class. Lookups never touch the disk.
+Counts of every pool are loaded together on first use and kept the same way, so counting does not load a pool's index.
+Compiled is filled by the compiler given on construction whenever Text is written, so readers need not parse Text again.
+Rows written without a compiler, or compiled to an older format, are compiled again the first time they are read.
 """
 
 
+_FactKey = tuple[int, str]  # (CreatedAt, Text)
+
+
 class FactDatabase(AbstractSQLDatabase, GlobalAdminFactInterface):
-    def __init__(self, path: str):
+    def __init__(self, path: str, compiler: Callable[[str], bytes | None] | None = None,
+                 is_current: Callable[[bytes], bool] | None = None):
+        """
+        :param compiler: Turns fact text into the compiled form stored next to it, None if it does not compile.
+        Without one, no compiled forms are stored. See `piss.old.serialization.compile_source`.
+        :param is_current: Tells whether a stored compiled form is of the compiler's current format. Forms that are
+        not are compiled again when read, as are missing ones. Without it, only missing ones are.
+        See `piss.old.serialization.is_current`.
+        """
         super().__init__(path, "data/schemas/fact.sql")
+        self._compiler: Callable[[str], bytes | None] | None = compiler
+        self._is_current: Callable[[bytes], bool] | None = is_current
+        self._add_compiled_columns()
 
         self.local_fact_kill_switch: bool = False
         # This killswitch is disabled on-launch, but allows temporary disabling of the Local Fact service in case something goes HORRIBLY wrong.
         # Mostly intended for Moderation purposes.
 
+        self._global_index: OrderStatisticIndex[_FactKey] | None = None
+        self._local_indexes: dict[int, OrderStatisticIndex[_FactKey]] = {}
+        self._counts: dict[int | None, int] | None = None  # Guild ID or None for global -> fact count.
+
     def toggle_local_fact_killswitch(self) -> bool:
         self.local_fact_kill_switch = not self.local_fact_kill_switch
         return self.local_fact_kill_switch
@@ -41,78 +71,273 @@ class FactDatabase(AbstractSQLDatabase, GlobalAdminFactInterface):
     def is_killswitch(self) -> bool:
         return self.local_fact_kill_switch
 
+    def _add_compiled_columns(self) -> None:
+        """
+        Adds the Compiled columns to databases created before they were part of the schema.
+        """
+        with self._connection() as conn:
+            for table in ('LocalFacts', 'GlobalFacts'):
+                columns: set[str] = {row['name'] for row in conn.execute(f"PRAGMA table_info({table})").fetchall()}
+                if 'Compiled' not in columns:
+                    conn.execute(f"ALTER TABLE {table} ADD COLUMN Compiled BLOB")
+
+    def _compile(self, text: str) -> bytes | None:
+        return self._compiler(text) if self._compiler is not None else None
+
+    # region Index
+    def _global_facts(self) -> OrderStatisticIndex[_FactKey]:
+        if self._global_index is None:
+            with self._connection() as conn:
+                rows = conn.execute("SELECT CreatedAt, Text FROM GlobalFacts ORDER BY CreatedAt, Text").fetchall()
+            self._global_index = OrderStatisticIndex((row['CreatedAt'], row['Text']) for row in rows)
+        return self._global_index
+
+    def _local_facts(self, guild_id: int) -> OrderStatisticIndex[_FactKey]:
+        if guild_id not in self._local_indexes:
+            with self._connection() as conn:
+                rows = conn.execute(
+                    "SELECT CreatedAt, Text FROM LocalFacts WHERE GuildID = ? ORDER BY CreatedAt, Text",
+                    (guild_id,)
+                ).fetchall()
+            self._local_indexes[guild_id] = OrderStatisticIndex((row['CreatedAt'], row['Text']) for row in rows)
+        return self._local_indexes[guild_id]
+
+    def _fact_counts(self) -> dict[int | None, int]:
+        if self._counts is None:
+            with self._connection() as conn:
+                counts: dict[int | None, int] = {
+                    row['GuildID']: row['Count'] for row in
+                    conn.execute("SELECT GuildID, COUNT(*) AS Count FROM LocalFacts GROUP BY GuildID").fetchall()
+                }
+                counts[None] = conn.execute("SELECT COUNT(*) FROM GlobalFacts").fetchone()[0]
+            self._counts = counts
+        return self._counts
+
+    def _count_change(self, guild_id: int | None, change: int) -> None:
+        """
+        Applies a committed insert (+1) or delete (-1) to the counts, if they were loaded.
+        """
+        if self._counts is not None:
+            self._counts[guild_id] = self._counts.get(guild_id, 0) + change
+
+    @staticmethod
+    def _position(pool: OrderStatisticIndex[_FactKey], index: int) -> int:
+        """
+        Transforms a 1-based, newest first fact index into a position in the pool.
+        """
+        if not 1 <= index <= len(pool):
+            raise IndexError('Index out of range.')
+        return len(pool) - index
+
+    @staticmethod
+    def _replace(pool: OrderStatisticIndex[_FactKey], position: int, key: _FactKey) -> None:
+        """
+        Replaces the key at the position, moving it if the new Text breaks a CreatedAt tie differently.
+        """
+        if (position == 0 or pool[position - 1] <= key) and (position == len(pool) - 1 or key <= pool[position + 1]):
+            pool[position] = key
+        else:
+            pool.pop(position)
+            pool.insort(key)
+    # endregion
+
     # region Regular
     def get_fact(self, guild_id: int | None, index: int | None) -> str:
+        return self._pick(guild_id, index)[1]
+
+    def get_compiled_fact(self, guild_id: int | None, index: int | None) -> tuple[str, bytes | None]:
+        pool_guild_id, text = self._pick(guild_id, index)
+        if pool_guild_id is None:
+            table, condition, params = 'GlobalFacts', 'Text = ?', (text,)
+        else:
+            table, condition, params = 'LocalFacts', 'GuildID = ? AND Text = ?', (pool_guild_id, text)
+
+        with self._connection() as conn:
+            row = conn.execute(f"SELECT Compiled FROM {table} WHERE {condition}", params).fetchone()
+            compiled: bytes | None = row['Compiled'] if row is not None else None
+            if row is not None and self._is_stale(compiled):
+                # Written before a compiler was configured, or compiled to an older format: upgrade it once, here.
+                compiled = self._compile(text)
+                if compiled is not None:
+                    conn.execute(f"UPDATE {table} SET Compiled = ? WHERE {condition}", (compiled,) + params)
+        return text, compiled
+
+    def _is_stale(self, compiled: bytes | None) -> bool:
+        """
+        Should the stored compiled form be compiled again?
+        """
+        if self._compiler is None:
+            return False
+        return compiled is None or (self._is_current is not None and not self._is_current(compiled))
+
+    def _pick(self, guild_id: int | None, index: int | None) -> tuple[int | None, str]:
+        """
+        Selects a fact the way `get_fact` describes.
+        :return: Guild ID of the pool it is in, None for global, and its Text.
+        """
         if index is not None and index < 1:
             raise IndexError('Index must not be smaller than 1.')
-        with self._connection() as conn:
-            cursor = conn.cursor()
 
-            cursor.execute("SELECT COUNT(*) FROM GlobalFacts")
-            global_count = cursor.fetchone()[0]
+        global_pool: OrderStatisticIndex[_FactKey] = self._global_facts()
+        local_pool: OrderStatisticIndex[_FactKey] | None = self._local_facts(guild_id) if guild_id is not None else None
+        total: int = len(global_pool) + (len(local_pool) if local_pool is not None else 0)
 
-            local_count = 0
-            if guild_id is not None:
-                cursor.execute(
-                    "SELECT COUNT(*) FROM LocalFacts WHERE GuildID = ?",
-                    (guild_id,)
+        # transform index into pool offset.
+        if index is None:
+            if total == 0:
+                raise IndexError("No facts available.")
+            offset: int = _r.randrange(total)
+        else:
+            offset: int = index - 1
+            if offset >= total:
+                raise IndexError("Index out of range.")
+
+        # offset implies pool to select from
+        if offset < len(global_pool):
+            return None, global_pool[self._position(global_pool, offset + 1)][1]
+        return guild_id, local_pool[self._position(local_pool, offset - len(global_pool) + 1)][1]
+
+    def get_fact_count(self, guild_id: int | None) -> int:
+        return self._fact_counts().get(guild_id, 0)
+
+    def get_fact_counts(self, guild_id: int | None) -> tuple[int, int]:
+        counts: dict[int | None, int] = self._fact_counts()
+        return counts[None], counts.get(guild_id, 0) if guild_id is not None else 0
+    # endregion
+
+    # region Local
+    def create_fact(self, guild_id: int, user_id: int, fact: str) -> None:
+        pool: OrderStatisticIndex[_FactKey] = self._local_facts(guild_id)  # Loaded before the insert, not after.
+        now: int = int(time())
+        try:
+            with self._connection() as conn:
+                conn.execute(
+                    "INSERT INTO LocalFacts (Text, GuildID, AuthorID, ModifiedAt, CreatedAt, Compiled) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    (fact, guild_id, user_id, now, now, self._compile(fact))
                 )
-                local_count = cursor.fetchone()[0]
-
-            total = global_count + local_count
-
-            # transform index into table ordering offset.
-            if index is None:
-                if total == 0:
-                    raise IndexError("No facts available.")
-                offset = _r.randrange(total)
-            else:
-                offset = index - 1
-                if offset >= total:
-                    raise IndexError("Index out of range.")
-
-            # offset implies table to select from
-            if offset < global_count:
-                cursor.execute(
-                    """
-                    SELECT Text
-                    FROM GlobalFacts
-                    ORDER BY CreatedAt DESC
-                    LIMIT 1 OFFSET ?
-                    """,
-                    (offset,)
+        except _sql.IntegrityError:
+            raise ValueError('This fact already exists.')
+        pool.insort((now, fact))
+        self._count_change(guild_id, 1)
+
+    def edit_fact(self, guild_id: int, index: int, new_fact: str, editor_id: int) -> SimpleFactEditorData:
+        pool: OrderStatisticIndex[_FactKey] = self._local_facts(guild_id)
+        position: int = self._position(pool, index)
+        created_at, text = pool[position]
+        try:
+            with self._connection() as conn:
+                author_id: int = conn.execute(
+                    "SELECT AuthorID FROM LocalFacts WHERE GuildID = ? AND Text = ?", (guild_id, text)
+                ).fetchone()['AuthorID']
+                conn.execute(
+                    "UPDATE LocalFacts SET Text = ?, AuthorID = ?, ModifiedAt = ?, Compiled = ? "
+                    "WHERE GuildID = ? AND Text = ?",
+                    (new_fact, editor_id, int(time()), self._compile(new_fact), guild_id, text)
                 )
-            else:
-                if guild_id is None:
-                    raise IndexError("Index out of range.")
-
-                cursor.execute(
-                    """
-                    SELECT Text
-                    FROM LocalFacts
-                    WHERE GuildID = ?
-                    ORDER BY CreatedAt DESC
-                    LIMIT 1 OFFSET ?
-                    """,
-                    (guild_id, offset - global_count)
+        except _sql.IntegrityError:
+            raise ValueError('This fact already exists.')
+        self._replace(pool, position, (created_at, new_fact))
+        return SimpleFactEditorData(text, guild_id, author_id)
+
+    def delete_fact(self, guild_id: int, index: int) -> SimpleFactEditorData:
+        pool: OrderStatisticIndex[_FactKey] = self._local_facts(guild_id)
+        position: int = self._position(pool, index)
+        _, text = pool[position]
+        with self._connection() as conn:
+            author_id: int = conn.execute(
+                "SELECT AuthorID FROM LocalFacts WHERE GuildID = ? AND Text = ?", (guild_id, text)
+            ).fetchone()['AuthorID']
+            conn.execute("DELETE FROM LocalFacts WHERE GuildID = ? AND Text = ?", (guild_id, text))
+        pool.pop(position)
+        self._count_change(guild_id, -1)
+        return SimpleFactEditorData(text, guild_id, author_id)
+
+    def get_local_facts(self, guild_id: int) -> list[SimpleFactEditorData]:
+        with self._connection() as conn:
+            rows = conn.execute(
+                """
+                SELECT Text, GuildID, AuthorID, CreatedAt, ModifiedAt
+                FROM LocalFacts
+                WHERE GuildID = ?
+                ORDER BY CreatedAt DESC, Text DESC
+                """,
+                (guild_id,)
+            ).fetchall()
+        return [FactEditorData(row['Text'], row['GuildID'], row['AuthorID'], row['CreatedAt'], row['ModifiedAt'])
+                for row in rows]
+    # endregion
+
+    # region Global
+    def create_global_fact(self, user_id: int, fact: str) -> None:
+        pool: OrderStatisticIndex[_FactKey] = self._global_facts()  # Loaded before the insert, not after.
+        now: int = int(time())
+        try:
+            with self._connection() as conn:
+                conn.execute(
+                    "INSERT INTO GlobalFacts (Text, AuthorID, ModifiedAt, CreatedAt, Compiled) VALUES (?, ?, ?, ?, ?)",
+                    (fact, user_id, now, now, self._compile(fact))
                 )
+        except _sql.IntegrityError:
+            raise ValueError('This fact already exists.')
+        pool.insort((now, fact))
+        self._count_change(None, 1)
 
-            row = cursor.fetchone()
-            if row is None:
-                raise IndexError("Index out of range.")
+    def edit_global_fact(self, index: int, editor_id: int, new_fact: str) -> SimpleFactEditorData:
+        pool: OrderStatisticIndex[_FactKey] = self._global_facts()
+        position: int = self._position(pool, index)
+        created_at, text = pool[position]
+        try:
+            with self._connection() as conn:
+                author_id: int = conn.execute(
+                    "SELECT AuthorID FROM GlobalFacts WHERE Text = ?", (text,)
+                ).fetchone()['AuthorID']
+                conn.execute(
+                    "UPDATE GlobalFacts SET Text = ?, AuthorID = ?, ModifiedAt = ?, Compiled = ? WHERE Text = ?",
+                    (new_fact, editor_id, int(time()), self._compile(new_fact), text)
+                )
+        except _sql.IntegrityError:
+            raise ValueError('This fact already exists.')
+        self._replace(pool, position, (created_at, new_fact))
+        return SimpleFactEditorData(text, None, author_id)
 
-            return row['Text']
+    def delete_global_fact(self, index: int) -> SimpleFactEditorData:
+        pool: OrderStatisticIndex[_FactKey] = self._global_facts()
+        position: int = self._position(pool, index)
+        _, text = pool[position]
+        with self._connection() as conn:
+            author_id: int = conn.execute(
+                "SELECT AuthorID FROM GlobalFacts WHERE Text = ?", (text,)
+            ).fetchone()['AuthorID']
+            conn.execute("DELETE FROM GlobalFacts WHERE Text = ?", (text,))
+        pool.pop(position)
+        self._count_change(None, -1)
+        return SimpleFactEditorData(text, None, author_id)
 
-    def get_fact_count(self, guild_id: int | None) -> int:
+    def get_global_facts(self) -> list[SimpleFactEditorData]:
         with self._connection() as conn:
-            cursor = conn.cursor()
+            rows = conn.execute(
+                """
+                SELECT Text, AuthorID, CreatedAt, ModifiedAt
+                FROM GlobalFacts
+                ORDER BY CreatedAt DESC, Text DESC
+                """
+            ).fetchall()
+        return [FactEditorData(row['Text'], None, row['AuthorID'], row['CreatedAt'], row['ModifiedAt'])
+                for row in rows]
 
-            if guild_id is None:
-                cursor.execute("SELECT COUNT(*) FROM GlobalFacts")
-            else:
-                cursor.execute(
-                    "SELECT COUNT(*) FROM LocalFacts WHERE GuildID = ?",
-                    (guild_id,)
-                )
-            return int(cursor.fetchone()[0])
+    def get_all_local_facts(self) -> dict[int, list[SimpleFactEditorData]]:
+        with self._connection() as conn:
+            rows = conn.execute(
+                """
+                SELECT Text, GuildID, AuthorID, CreatedAt, ModifiedAt
+                FROM LocalFacts
+                ORDER BY GuildID, CreatedAt DESC, Text DESC
+                """
+            ).fetchall()
+        out: dict[int, list[SimpleFactEditorData]] = {}
+        for row in rows:
+            out.setdefault(row['GuildID'], []).append(
+                FactEditorData(row['Text'], row['GuildID'], row['AuthorID'], row['CreatedAt'], row['ModifiedAt']))
+        return out
     # endregion
@@ -1,5 +1,15 @@
+import asyncio
+from time import monotonic
+
 from data.implementation.utilities.abstract import AbstractSQLDatabase
-from data.interfaces.pref import PreferencesInterface
+from data.implementation.utilities.caching import FlatCacheHandler
+from data.implementation.utilities.eviction import CacheBudget
+from data.interfaces.pref import PreferencesInterface, UserPreferenceData, GuildChannelPreferenceData, \
+    supported_autoreply_features, FEATURE_BITS, USER_FEATURE_SHIFT, PAUSED_BIT, pack_features
+from data.interfaces.utilities.executor import DataExecutor
+from data.interfaces.utilities.maintenance import CacheMaintenanceSource
+from data.interfaces.utilities.stats import CacheStatsSource
+from data.interfaces.utilities.warm import WarmStartSource
 
 """
 Table(s) and design:
@@ -11,3 +21,156 @@ Table(s) and design:
 class PreferencesDatabase(AbstractSQLDatabase, PreferencesInterface):
     def __init__(self, path: str):
         super().__init__(path, 'data/schemas/pref.sql')
+
+
+class CachedPreferences(PreferencesInterface, CacheStatsSource, CacheMaintenanceSource, WarmStartSource):
+    """
+    Caching layer over another `PreferencesInterface`, for the autoreply hot path.
+    Channel and user flags are cached as packed bitmasks and invalidated by the toggles made through this layer.
+    Pauses made through this layer are tracked in memory until they expire.
+    """
+
+    def __init__(self, inner: PreferencesInterface, default_cache_timeout: float = 600,
+                 pause_recheck_timeout: float = 60, max_cached: int | None = 100_000,
+                 snapshot_path: str | None = None) -> None:
+        """
+        :param inner: Interface that owns the data.
+        :param default_cache_timeout: Seconds before a cached bitmask is fetched again, in case it was changed elsewhere.
+        :param pause_recheck_timeout: Seconds before a pause found in `inner` is checked again, as its expiry is unknown.
+        :param max_cached: Maximum number of cached bitmasks, least recently used are evicted first. None for no limit.
+        :param snapshot_path: File the bitmasks are snapshotted to and warm-started from. None to always start cold.
+        """
+        self.inner: PreferencesInterface = inner
+        self._default_cache_timeout: float = default_cache_timeout
+        self._pause_recheck_timeout: float = pause_recheck_timeout
+        self._snapshot_path: str | None = snapshot_path
+
+        # ('channel', guild, channel) -> channel bitmask, including PAUSED_BIT if paused in `inner` on load, unless the
+        # pause is tracked in `_pauses`.
+        # ('user', user) -> user bitmask, not yet shifted.
+        self._cache: FlatCacheHandler = FlatCacheHandler()  # Looked up on every message, so flat.
+        if max_cached is not None:
+            self._cache.set_budget(CacheBudget(max_entries=max_cached))
+        # (guild, channel or None for the entire guild) -> monotonic time the pause ends.
+        self._pauses: dict[tuple[int, int | None], float] = {}
+
+    def get_cache_task(self, executor: DataExecutor) -> asyncio.Task:
+        """
+        :param executor: Executor every other call to this layer runs on. Expiry runs there as well, the cache is not
+        thread-safe.
+        """
+        return asyncio.create_task(
+            name=f'Cache maintenance of {type(self).__name__}',
+            coro=self._cache.maintenance_loop(
+                timeout=self._default_cache_timeout,
+                clean_empty_nodes=True,
+                executor=executor,
+            )
+        )
+
+    def get_cache_stats(self) -> dict[str, dict[str, int | float | None]]:
+        return self._cache.get_stats()
+
+    def save_cache_snapshot(self) -> None:
+        # Pauses are left out: those made through this layer are in `inner` as well.
+        if self._snapshot_path is not None:
+            self._cache.save_snapshot(self._snapshot_path)
+
+    def load_cache_snapshot(self) -> int:
+        return self._cache.load_snapshot(self._snapshot_path) if self._snapshot_path is not None else 0
+
+    # region Cache
+    def _store(self, keys: tuple[str, ...], mask: int, timeout: float) -> None:
+        self._cache.unregister(keys)  # May still hold an expired entry the maintenance loop did not get to.
+        self._cache.register(keys, mask, timeout)
+
+    def _channel_mask(self, guild_id: int, channel_id: int | None) -> int:
+        keys: tuple[str, ...] = ('channel', str(guild_id), str(channel_id))
+        mask: int | None = self._cache.get_cached(keys, int)
+        if mask is None:
+            mask = pack_features(self.inner.guild_channel_autoreplies_enabled(guild_id, channel_id))
+            timeout: float = self._default_cache_timeout
+            until: float | None = self._pause_expiry(guild_id, channel_id)
+            if until is not None:
+                # The pause is tracked in memory, so its bit stays out of the mask. Reload once it ends, in case
+                # `inner` holds a longer one made elsewhere.
+                timeout = min(timeout, until - monotonic())
+            elif channel_id is not None and self.inner.is_paused_channel(guild_id, channel_id):
+                mask |= PAUSED_BIT
+                timeout = self._pause_recheck_timeout
+            self._store(keys, mask, timeout)
+        return mask
+
+    def _user_mask(self, user_id: int) -> int:
+        keys: tuple[str, ...] = ('user', str(user_id))
+        mask: int | None = self._cache.get_cached(keys, int)
+        if mask is None:
+            mask = pack_features(self.inner.user_autoreplies_enabled(user_id))
+            self._store(keys, mask, self._default_cache_timeout)
+        return mask
+
+    def _pause_expiry(self, guild_id: int, channel_id: int | None) -> float | None:
+        """
+        Monotonic time the last running pause of the channel or its guild made through this layer ends, if any.
+        """
+        now: float = monotonic()
+        latest: float | None = None
+        for key in ((guild_id, channel_id), (guild_id, None)):
+            until: float | None = self._pauses.get(key)
+            if until is None:
+                continue
+            if until <= now:
+                del self._pauses[key]
+            elif latest is None or until > latest:
+                latest = until
+        return latest
+
+    def _paused_in_memory(self, guild_id: int, channel_id: int) -> bool:
+        return self._pause_expiry(guild_id, channel_id) is not None
+    # endregion
+
+    # region Server - Channel Pause
+    def pause_all_in_channel(self, guild_id: int, channel_id: int | None, duration: int) -> None:
+        self.inner.pause_all_in_channel(guild_id, channel_id, duration)
+        self._pauses[(guild_id, channel_id)] = monotonic() + duration
+        # Drop the masks loaded before, they are reloaded without PAUSED_BIT while the pause is tracked in memory.
+        self._cache.unregister(('channel', str(guild_id)) if channel_id is None
+                               else ('channel', str(guild_id), str(channel_id)))
+
+    def is_paused_channel(self, guild_id: int, channel_id: int) -> bool:
+        return self._paused_in_memory(guild_id, channel_id) or bool(self._channel_mask(guild_id, channel_id) & PAUSED_BIT)
+    # endregion
+
+    # region Server - Autoreply Features
+    def toggle_autoreply_feature(self, guild_id: int, channel_id: int | None,
+                                 features: set[supported_autoreply_features]) -> None:
+        self.inner.toggle_autoreply_feature(guild_id, channel_id, features)
+        # Guild-wide toggles can affect every channel of the guild.
+        self._cache.unregister(('channel', str(guild_id)) if channel_id is None
+                               else ('channel', str(guild_id), str(channel_id)))
+
+    def is_autoreply_enabled(self, guild_id: int, channel_id: int | None,
+                             feature: supported_autoreply_features) -> bool:
+        return bool(self._channel_mask(guild_id, channel_id) & FEATURE_BITS[feature])
+
+    def guild_channel_autoreplies_enabled(self, guild_id: int, channel_id: int | None) -> GuildChannelPreferenceData:
+        return self.inner.guild_channel_autoreplies_enabled(guild_id, channel_id)
+    # endregion
+
+    # region User - Autoreply Features
+    def toggle_user_autoreply_feature(self, user_id: int, features: set[supported_autoreply_features]) -> None:
+        self.inner.toggle_user_autoreply_feature(user_id, features)
+        self._cache.unregister(('user', str(user_id)))
+
+    def is_user_autoreply_enabled(self, user_id: int, feature: supported_autoreply_features) -> bool:
+        return bool(self._user_mask(user_id) & FEATURE_BITS[feature])
+
+    def user_autoreplies_enabled(self, user_id: int) -> UserPreferenceData:
+        return self.inner.user_autoreplies_enabled(user_id)
+    # endregion
+
+    def autoreply_feature_mask(self, guild_id: int, channel_id: int, user_id: int) -> int:
+        mask: int = self._channel_mask(guild_id, channel_id) | self._user_mask(user_id) << USER_FEATURE_SHIFT
+        if self._paused_in_memory(guild_id, channel_id):
+            mask |= PAUSED_BIT
+        return mask
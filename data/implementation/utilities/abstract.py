@@ -6,36 +6,71 @@ from abc import ABC
 import asyncio
 
 from data.implementation.utilities.caching import RecursiveCacheHandler
+from data.implementation.utilities.connections import ConnectionPool, PragmaProfile, WAL_PROFILE
+from data.interfaces.utilities.executor import DataExecutor
+from data.interfaces.utilities.maintenance import CacheMaintenanceSource
+from data.interfaces.utilities.stats import CacheStatsSource
+from data.interfaces.utilities.warm import WarmStartSource
 
 
 class AbstractSQLDatabase(ABC):
+    pragma_profile: PragmaProfile = WAL_PROFILE  # Override per database if it needs different tuning.
+
     def __init__(self, db_path: str, schema_path: str) -> None:
         self.path = db_path
 
         if not os.path.isfile(schema_path):
             raise FileNotFoundError(f"Schema at {schema_path} does not exist")
 
-        with _sql.connect(db_path) as conn:
+        self._pool: ConnectionPool = ConnectionPool(db_path, self.pragma_profile)
+        with self._connection() as conn:
             with open(schema_path, "r") as f:
                 conn.executescript(f.read())
 
     def _connection(self) -> _sql.Connection:
-        conn = _sql.connect(self.path)
-        conn.row_factory = _sql.Row
-        return conn
+        """
+        Pooled connection of the calling thread. `with` it for a transaction, but do not close it.
+        """
+        return self._pool.connection()
+
+    def close(self) -> None:
+        """
+        Closes all pooled connections.
+        """
+        self._pool.close()
 
-class CachedAbstractSQLDatabase(AbstractSQLDatabase, ABC):
-    def __init__(self, db_path: str, schema_path: str, default_cache_timeout) -> None:
+class CachedAbstractSQLDatabase(AbstractSQLDatabase, CacheStatsSource, CacheMaintenanceSource, WarmStartSource, ABC):
+    def __init__(self, db_path: str, schema_path: str, default_cache_timeout,
+                 snapshot_path: str | None = None) -> None:
+        """
+        :param snapshot_path: File the cache is snapshotted to and warm-started from. None to always start cold.
+        """
         super().__init__(db_path, schema_path)
 
         self._default_cache_timeout = default_cache_timeout
+        self._snapshot_path: str | None = snapshot_path
         self._cache: RecursiveCacheHandler = RecursiveCacheHandler() # Root node.
 
-    def get_cache_task(self) -> asyncio.Task:
+    def get_cache_task(self, executor: DataExecutor) -> asyncio.Task:
+        """
+        :param executor: Executor every other call to this database runs on. Expiry runs there as well, the cache is
+        not thread-safe.
+        """
         return asyncio.create_task(
             name=f'Cache maintenance of {type(self).__name__}',
             coro=self._cache.maintenance_loop(
                 timeout=self._default_cache_timeout,
                 clean_empty_nodes=True,
+                executor=executor,
             )
-        )
\ No newline at end of file
+        )
+
+    def get_cache_stats(self) -> dict[str, dict[str, int | float | None]]:
+        return self._cache.get_stats()
+
+    def save_cache_snapshot(self) -> None:
+        if self._snapshot_path is not None:
+            self._cache.save_snapshot(self._snapshot_path)
+
+    def load_cache_snapshot(self) -> int:
+        return self._cache.load_snapshot(self._snapshot_path) if self._snapshot_path is not None else 0
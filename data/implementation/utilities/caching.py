@@ -1,30 +1,46 @@
 from __future__ import annotations
 
 import asyncio
-import heapq
-from time import monotonic
-from typing import TypeVar
+import os as _os
+import pickle as _pickle
+import tempfile as _tempfile
+import time as _time
+import zlib as _zlib
+from time import monotonic, perf_counter
+from typing import Awaitable, Callable, Iterator, TypeVar, TYPE_CHECKING
+
+from data.implementation.utilities.eviction import CacheBudget, approximate_size
+from data.implementation.utilities.expiry import TimerWheel
+from data.implementation.utilities.statistics import CacheStats
+
+if TYPE_CHECKING:
+    from data.interfaces.utilities.executor import DataExecutor
 
 _T = TypeVar('_T')
 
+SNAPSHOT_VERSION: int = 1  # Bump when the snapshot layout changes; older snapshots are then ignored.
+
 
 # Tree-structure, nodes are RecursiveCacheHandlers, leaves are values.
 # Index through levels in dict by keys.
 class RecursiveCacheEntry:
-    def __init__(self, val, timeout: float):
+    def __init__(self, val, timeout: float, size: int = 0):
         self.val = val
         self.timeout = timeout
+        self.size = size  # Approximate bytes, counted against the budgets above it.
 
 
-# TODO: WARNING FOR USING THIS IN IMPLEMENTATION; ARE THERE RACING CONDITIONS FOR AROUND AWAIT CALLS?
+# Check-then-register around an await races with other tasks missing on the same path; use `get_or_load` for that.
 class RecursiveCacheHandler:
     """
     Automated data caching handler using a Tree-node structure. Try not to go too deep.
     """
 
-    def __init__(self, root: RecursiveCacheHandler | None = None, path: tuple[str, ...] | None = None):
+    def __init__(self, root: RecursiveCacheHandler | None = None, path: tuple[str, ...] | None = None,
+                 stats_depth: int = 1):
         """
         Leave empty for manual initialization as a Root node. Use class methods otherwise.
+        :param stats_depth: Roots only. Keeps counters for every subtree up to this many levels deep, 0 for the tree only.
         """
         self.children: dict[str, RecursiveCacheHandler | RecursiveCacheEntry] = {}
         self._maintenance_loop: bool | None = False  # If None is in shutdown mode.
@@ -32,11 +48,25 @@ class RecursiveCacheHandler:
 
         if not root:
             self.root = self  # is_root <==> self.root == self
-            self._timeouts: list[tuple[float, tuple[str, ...]]] = []
+            self._expiry: TimerWheel[tuple[str, ...]] = TimerWheel()  # One deadline per live entry, by absolute path.
+            # Absolute path -> (token, task) of the load in flight for it. The token tells loads apart per path.
+            self._loading: dict[tuple[str, ...], tuple[object, asyncio.Task]] = {}
+            # Absolute path of a node -> limits on the entries below it. Budgets may nest.
+            self._budgets: dict[tuple[str, ...], CacheBudget] = {}
+            self._entries: int = 0
+            self._bytes: int = 0
+            self.stats_depth: int = stats_depth
+            self._stats: dict[tuple[str, ...], CacheStats] = {}  # Absolute path of a node -> its counters.
+            self._tree_stats: CacheStats = CacheStats()  # Counters of the whole tree, at hand for reads.
+            self._stats[()] = self._tree_stats
         else:
             self.root = root
-            self._timeouts = self.root._timeouts  # Not to be used, just here just in case.
-        self._timeouts: list[tuple[float, tuple[str, ...]]]
+            self._expiry = self.root._expiry  # Not to be used, just here just in case.
+            self._loading = self.root._loading
+            self._budgets = self.root._budgets
+        self._expiry: TimerWheel[tuple[str, ...]]
+        self._loading: dict[tuple[str, ...], tuple[object, asyncio.Task]]
+        self._budgets: dict[tuple[str, ...], CacheBudget]
 
         self.path: tuple[str, ...] = () if not path else path
         self.path_as_string: str = '/'.join(('ROOT',) + self.path)
@@ -63,12 +93,18 @@ class RecursiveCacheHandler:
             # rest may be treated as tuple.
             self.children[curr].register(rest, val, timeout)
         else:
-            if curr not in self.children.keys():
+            if curr in self.children.keys():
                 raise Exception(f'{self.path_as_string}/{curr} is already registered, use Refresh instead.')
 
+            path: tuple[str, ...] = self.path + (curr,)
+            size: int = approximate_size(val) if self._budgets else 0
+            self.root._make_room(path, size)
+
             timeout = monotonic() + timeout
-            self.children[curr] = RecursiveCacheEntry(val, timeout)
-            heapq.heappush(self.root._timeouts, (timeout, self.path + (curr,)))
+            entry: RecursiveCacheEntry = RecursiveCacheEntry(val, timeout, size)
+            self.children[curr] = entry
+            self.root._account(path, entry)
+            self.root._expiry.schedule(path, timeout)
 
     def refresh(self, keys: tuple[str], timeout: float) -> None:
         """
@@ -101,7 +137,7 @@ class RecursiveCacheHandler:
             # noinspection unresolved-references
             # Child MUST be leaf, given the check above.
             self.children[curr].timeout = timeout
-            heapq.heappush(self.root._timeouts, (timeout, self.path + (curr,)))
+            self.root._expiry.schedule(self.path + (curr,), timeout)
 
     def unregister(self, keys: tuple[str]) -> None:
         """
@@ -110,9 +146,53 @@ class RecursiveCacheHandler:
 
         Raises an Exception if the path somehow collides with a Leaf early.
         Silently quits if any node along the way was not registered.
+        Loads in flight under the path still answer their callers, but no longer store their result.
         """
         self._prune_entry(keys, clean_empty_nodes=True)
 
+        prefix: tuple[str, ...] = self.path + tuple(keys)
+        for path in [p for p in self._loading if p[:len(prefix)] == prefix]:
+            del self._loading[path]
+
+    async def get_or_load(self, keys: tuple[str, ...], loader: Callable[[], Awaitable[_T]], ttl: float) -> _T:
+        """
+        Get the cached value, or load and register it if missing or timed out.
+        Concurrent misses on the same path share a single loader call; its exception, if any, is raised to all of them.
+        Cancelling one caller does not cancel the load for the others.
+        :param keys: Target path to cached value.
+        :param loader: Produces the value on a miss.
+        :param ttl: Seconds the loaded value stays cached.
+        """
+        entry: RecursiveCacheEntry | None = self._find(keys)
+        path: tuple[str, ...] = self.path + tuple(keys)
+        if entry is not None and entry.timeout >= monotonic():
+            self.root._touch(path)
+            self.root._record_read(path, True)
+            return entry.val
+        self.root._record_read(path, False)
+
+        if path not in self._loading:
+            token: object = object()
+            task: asyncio.Task = asyncio.ensure_future(self._load(keys, path, token, loader, ttl))
+            self._loading[path] = (token, task)
+            task.add_done_callback(lambda _: self._loading.pop(path) if self._loading.get(path, (None,))[0] is token
+                                   else None)
+        return await asyncio.shield(self._loading[path][1])
+
+    async def _load(self, keys: tuple[str, ...], path: tuple[str, ...], token: object,
+                    loader: Callable[[], Awaitable[_T]], ttl: float) -> _T:
+        start: float = perf_counter()
+        try:
+            val: _T = await loader()
+        except BaseException:
+            self.root._record_load(path, perf_counter() - start, failed=True)
+            raise
+        self.root._record_load(path, perf_counter() - start, failed=False)
+        if self._loading.get(path, (None,))[0] is token:  # Not invalidated while loading.
+            self._prune_entry(keys, clean_empty_nodes=False)  # Drop the timed out entry, if any.
+            self.register(keys, val, ttl)
+        return val
+
     def _prune_entry(self, keys: tuple[str, ...], clean_empty_nodes: bool) -> None:
         """
         Removes entry at path (or removes entire subtree at path) rooted at call node.
@@ -140,7 +220,12 @@ class RecursiveCacheHandler:
             if clean_empty_nodes and not self.children[curr].children:
                 del self.children[curr]
         else:
-            del self.children[curr]
+            removed: RecursiveCacheHandler | RecursiveCacheEntry | None = self.children.pop(curr, None)
+            if isinstance(removed, RecursiveCacheEntry):
+                self.root._forget(self.path + (curr,), removed)
+            elif removed is not None:
+                for path, entry in list(removed._leaves()):
+                    self.root._forget(path, entry)
 
     def is_cached(self, keys: tuple[str, ...]) -> bool:
         if not keys:
@@ -159,17 +244,21 @@ class RecursiveCacheHandler:
 
     def get_cached(self, keys: tuple[str, ...], out_type: type[_T]) -> _T | None:
         """
-        Get cached value, if it exists.
+        Get cached value, if it exists and has not timed out.
         :param keys: Target path to cached value.
         :param out_type: Expected type of output.
         :return: Target object or None if not found.
         """
         val: RecursiveCacheEntry | None = self._find(keys)
-        if val is None:
+        if val is None or val.timeout < monotonic():
+            self.root._record_read(self.path + tuple(keys), False)
             return None
         if not isinstance(val.val, out_type):
             raise TypeError(
                 f'Return value at path {self.path_as_string}/{'/'.join(keys)} is of type {type(val.val)} (wanted {out_type})')
+        path: tuple[str, ...] = self.path + tuple(keys)
+        self.root._touch(path)
+        self.root._record_read(path, True)
         return val.val
 
     def _find(self, keys: tuple[str, ...]) -> RecursiveCacheEntry | None:
@@ -202,11 +291,29 @@ class RecursiveCacheHandler:
             # noinspection bad-return
             return self.children[curr]
 
-    async def maintenance_loop(self, timeout: float, clean_empty_nodes: bool = True) -> None:
+    def expire_entries(self, clean_empty_nodes: bool = True) -> int:
+        """
+        Removes every entry whose deadline has passed. Roots only.
+        Not thread-safe; call it on the thread the cache is used from.
+        :param clean_empty_nodes: whether to clean empty nodes.
+        :return: Number of entries removed.
+        """
+        expired: int = 0
+        # Removing an entry cancels its deadline, so every expired path still holds the entry it was set for.
+        for path in self._expiry.expire():
+            self._prune_entry(path, clean_empty_nodes=clean_empty_nodes)
+            self._record(path, 'expirations')
+            expired += 1
+        return expired
+
+    async def maintenance_loop(self, timeout: float, clean_empty_nodes: bool = True,
+                               executor: DataExecutor | None = None) -> None:
         """
         Automatically and periodically remove expired entries.
-        :param timeout: timeout to check again if the cache is empty
+        :param timeout: timeout to check again if the cache is empty, otherwise it checks every expiry tick.
         :param clean_empty_nodes: whether to clean empty nodes.
+        :param executor: Executor the cache is used from, every tick runs on it. None if the cache is only used from
+        the event loop.
 
         Can only be used on tree roots (self.root == self) and might raise an Exception if the starting fails.
         """
@@ -219,29 +326,12 @@ class RecursiveCacheHandler:
 
         self._maintenance_loop = True
         while self._maintenance_loop:
-            while not self._timeouts:
-                await asyncio.sleep(timeout)
-
-            now = monotonic()  # Maybe move inside loop below if things take too long.
-
-            while self._timeouts:
-                # check first entry (min-heap moment)
-                var_timeout, path = self._timeouts[0]
-                if var_timeout > now:
-                    await asyncio.sleep(min(var_timeout - now + 1, timeout))  # wait 1 more second
-                    break  # Try again after countdown
-
-                heapq.heappop(self._timeouts)  # pops it out, we have data in (timeout, path) anyways
-
-                entry: RecursiveCacheEntry | None = self._find(path)
-
-                if entry is None:
-                    continue
-
-                if entry.timeout > var_timeout:  # current entry timeout is invalid
-                    continue
+            if executor is None:
+                self.expire_entries(clean_empty_nodes)
+            else:
+                await executor.run(self.expire_entries, clean_empty_nodes)
 
-                self._prune_entry(path, clean_empty_nodes=clean_empty_nodes)
+            await asyncio.sleep(self._expiry.resolution if self._expiry else timeout)
 
         self._maintenance_loop = False
 
@@ -274,4 +364,364 @@ class RecursiveCacheHandler:
                     marked.append(k)
 
         for k in marked:
-            del self.children[k]
+            self._prune_entry((k,), clean_empty_nodes=False)
+
+    # region Size
+    def set_budget(self, budget: CacheBudget | None, keys: tuple[str, ...] = ()) -> None:
+        """
+        Limits the entries below the given node, evicting right away if they are already over. Replaces any budget
+        that node had; None removes it. The node need not exist yet, and the budget outlives it being cleaned up.
+        Entries count against every budget above them, so budgets may nest.
+        Entry sizes are only measured while some budget exists; entries registered before that count as 0 bytes.
+        :param budget: Limits and eviction policy for the subtree.
+        :param keys: Path from this node to the subtree root, this node itself if empty.
+        """
+        path: tuple[str, ...] = self.path + tuple(keys)
+        self._budgets.pop(path, None)
+        if budget is None:
+            return
+        for entry_path, entry in self._leaves(keys):
+            budget.add(entry_path, entry.size)
+        self._budgets[path] = budget
+        while budget.max_entries is not None and budget.entries > budget.max_entries \
+                or budget.max_bytes is not None and budget.bytes > budget.max_bytes:
+            if not self.root._evict(budget):
+                break
+
+    def get_budget(self, keys: tuple[str, ...] = ()) -> CacheBudget | None:
+        return self._budgets.get(self.path + tuple(keys))
+
+    def _node(self, keys: tuple[str, ...]) -> RecursiveCacheHandler | None:
+        node: RecursiveCacheHandler | RecursiveCacheEntry = self
+        for key in keys:
+            if not isinstance(node, RecursiveCacheHandler) or key not in node.children:
+                return None
+            node = node.children[key]
+        return node if isinstance(node, RecursiveCacheHandler) else None
+
+    def size(self, keys: tuple[str, ...] = ()) -> tuple[int, int]:
+        """
+        Current size of a subtree. O(1) on the root and budgeted nodes, a walk of the subtree otherwise.
+        :param keys: Path from this node to the subtree root, this node itself if empty.
+        :return: Number of entries and their approximate size in bytes.
+        """
+        path: tuple[str, ...] = self.path + tuple(keys)
+        if not path:
+            return self.root._entries, self.root._bytes
+        budget: CacheBudget | None = self._budgets.get(path)
+        if budget is not None:
+            return budget.entries, budget.bytes
+        entries: int = 0
+        size: int = 0
+        for _, entry in self._leaves(keys):
+            entries += 1
+            size += entry.size
+        return entries, size
+
+    def _leaves(self, keys: tuple[str, ...] = ()) -> Iterator[tuple[tuple[str, ...], RecursiveCacheEntry]]:
+        """
+        Absolute paths and entries of every leaf below the given node, none if it does not exist.
+        """
+        node: RecursiveCacheHandler | None = self._node(keys) if keys else self
+        if node is None:
+            return
+        for k, v in node.children.items():
+            if isinstance(v, RecursiveCacheEntry):
+                yield node.path + (k,), v
+            else:
+                yield from v._leaves()
+
+    def _budgets_over(self, path: tuple[str, ...]) -> Iterator[CacheBudget]:
+        """
+        Budgets the entry at the given absolute path counts against, outermost first.
+        """
+        if not self._budgets:
+            return
+        for i in range(len(path)):
+            budget: CacheBudget | None = self._budgets.get(path[:i])
+            if budget is not None:
+                yield budget
+
+    # The methods below are called on the root with absolute paths.
+    def _account(self, path: tuple[str, ...], entry: RecursiveCacheEntry) -> None:
+        self._entries += 1
+        self._bytes += entry.size
+        for budget in self._budgets_over(path):
+            budget.add(path, entry.size)
+
+    def _forget(self, path: tuple[str, ...], entry: RecursiveCacheEntry) -> None:
+        self._expiry.cancel(path)
+        self._entries -= 1
+        self._bytes -= entry.size
+        for budget in self._budgets_over(path):
+            budget.remove(path, entry.size)
+
+    def _touch(self, path: tuple[str, ...]) -> None:
+        if self._budgets:
+            for budget in self._budgets_over(path):
+                budget.policy.on_access(path)
+
+    def _make_room(self, path: tuple[str, ...], size: int) -> None:
+        """
+        Evicts from every budget over the given path until an entry of the given size fits.
+        An entry larger than a byte budget on its own is still stored, after emptying that budget.
+        """
+        for budget in self._budgets_over(path):
+            while budget.needs_room(size):
+                if not self._evict(budget):
+                    break
+
+    def _evict(self, budget: CacheBudget) -> bool:
+        """
+        Removes the victim chosen by the budget's policy. Leaves empty nodes alone, as a register may be walking them.
+        :return: Whether an entry was evicted.
+        """
+        victim: tuple[str, ...] | None = budget.policy.victim()
+        if victim is None:
+            return False
+        entries: int = budget.entries
+        self._prune_entry(victim, clean_empty_nodes=False)
+        if budget.entries == entries:  # Policy out of sync with the tree; drop the stale path so we cannot spin.
+            budget.policy.on_remove(victim)
+        else:
+            budget.evictions += 1
+            self._record(victim, 'evictions')
+        return True
+    # endregion
+
+    # region Statistics
+    def _stats_over(self, path: tuple[str, ...]) -> Iterator[CacheStats]:
+        """
+        Counters of the tracked subtrees the entry at the given absolute path is in, creating them as needed.
+        """
+        for depth in range(min(self.stats_depth, len(path) - 1) + 1):
+            stats: CacheStats | None = self._stats.get(path[:depth])
+            if stats is None:
+                stats = self._stats[path[:depth]] = CacheStats()
+            yield stats
+
+    # Called on the root with absolute paths.
+    def _record(self, path: tuple[str, ...], counter: str) -> None:
+        for stats in self._stats_over(path):
+            setattr(stats, counter, getattr(stats, counter) + 1)
+
+    def _record_read(self, path: tuple[str, ...], hit: bool) -> None:
+        # Runs on every read, so the tree counters are kept at hand and only tracked subtrees are looked up.
+        stats: CacheStats | None = self._tree_stats
+        if hit:
+            stats.hits += 1
+        else:
+            stats.misses += 1
+        for depth in range(1, min(self.stats_depth, len(path) - 1) + 1):
+            stats = self._stats.get(path[:depth])
+            if stats is None:
+                stats = self._stats[path[:depth]] = CacheStats()
+            if hit:
+                stats.hits += 1
+            else:
+                stats.misses += 1
+
+    def _record_load(self, path: tuple[str, ...], seconds: float, failed: bool) -> None:
+        for stats in self._stats_over(path):
+            stats.record_load(seconds, failed)
+
+    def get_stats(self) -> dict[str, dict[str, int | float | None]]:
+        """
+        Machine-readable dump of the counters of every tracked subtree, along with its current size.
+        The tree itself is always listed, subtrees once they see traffic. Roots only.
+        :return: Counters (see `CacheStats.as_json`), 'entries' and approximate 'bytes', keyed by path ('ROOT/...').
+        """
+        if self.root is not self:
+            raise Exception('This node is not the root of its own tree.')
+        out: dict[str, dict[str, int | float | None]] = {}
+        for path in sorted(self._stats):
+            entries, size = self.size(path)
+            out['/'.join(('ROOT',) + path)] = self._stats[path].as_json() | {'entries': entries, 'bytes': size}
+        return out
+    # endregion
+
+    # region Snapshots
+    def save_snapshot(self, file_path: str) -> int:
+        """
+        Writes every live entry below this node to the given file, along with the time it has left.
+        The file is compressed and replaced atomically. Values that cannot be pickled are left out.
+        :param file_path: Snapshot file, created or replaced.
+        :return: Number of entries written.
+        """
+        now: float = monotonic()
+        start: int = len(self.path)
+        entries: list[tuple[tuple[str, ...], float, object]] = [
+            (path[start:], entry.timeout - now, entry.val) for path, entry in self._leaves() if entry.timeout > now]
+        try:
+            data: bytes = _pickle.dumps((SNAPSHOT_VERSION, _time.time(), entries), protocol=_pickle.HIGHEST_PROTOCOL)
+        except (_pickle.PicklingError, TypeError, AttributeError):
+            entries = [e for e in entries if _picklable(e[2])]
+            data = _pickle.dumps((SNAPSHOT_VERSION, _time.time(), entries), protocol=_pickle.HIGHEST_PROTOCOL)
+
+        directory: str = _os.path.dirname(_os.path.abspath(file_path))
+        fd, temp_path = _tempfile.mkstemp(dir=directory, prefix='.cache-', suffix='.tmp')
+        try:
+            with _os.fdopen(fd, 'wb') as f:
+                f.write(_zlib.compress(data))
+            _os.replace(temp_path, file_path)
+        except BaseException:
+            _os.unlink(temp_path)
+            raise
+        return len(entries)
+
+    def load_snapshot(self, file_path: str) -> int:
+        """
+        Registers the entries of a snapshot below this node, with their time left reduced by the time since it was
+        saved. Entries that have run out, or whose path is cached already, are skipped.
+        A missing, corrupt or outdated snapshot loads nothing. Only load snapshots written by this bot, as
+        unpickling can run arbitrary code.
+        :param file_path: Snapshot file written by `save_snapshot`.
+        :return: Number of entries loaded.
+        """
+        try:
+            with open(file_path, 'rb') as f:
+                version, saved_at, entries = _pickle.loads(_zlib.decompress(f.read()))
+        except FileNotFoundError:
+            return 0
+        except (OSError, _zlib.error, _pickle.UnpicklingError, EOFError, ValueError, TypeError, AttributeError,
+                ImportError):
+            return 0
+        if version != SNAPSHOT_VERSION:
+            return 0
+
+        elapsed: float = max(0.0, _time.time() - saved_at)  # Monotonic clocks do not survive a restart.
+        loaded: int = 0
+        for keys, remaining, val in entries:
+            ttl: float = remaining - elapsed
+            if ttl <= 0 or self.is_cached(keys):
+                continue
+            try:
+                self.register(keys, val, ttl)
+            except Exception:  # noqa Collides with what was cached since; the cached data wins.
+                continue
+            loaded += 1
+        return loaded
+    # endregion
+
+
+def _picklable(val) -> bool:
+    try:
+        _pickle.dumps(val, protocol=_pickle.HIGHEST_PROTOCOL)
+    except (_pickle.PicklingError, TypeError, AttributeError):
+        return False
+    return True
+
+
+class FlatCacheHandler(RecursiveCacheHandler):
+    """
+    Root-only variant of `RecursiveCacheHandler` that keeps every entry in a single dict keyed by its full path, so a
+    lookup is one hash of the key tuple instead of a walk down the tree. A prefix index keeps subtree operations
+    (unregister, budgets, size) working. Same interface and errors, but there are no child nodes to call into.
+    """
+
+    def __init__(self, stats_depth: int = 1) -> None:
+        """
+        :param stats_depth: Keeps counters for every subtree up to this many levels deep, 0 for the tree only.
+        """
+        super().__init__(stats_depth=stats_depth)
+        self._flat: dict[tuple[str, ...], RecursiveCacheEntry] = {}
+        # Every proper, non-empty prefix of a registered path -> the registered paths below it.
+        self._prefixes: dict[tuple[str, ...], set[tuple[str, ...]]] = {}
+
+    def _string(self, path: tuple[str, ...]) -> str:
+        return '/'.join(('ROOT',) + path)
+
+    def _check_walk(self, path: tuple[str, ...], leaf: bool = True) -> None:
+        """
+        Raises like the tree walk does if the path runs through a leaf or, if a leaf is expected, ends on a node.
+        """
+        for i in range(1, len(path)):
+            if path[:i] in self._flat:
+                raise Exception(
+                    f'Walk down path into cache of {self._string(path)} cannot be completed as {self._string(path[:i])} does not yield a tree node.')
+        if leaf and path in self._prefixes:
+            raise Exception(
+                f'Walk down path into cache of {self._string(path)} cannot be completed as {self._string(path)} does not yield a tree leaf.')
+
+    def register(self, keys: tuple[str], val, timeout: float) -> None:
+        path: tuple[str, ...] = tuple(keys)
+        if not path:
+            raise AttributeError(f'Received empty keys at path {self.path_as_string}')
+        if path in self._flat or path in self._prefixes:
+            raise Exception(f'{self._string(path)} is already registered, use Refresh instead.')
+        self._check_walk(path)
+
+        size: int = approximate_size(val) if self._budgets else 0
+        self._make_room(path, size)
+
+        timeout = monotonic() + timeout
+        entry: RecursiveCacheEntry = RecursiveCacheEntry(val, timeout, size)
+        self._flat[path] = entry
+        for i in range(1, len(path)):
+            self._prefixes.setdefault(path[:i], set()).add(path)
+        self._account(path, entry)
+        self._expiry.schedule(path, timeout)
+
+    def refresh(self, keys: tuple[str], timeout: float) -> None:
+        path: tuple[str, ...] = tuple(keys)
+        if not path:
+            raise AttributeError(f'Received empty keys at path {self.path_as_string}')
+        entry: RecursiveCacheEntry | None = self._flat.get(path)
+        if entry is None:
+            self._check_walk(path)
+            raise KeyError(f'{self._string(path)} cannot be refreshed as it does not exist.')
+
+        timeout = monotonic() + timeout
+        entry.timeout = timeout
+        self._expiry.schedule(path, timeout)
+
+    def _prune_entry(self, keys: tuple[str, ...], clean_empty_nodes: bool) -> None:
+        path: tuple[str, ...] = tuple(keys)
+        if not path:
+            return
+        if path in self._flat:
+            self._remove(path)
+        else:
+            self._check_walk(path, leaf=False)  # Subtrees may be pruned, but not through a leaf.
+            for below in list(self._prefixes.get(path, ())):
+                self._remove(below)
+
+    def _remove(self, path: tuple[str, ...]) -> None:
+        entry: RecursiveCacheEntry = self._flat.pop(path)
+        for i in range(1, len(path)):
+            below: set[tuple[str, ...]] = self._prefixes[path[:i]]
+            below.discard(path)
+            if not below:
+                del self._prefixes[path[:i]]
+        self._forget(path, entry)
+
+    def is_cached(self, keys: tuple[str, ...]) -> bool:
+        path: tuple[str, ...] = tuple(keys)
+        # Like the tree walk, a leaf partway down the path counts.
+        return path in self._flat or any(path[:i] in self._flat for i in range(1, len(path)))
+
+    def _find(self, keys: tuple[str, ...]) -> RecursiveCacheEntry | None:
+        path: tuple[str, ...] = tuple(keys)
+        entry: RecursiveCacheEntry | None = self._flat.get(path)
+        if entry is None:
+            if not path:
+                raise AttributeError(f'Received empty keys at path {self.path_as_string}')
+            self._check_walk(path)
+        return entry
+
+    def _leaves(self, keys: tuple[str, ...] = ()) -> Iterator[tuple[tuple[str, ...], RecursiveCacheEntry]]:
+        path: tuple[str, ...] = tuple(keys)
+        if not path:
+            yield from list(self._flat.items())
+            return
+        for below in list(self._prefixes.get(path, ())):
+            yield below, self._flat[below]
+
+    def _node(self, keys: tuple[str, ...]) -> RecursiveCacheHandler | None:
+        return self if not keys else None  # There are no child nodes.
+
+    def _check_complete(self, clean_empty_child_nodes: bool, time: float | None = None, ):
+        if time is None:
+            time = monotonic()
+        for path in [p for p, entry in self._flat.items() if entry.timeout < time]:
+            self._remove(path)
@@ -0,0 +1,94 @@
+import sqlite3 as _sql
+import threading
+
+
+class PragmaProfile:
+    """
+    Set of PRAGMAs applied to every connection when it is opened. None leaves the SQLite default in place.
+    """
+
+    def __init__(self, journal_mode: str | None = None, synchronous: str | None = None, mmap_size: int | None = None,
+                 cache_size: int | None = None, foreign_keys: bool = True, busy_timeout: int | None = None,
+                 cached_statements: int = 128):
+        """
+        :param journal_mode: For example 'WAL'. Persists in the database file once set.
+        :param synchronous: 'OFF', 'NORMAL', 'FULL' or 'EXTRA'.
+        :param mmap_size: Bytes of the database file to memory-map.
+        :param cache_size: Page cache size. Positive counts pages, negative counts KiB.
+        :param foreign_keys: Enforce foreign key constraints. Off by default in SQLite, and per connection.
+        :param busy_timeout: Milliseconds to wait on a locked database before raising.
+        :param cached_statements: Size of the prepared statement cache of each connection.
+        """
+        self.journal_mode = journal_mode
+        self.synchronous = synchronous
+        self.mmap_size = mmap_size
+        self.cache_size = cache_size
+        self.foreign_keys = foreign_keys
+        self.busy_timeout = busy_timeout
+        self.cached_statements = cached_statements
+
+    def statements(self) -> list[str]:
+        pragmas: dict[str, str | int | None] = {
+            'journal_mode': self.journal_mode,
+            'synchronous': self.synchronous,
+            'mmap_size': self.mmap_size,
+            'cache_size': self.cache_size,
+            'foreign_keys': 'ON' if self.foreign_keys else 'OFF',
+            'busy_timeout': self.busy_timeout,
+        }
+        return [f'PRAGMA {name} = {value}' for name, value in pragmas.items() if value is not None]
+
+
+# Untuned, what a bare sqlite3.connect gives.
+DEFAULT_PROFILE: PragmaProfile = PragmaProfile(foreign_keys=False)
+# Readers do not block the writer and vice versa; NORMAL is durable across application crashes under WAL.
+WAL_PROFILE: PragmaProfile = PragmaProfile(journal_mode='WAL', synchronous='NORMAL', mmap_size=64 * 1024 * 1024,
+                                           cache_size=-16 * 1024, busy_timeout=5_000)
+
+
+class ConnectionPool:
+    """
+    Hands out one long-lived connection per thread, opened and tuned on first use.
+    sqlite3 connections must not be shared between threads, but reopening one per query means paying for the
+    connection set-up, the schema parse and a cold statement cache every time.
+    """
+
+    def __init__(self, path: str, profile: PragmaProfile = WAL_PROFILE) -> None:
+        self.path: str = path
+        self.profile: PragmaProfile = profile
+
+        self._local: threading.local = threading.local()
+        self._lock: threading.Lock = threading.Lock()
+        self._connections: list[_sql.Connection] = []  # Every open connection, so they can be closed from any thread.
+        self._generation: int = 0  # Bumped on close, so threads notice their connection is gone.
+
+    def _open(self) -> _sql.Connection:
+        # Only ever used by the thread that opened it, but closed from whichever thread calls `close`.
+        conn: _sql.Connection = _sql.connect(self.path, check_same_thread=False,
+                                             cached_statements=self.profile.cached_statements)
+        conn.row_factory = _sql.Row
+        for statement in self.profile.statements():
+            conn.execute(statement)
+        return conn
+
+    def connection(self) -> _sql.Connection:
+        """
+        Connection of the calling thread. Use it as a context manager for a transaction; do not close it.
+        """
+        conn: _sql.Connection | None = getattr(self._local, 'conn', None)
+        if conn is None or self._local.generation != self._generation:
+            conn = self._open()
+            with self._lock:
+                self._connections.append(conn)
+                self._local.conn, self._local.generation = conn, self._generation
+        return conn
+
+    def close(self) -> None:
+        """
+        Closes every connection of the pool. Threads open a new one on next use.
+        """
+        with self._lock:
+            self._generation += 1
+            for conn in self._connections:
+                conn.close()
+            self._connections.clear()
@@ -0,0 +1,189 @@
+import sys as _sys
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+
+"""
+Eviction policies and size budgets for `RecursiveCacheHandler`.
+Policies only keep bookkeeping on absolute cache paths; the cache tells them what happens and asks them for a victim.
+"""
+
+_Path = tuple[str, ...]
+
+
+def approximate_size(val, depth: int = 3) -> int:
+    """
+    Rough resident size of a value in bytes: `sys.getsizeof` of the value plus, up to the given depth, that of the
+    contents of the containers and plain objects it holds. Shared objects are counted once per reference.
+    :param val: Value to measure.
+    :param depth: How many levels of contents to include.
+    """
+    size: int = _sys.getsizeof(val)
+    if depth <= 0 or isinstance(val, (str, bytes, int, float, bool)):
+        return size
+    if isinstance(val, dict):
+        size += sum(approximate_size(k, depth - 1) + approximate_size(v, depth - 1) for k, v in val.items())
+    elif isinstance(val, (list, tuple, set, frozenset)):
+        size += sum(approximate_size(v, depth - 1) for v in val)
+    elif hasattr(val, '__dict__'):
+        size += approximate_size(vars(val), depth - 1)
+    return size
+
+
+# region Policies
+class EvictionPolicy(ABC):
+    """
+    Decides which entry to evict once a budget is exceeded.
+    """
+
+    @abstractmethod
+    def on_insert(self, path: _Path) -> None:
+        pass
+
+    @abstractmethod
+    def on_access(self, path: _Path) -> None:
+        pass
+
+    @abstractmethod
+    def on_remove(self, path: _Path) -> None:
+        pass
+
+    @abstractmethod
+    def victim(self) -> _Path | None:
+        """
+        :return: Path of the entry to evict next, or None if this policy never evicts.
+        """
+        pass
+
+
+class LRUPolicy(EvictionPolicy):
+    """
+    Evicts the entry that was read or written least recently.
+    """
+
+    def __init__(self) -> None:
+        self._order: OrderedDict[_Path, None] = OrderedDict()
+
+    def on_insert(self, path: _Path) -> None:
+        self._order[path] = None
+        self._order.move_to_end(path)
+
+    def on_access(self, path: _Path) -> None:
+        if path in self._order:
+            self._order.move_to_end(path)
+
+    def on_remove(self, path: _Path) -> None:
+        self._order.pop(path, None)
+
+    def victim(self) -> _Path | None:
+        return next(iter(self._order), None)
+
+
+class LFUPolicy(EvictionPolicy):
+    """
+    Evicts the entry read least often since it was cached, the least recently used one among ties.
+    """
+
+    def __init__(self) -> None:
+        self._counts: dict[_Path, int] = {}
+        self._buckets: dict[int, OrderedDict[_Path, None]] = {}  # Read count -> paths, least recent first.
+        self._min: int = 0
+
+    def _bucket_add(self, path: _Path, count: int) -> None:
+        self._counts[path] = count
+        self._buckets.setdefault(count, OrderedDict())[path] = None
+
+    def _bucket_remove(self, path: _Path) -> int:
+        count: int = self._counts.pop(path)
+        bucket: OrderedDict[_Path, None] = self._buckets[count]
+        del bucket[path]
+        if not bucket:
+            del self._buckets[count]
+        return count
+
+    def on_insert(self, path: _Path) -> None:
+        if path in self._counts:
+            self._bucket_remove(path)
+        self._bucket_add(path, 1)
+        self._min = 1
+
+    def on_access(self, path: _Path) -> None:
+        if path not in self._counts:
+            return
+        count: int = self._bucket_remove(path)
+        self._bucket_add(path, count + 1)
+        if count == self._min and count not in self._buckets:
+            self._min = count + 1
+
+    def on_remove(self, path: _Path) -> None:
+        if path in self._counts:
+            self._bucket_remove(path)
+
+    def victim(self) -> _Path | None:
+        if not self._buckets:
+            return None
+        if self._min not in self._buckets:  # Stale after a removal emptied the lowest bucket.
+            self._min = min(self._buckets)
+        return next(iter(self._buckets[self._min]))
+
+
+class TTLOnlyPolicy(EvictionPolicy):
+    """
+    Never evicts; entries only leave when they time out or are unregistered. Cannot enforce a budget.
+    """
+
+    def on_insert(self, path: _Path) -> None:
+        pass
+
+    def on_access(self, path: _Path) -> None:
+        pass
+
+    def on_remove(self, path: _Path) -> None:
+        pass
+
+    def victim(self) -> _Path | None:
+        return None
+# endregion
+
+
+class CacheBudget:
+    """
+    Size limits for a cache (sub)tree, with the policy that picks what to evict and the current usage.
+    Limits left as None are not enforced; a budget without limits still reports its size.
+    """
+
+    def __init__(self, max_entries: int | None = None, max_bytes: int | None = None,
+                 policy: EvictionPolicy | None = None) -> None:
+        """
+        :param max_entries: Maximum number of entries in the subtree.
+        :param max_bytes: Approximate maximum size of the values in the subtree, see `approximate_size`.
+        :param policy: Eviction policy, LRU if not given.
+        """
+        if max_entries is not None and max_entries < 1 or max_bytes is not None and max_bytes < 1:
+            raise ValueError('Cache budget limits must be positive.')
+        self.policy: EvictionPolicy = policy if policy is not None else LRUPolicy()
+        if isinstance(self.policy, TTLOnlyPolicy) and (max_entries is not None or max_bytes is not None):
+            raise ValueError('A TTL-only policy cannot enforce a size budget.')
+
+        self.max_entries: int | None = max_entries
+        self.max_bytes: int | None = max_bytes
+        self.entries: int = 0
+        self.bytes: int = 0
+        self.evictions: int = 0
+
+    def needs_room(self, size: int) -> bool:
+        """
+        Whether an entry of the given size would take this budget over its limits.
+        """
+        return bool(self.entries) and (
+                self.max_entries is not None and self.entries + 1 > self.max_entries
+                or self.max_bytes is not None and self.bytes + size > self.max_bytes)
+
+    def add(self, path: _Path, size: int) -> None:
+        self.entries += 1
+        self.bytes += size
+        self.policy.on_insert(path)
+
+    def remove(self, path: _Path, size: int) -> None:
+        self.entries -= 1
+        self.bytes -= size
+        self.policy.on_remove(path)
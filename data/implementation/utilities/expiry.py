@@ -0,0 +1,75 @@
+from time import monotonic
+from typing import Generic, Hashable, TypeVar
+
+_K = TypeVar('_K', bound=Hashable)
+
+
+class TimerWheel(Generic[_K]):
+    """
+    Hashed timer wheel: keeps exactly one deadline per key, in the slot of the tick it falls in.
+    Scheduling, rescheduling and cancelling are O(1). Expiring visits only the slots of the ticks that passed, and a
+    key further out than one rotation (`slots * resolution` seconds) is looked at once per rotation until it is due,
+    so expiry is O(1) amortized per key as long as most deadlines fit in a rotation or two.
+    Keys may come out of `expire` up to one tick late, never early.
+    """
+
+    def __init__(self, resolution: float = 1.0, slots: int = 1024) -> None:
+        """
+        :param resolution: Seconds per tick.
+        :param slots: Ticks per rotation.
+        """
+        if resolution <= 0 or slots < 1:
+            raise ValueError('Timer wheel needs a positive resolution and at least one slot.')
+        self.resolution: float = resolution
+        self._slots: list[dict[_K, float]] = [{} for _ in range(slots)]
+        self._where: dict[_K, int] = {}  # Key -> index of the slot holding its deadline.
+        self._tick: int = self._tick_of(monotonic())  # First tick not yet fully expired.
+
+    def _tick_of(self, time: float) -> int:
+        return int(time // self.resolution)
+
+    def __len__(self) -> int:
+        return len(self._where)
+
+    def __contains__(self, key: _K) -> bool:
+        return key in self._where
+
+    def schedule(self, key: _K, deadline: float) -> None:
+        """
+        Sets the deadline of a key, replacing the one it had.
+        :param key: Key to expire.
+        :param deadline: `time.monotonic` time at which it expires.
+        """
+        self.cancel(key)
+        index: int = max(self._tick_of(deadline), self._tick) % len(self._slots)
+        self._slots[index][key] = deadline
+        self._where[key] = index
+
+    def cancel(self, key: _K) -> None:
+        """
+        Forgets the deadline of a key, if it has one.
+        """
+        index: int | None = self._where.pop(key, None)
+        if index is not None:
+            del self._slots[index][key]
+
+    def expire(self, now: float | None = None) -> list[_K]:
+        """
+        Removes and returns every key whose deadline has passed.
+        :param now: `time.monotonic` time to expire up to, now if not given.
+        """
+        if now is None:
+            now = monotonic()
+        target: int = self._tick_of(now)
+        if target < self._tick:
+            return []
+
+        due: list[_K] = []
+        for tick in range(self._tick, min(target, self._tick + len(self._slots) - 1) + 1):
+            slot: dict[_K, float] = self._slots[tick % len(self._slots)]
+            for key in [k for k, deadline in slot.items() if deadline <= now]:
+                del slot[key]
+                del self._where[key]
+                due.append(key)
+        self._tick = target  # Its slot may still hold keys due later in this tick, so it is visited again next time.
+        return due
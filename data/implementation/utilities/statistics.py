@@ -0,0 +1,41 @@
+class CacheStats:
+    """
+    Counters for one cache (sub)tree. Reads are hits or misses; a miss through `get_or_load` that starts a loader
+    also counts as a load, and its time as load latency whether or not it failed.
+    """
+    __slots__ = ('hits', 'misses', 'loads', 'load_errors', 'evictions', 'expirations', 'load_seconds',
+                 'max_load_seconds')
+
+    def __init__(self) -> None:
+        self.hits: int = 0
+        self.misses: int = 0
+        self.loads: int = 0
+        self.load_errors: int = 0
+        self.evictions: int = 0
+        self.expirations: int = 0
+        self.load_seconds: float = 0.0
+        self.max_load_seconds: float = 0.0
+
+    def record_load(self, seconds: float, failed: bool) -> None:
+        self.loads += 1
+        self.load_errors += failed
+        self.load_seconds += seconds
+        self.max_load_seconds = max(self.max_load_seconds, seconds)
+
+    @property
+    def hit_ratio(self) -> float | None:
+        reads: int = self.hits + self.misses
+        return self.hits / reads if reads else None
+
+    def as_json(self) -> dict[str, int | float | None]:
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_ratio': self.hit_ratio,
+            'loads': self.loads,
+            'load_errors': self.load_errors,
+            'mean_load_ms': self.load_seconds / self.loads * 1e3 if self.loads else None,
+            'max_load_ms': self.max_load_seconds * 1e3,
+            'evictions': self.evictions,
+            'expirations': self.expirations,
+        }
@@ -0,0 +1,203 @@
+from data.interfaces.autoreplies import TextAutoreplyInterface, SimpleAliasData, SimpleTriggerData, SimpleReplyData
+from data.interfaces.fact import FactInterface, LocalAdminFactInterface, GlobalAdminFactInterface, \
+    SimpleFactEditorData
+from data.interfaces.moderation import LocalAdminModerationInterface, GlobalAdminModerationInterface, BanDomains
+from data.interfaces.pref import PreferencesInterface, supported_autoreply_features, GuildChannelPreferenceData, \
+    UserPreferenceData
+from data.interfaces.saying import SayingInterface, GlobalAdminSayingInterface, SimpleSayingEditorData, \
+    SayingEditorData
+from data.interfaces.utilities.executor import DataExecutor
+from data.interfaces.utilities.triggers import TriggerMatcher
+
+"""
+Awaitable views of the data interfaces, for use from the event loop.
+Each call is run on a `DataExecutor`, so disk I/O never blocks the gateway. Behaviour, arguments and raised exceptions
+are those of the wrapped interface; see there for documentation.
+"""
+
+
+# region Fact
+class AsyncFactInterface:
+    def __init__(self, sync: FactInterface, executor: DataExecutor) -> None:
+        self.sync: FactInterface = sync
+        self.executor: DataExecutor = executor
+
+    async def get_fact(self, guild_id: int | None, index: int | None) -> str:
+        return await self.executor.run(self.sync.get_fact, guild_id, index)
+
+    async def get_compiled_fact(self, guild_id: int | None, index: int | None) -> tuple[str, bytes | None]:
+        return await self.executor.run(self.sync.get_compiled_fact, guild_id, index)
+
+    async def get_fact_count(self, guild_id: int | None) -> int:
+        return await self.executor.run(self.sync.get_fact_count, guild_id)
+
+    async def get_fact_counts(self, guild_id: int | None) -> tuple[int, int]:
+        return await self.executor.run(self.sync.get_fact_counts, guild_id)
+
+    async def is_killswitch(self) -> bool:
+        return await self.executor.run(self.sync.is_killswitch)
+
+
+class AsyncLocalAdminFactInterface(AsyncFactInterface):
+    def __init__(self, sync: LocalAdminFactInterface, executor: DataExecutor) -> None:
+        super().__init__(sync, executor)
+        self.sync: LocalAdminFactInterface = sync
+
+    async def create_fact(self, guild_id: int, user_id: int, fact: str) -> None:
+        return await self.executor.run(self.sync.create_fact, guild_id, user_id, fact)
+
+    async def edit_fact(self, guild_id: int, index: int, new_fact: str, editor_id: int) -> SimpleFactEditorData:
+        return await self.executor.run(self.sync.edit_fact, guild_id, index, new_fact, editor_id)
+
+    async def delete_fact(self, guild_id: int, index: int) -> SimpleFactEditorData:
+        return await self.executor.run(self.sync.delete_fact, guild_id, index)
+
+    async def get_local_facts(self, guild_id: int) -> list[SimpleFactEditorData]:
+        return await self.executor.run(self.sync.get_local_facts, guild_id)
+
+
+class AsyncGlobalAdminFactInterface(AsyncLocalAdminFactInterface):
+    def __init__(self, sync: GlobalAdminFactInterface, executor: DataExecutor) -> None:
+        super().__init__(sync, executor)
+        self.sync: GlobalAdminFactInterface = sync
+
+    async def toggle_local_fact_killswitch(self) -> bool:
+        return await self.executor.run(self.sync.toggle_local_fact_killswitch)
+
+    async def create_global_fact(self, user_id: int, fact: str) -> None:
+        return await self.executor.run(self.sync.create_global_fact, user_id, fact)
+
+    async def edit_global_fact(self, index: int, editor_id: int, new_fact: str) -> SimpleFactEditorData:
+        return await self.executor.run(self.sync.edit_global_fact, index, editor_id, new_fact)
+
+    async def delete_global_fact(self, index: int) -> SimpleFactEditorData:
+        return await self.executor.run(self.sync.delete_global_fact, index)
+
+    async def get_global_facts(self) -> list[SimpleFactEditorData]:
+        return await self.executor.run(self.sync.get_global_facts)
+
+    async def get_all_local_facts(self) -> dict[int, list[SimpleFactEditorData]]:
+        return await self.executor.run(self.sync.get_all_local_facts)
+# endregion
+
+
+# region Saying
+class AsyncSayingInterface:
+    def __init__(self, sync: SayingInterface, executor: DataExecutor) -> None:
+        self.sync: SayingInterface = sync
+        self.executor: DataExecutor = executor
+
+    async def get_saying(self) -> str:
+        return await self.executor.run(self.sync.get_saying)
+
+    async def get_compiled_saying(self) -> tuple[str, bytes | None]:
+        return await self.executor.run(self.sync.get_compiled_saying)
+
+
+class AsyncGlobalAdminSayingInterface(AsyncSayingInterface):
+    def __init__(self, sync: GlobalAdminSayingInterface, executor: DataExecutor) -> None:
+        super().__init__(sync, executor)
+        self.sync: GlobalAdminSayingInterface = sync
+
+    async def create_saying(self, text: str) -> None:
+        return await self.executor.run(self.sync.create_saying, text)
+
+    async def edit_saying(self, index: int, text: str) -> SimpleSayingEditorData:
+        return await self.executor.run(self.sync.edit_saying, index, text)
+
+    async def delete_saying(self, index: int) -> SayingEditorData:
+        return await self.executor.run(self.sync.delete_saying, index)
+
+    async def get_sayings(self) -> list[SayingEditorData]:
+        return await self.executor.run(self.sync.get_sayings)
+
+    async def get_saying_by_index(self, index: int) -> SimpleSayingEditorData:
+        return await self.executor.run(self.sync.get_saying_by_index, index)
+# endregion
+
+
+# region Preferences
+class AsyncPreferencesInterface:
+    def __init__(self, sync: PreferencesInterface, executor: DataExecutor) -> None:
+        self.sync: PreferencesInterface = sync
+        self.executor: DataExecutor = executor
+
+    async def pause_all_in_channel(self, guild_id: int, channel_id: int | None, duration: int) -> None:
+        return await self.executor.run(self.sync.pause_all_in_channel, guild_id, channel_id, duration)
+
+    async def is_paused_channel(self, guild_id: int, channel_id: int) -> bool:
+        return await self.executor.run(self.sync.is_paused_channel, guild_id, channel_id)
+
+    async def toggle_autoreply_feature(self, guild_id: int, channel_id: int | None,
+                                       features: set[supported_autoreply_features]) -> None:
+        return await self.executor.run(self.sync.toggle_autoreply_feature, guild_id, channel_id, features)
+
+    async def is_autoreply_enabled(self, guild_id: int, channel_id: int | None,
+                                   feature: supported_autoreply_features) -> bool:
+        return await self.executor.run(self.sync.is_autoreply_enabled, guild_id, channel_id, feature)
+
+    async def guild_channel_autoreplies_enabled(self, guild_id: int,
+                                                channel_id: int | None) -> GuildChannelPreferenceData:
+        return await self.executor.run(self.sync.guild_channel_autoreplies_enabled, guild_id, channel_id)
+
+    async def toggle_user_autoreply_feature(self, user_id: int, features: set[supported_autoreply_features]) -> None:
+        return await self.executor.run(self.sync.toggle_user_autoreply_feature, user_id, features)
+
+    async def is_user_autoreply_enabled(self, user_id: int, feature: supported_autoreply_features) -> bool:
+        return await self.executor.run(self.sync.is_user_autoreply_enabled, user_id, feature)
+
+    async def user_autoreplies_enabled(self, user_id: int) -> UserPreferenceData:
+        return await self.executor.run(self.sync.user_autoreplies_enabled, user_id)
+
+    async def autoreply_feature_mask(self, guild_id: int, channel_id: int, user_id: int) -> int:
+        return await self.executor.run(self.sync.autoreply_feature_mask, guild_id, channel_id, user_id)
+# endregion
+
+
+# region Moderation
+class AsyncLocalAdminModerationInterface:
+    def __init__(self, sync: LocalAdminModerationInterface, executor: DataExecutor) -> None:
+        self.sync: LocalAdminModerationInterface = sync
+        self.executor: DataExecutor = executor
+
+    async def is_banned_user(self, user_id: int) -> bool:
+        return await self.executor.run(self.sync.is_banned_user, user_id)
+
+    async def is_banned_guild(self, guild_id: int) -> bool:
+        return await self.executor.run(self.sync.is_banned_guild, guild_id)
+
+    async def is_super_server(self, guild_id: int) -> bool:
+        return await self.executor.run(self.sync.is_super_server, guild_id)
+
+
+class AsyncGlobalAdminModerationInterface(AsyncLocalAdminModerationInterface):
+    def __init__(self, sync: GlobalAdminModerationInterface, executor: DataExecutor) -> None:
+        super().__init__(sync, executor)
+        self.sync: GlobalAdminModerationInterface = sync
+
+    async def toggle_ban(self, ban_type: BanDomains, identifier: int) -> bool:
+        return await self.executor.run(self.sync.toggle_ban, ban_type, identifier)
+
+    async def get_banlist(self, ban_type: BanDomains) -> list[int]:
+        return await self.executor.run(self.sync.get_banlist, ban_type)
+# endregion
+
+
+# region Autoreplies
+class AsyncTextAutoreplyInterface:
+    def __init__(self, sync: TextAutoreplyInterface, executor: DataExecutor) -> None:
+        self.sync: TextAutoreplyInterface = sync
+        self.executor: DataExecutor = executor
+
+    async def get_reply(self, alias: str) -> SimpleReplyData | None:
+        return await self.executor.run(self.sync.get_reply, alias)
+
+    async def get_triggers_by_alias(self) -> dict[SimpleAliasData, list[SimpleTriggerData]]:
+        return await self.executor.run(self.sync.get_triggers_by_alias)
+
+    async def get_triggers_for_alias(self, alias: str) -> list[SimpleTriggerData]:
+        return await self.executor.run(self.sync.get_triggers_for_alias, alias)
+
+    async def get_trigger_matcher(self) -> TriggerMatcher:
+        return await self.executor.run(self.sync.get_trigger_matcher)
+# endregion
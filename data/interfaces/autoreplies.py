@@ -1,9 +1,15 @@
+from __future__ import annotations
+
 from abc import ABC, abstractmethod
-from typing import Literal, TypeAlias, Any
+from typing import Literal, TypeAlias, Any, TYPE_CHECKING
 
 from data.interfaces.utilities import AbstractDTO
 
-trigger_types: TypeAlias = Literal['regex']
+if TYPE_CHECKING:
+    # Imports DTOs from this module.
+    from data.interfaces.utilities.triggers import TriggerMatcher
+
+trigger_types: TypeAlias = Literal['regex', 'literal', 'word', 'prefix', 'exact']
 reply_types: TypeAlias = Literal['text', 'reaction']
 
 
@@ -69,21 +75,29 @@ class SimpleTriggerData(AbstractDTO):
         val: dict[str, int | float | None | str | bool | dict | list] = {
             'type': self.type,
             'data': self.data,
+            'case_insensitive': self.case_insensitive,
         }
         if self.rate is not None:
             val['rate'] = self.rate
         return val
 
-    def __init__(self, trigger_type: trigger_types, data: str, rate: int | None):
+    def __init__(self, trigger_type: trigger_types, data: str, rate: int | None, case_insensitive: bool = False):
         """
         Represents Data Transfer Object for Trigger data.
         :param trigger_type: Type of trigger. Needs to be supported.
+        - `regex`: Data is a regular expression matched against the start of the message.
+        - `literal`: Data occurs anywhere in the message.
+        - `word`: Data occurs in the message as whole word(s).
+        - `prefix`: The message starts with data.
+        - `exact`: The message is exactly data.
         :param data: Unprocess PISS-compatible string.
         :param rate: If present, overrides rate of alias in [1..256].
+        :param case_insensitive: If True, letter case is ignored when matching.
         """
         self.type: trigger_types = trigger_type
         self.data: str = data
         self.rate: int | None = rate
+        self.case_insensitive: bool = case_insensitive
 
 
 class TriggerData(SimpleTriggerData):
@@ -92,7 +106,7 @@ class TriggerData(SimpleTriggerData):
     """
 
     def __init__(self, trigger_type: trigger_types, data: str, rate: int | None, alias: AliasData, editor_id: int,
-                 modified_at: int):
+                 modified_at: int, case_insensitive: bool = False):
         """
         Represents Data Transfer Object for Trigger data.
         :param trigger_type: Type of trigger. Needs to be supported.
@@ -101,8 +115,9 @@ class TriggerData(SimpleTriggerData):
         :param alias: Alias of the trigger.
         :param editor_id: ID of last editor of Trigger.
         :param modified_at: POSIX (rounded to int) timestamp of last modification of Trigger.
+        :param case_insensitive: If True, letter case is ignored when matching.
         """
-        super().__init__(trigger_type, data, rate)
+        super().__init__(trigger_type, data, rate, case_insensitive)
         self.alias: AliasData = alias
 
         # Moderation purposes
@@ -130,10 +145,15 @@ class SimpleReplyData(AbstractDTO):
             'weight': self.weight,
         }
 
-    def __init__(self, reply_type: reply_types, data: str, weight: int):
+    def __init__(self, reply_type: reply_types, data: str, weight: int, compiled: bytes | None = None):
+        """
+        :param compiled: For type `text`, the stored compiled form of `data` if the implementation keeps one.
+        Opaque to the data layer; see `piss.old.serialization`.
+        """
         self.type = reply_type
         self.data: str = data
         self.weight: int = weight
+        self.compiled: bytes | None = compiled
 
 
 class ReplyData(SimpleReplyData):
@@ -174,6 +194,7 @@ class TextAutoreplyInterface(ABC):
     def get_reply(self, alias: str) -> SimpleReplyData | None:
         """
         Get a random reply based on the given alias and the corresponding reply pool's weights.
+        Called for every fired Alias; keep the weighted pool around (see `AliasTable`) rather than scanning per pick.
         :param alias: Alias of the reply to get. Raises ValueError if not found.
         :return: Unprocessed raw Reply data or NONE if no replies exist for this Alias.
         """
@@ -195,6 +216,14 @@ class TextAutoreplyInterface(ABC):
         """
         raise NotImplementedError()
 
+    @abstractmethod
+    def get_trigger_matcher(self) -> TriggerMatcher:
+        """
+        Gets the compiled matcher snapshot of the complete trigger pool.
+        Keep the snapshot around; only rebuild it when an Alias or Trigger is modified.
+        """
+        raise NotImplementedError()
+
 
 class GlobalTextAutoreplyInterface(TextAutoreplyInterface):
     """
@@ -249,13 +278,15 @@ class GlobalTextAutoreplyInterface(TextAutoreplyInterface):
 
     # region trigger
     @abstractmethod
-    def add_trigger(self, alias: str, trigger_type: trigger_types, data: str, rate: int | None) -> None:
+    def add_trigger(self, alias: str, trigger_type: trigger_types, data: str, rate: int | None,
+                    case_insensitive: bool = False) -> None:
         """
         Creates a new Trigger for the given Alias.
         :param alias: Name of the Alias. Raises ValueError if given Alias does not exist.
         :param trigger_type: Type of the Trigger
         :param data: Trigger Data
         :param rate: Optional Trigger rate in [1..256]
+        :param case_insensitive: Ignore letter case when matching.
         """
         raise NotImplementedError()
 
@@ -269,13 +300,15 @@ class GlobalTextAutoreplyInterface(TextAutoreplyInterface):
         raise NotImplementedError()
 
     @abstractmethod
-    def edit_trigger(self, alias: str, index: int, trigger_type: trigger_types, data: str | None,
-                     rate: int | None) -> None:
+    def edit_trigger(self, alias: str, index: int, trigger_type: trigger_types | None, data: str | None,
+                     rate: int | None, case_insensitive: bool | None = None) -> None:
         """
         Edits the Trigger at the given index, for the given Alias.
         Raises ValueError if the Alias does not exist.
         Raises IndexError if given index is out of range.
         Raises AttributeError if no replacement data was given.
+        :param trigger_type: Replacement Trigger type, or None to leave it unchanged.
+        :param case_insensitive: Replacement case-insensitivity, or None to leave it unchanged.
         """
         raise NotImplementedError()
 
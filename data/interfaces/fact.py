@@ -73,6 +73,14 @@ class FactInterface(ABC):
         """
         raise NotImplementedError()
 
+    def get_compiled_fact(self, guild_id: int | None, index: int | None) -> tuple[str, bytes | None]:
+        """
+        Like `get_fact`, but also returns the stored compiled form of the fact, if the implementation keeps one.
+        The compiled form is opaque to the data layer; see `piss.old.serialization`.
+        :return: (Unprocessed PISS-compatible string, compiled form or None)
+        """
+        return self.get_fact(guild_id, index), None
+
     @abstractmethod
     def get_fact_count(self, guild_id: int | None) -> int:
         """
@@ -84,6 +92,14 @@ class FactInterface(ABC):
         """
         raise NotImplementedError()
 
+    def get_fact_counts(self, guild_id: int | None) -> tuple[int, int]:
+        """
+        Gets the global and local fact counts in one call. Use over `get_fact_count` if you need both.
+        :param guild_id: Guild to get the local count for. If None, the local count is 0.
+        :return: (global count, local count)
+        """
+        return self.get_fact_count(None), self.get_fact_count(guild_id) if guild_id is not None else 0
+
     @abstractmethod
     def is_killswitch(self) -> bool:
         """
@@ -102,6 +118,7 @@ class LocalAdminFactInterface(FactInterface):
     def create_fact(self, guild_id: int, user_id: int, fact: str) -> None:
         """
         Creates a new Local fact under the given user id
+        Raises ValueError if the guild already has this fact.
         :param guild_id: Guild the new Local fact will belong to.
         :param user_id: The ID of the user adding the new Local fact.
         :param fact: The new Local fact. Ensure it compiles before being added.
@@ -138,7 +155,7 @@ class LocalAdminFactInterface(FactInterface):
     def get_local_facts(self, guild_id: int) -> list[SimpleFactEditorData]:
         """
         Gets all local facts for guild.
-        Ordered on edit date.
+        Ordered by index, newest first.
         """
         raise NotImplementedError()
 
@@ -161,6 +178,7 @@ class GlobalAdminFactInterface(LocalAdminFactInterface):
     def create_global_fact(self, user_id: int, fact: str) -> None:
         """
         Creates a new Global fact under the given user id
+        Raises ValueError if this fact already exists.
         :param user_id: The ID of the user adding the new Local fact.
         :param fact: The new Global fact. Ensure it compiles before being added.
         """
@@ -195,7 +213,7 @@ class GlobalAdminFactInterface(LocalAdminFactInterface):
     def get_global_facts(self) -> list[SimpleFactEditorData]:
         """
         Gets all global facts.
-        Ordered on creation date.
+        Ordered by index, newest first.
         """
         raise NotImplementedError()
 
@@ -51,6 +51,40 @@ class GuildChannelPreferenceData(AbstractDTO):
         }
 
 
+# region Feature bitmask
+# Resolved autoreply state for a (guild, channel, user) triple, packed into one int:
+# bits 0-3 hold the channel's feature flags, bits 4-7 the user's, and bit 8 is set while the channel is paused.
+FEATURE_BITS: dict[supported_autoreply_features, int] = {'text': 1 << 0, 'letter': 1 << 1, 'number': 1 << 2,
+                                                         'saying': 1 << 3}
+USER_FEATURE_SHIFT: int = 4
+PAUSED_BIT: int = 1 << 8
+
+
+def pack_features(prefs: UserPreferenceData | GuildChannelPreferenceData) -> int:
+    """
+    Packs the feature flags of a preference record into the low bits of a feature bitmask.
+    """
+    mask: int = 0
+    for feature, bit in FEATURE_BITS.items():
+        if getattr(prefs, feature):
+            mask |= bit
+    return mask
+
+
+def mask_allows(mask: int, feature: supported_autoreply_features, check_user: bool = True) -> bool:
+    """
+    Does the resolved feature bitmask allow the given feature to reply?
+    :param mask: Bitmask as returned by `PreferencesInterface.autoreply_feature_mask`.
+    :param feature: Feature to check for.
+    :param check_user: Also respect the user's flag. Features not tied to a user skip this.
+    """
+    bit: int = FEATURE_BITS[feature]
+    if mask & PAUSED_BIT or not mask & bit:
+        return False
+    return not check_user or bool(mask & (bit << USER_FEATURE_SHIFT))
+# endregion
+
+
 class PreferencesInterface(ABC):
     """
     Handles preference fetching and setting. Not made into two interfaces with different permission levels as they are widely used in the same areas.
@@ -143,3 +177,18 @@ class PreferencesInterface(ABC):
         """
         raise NotImplementedError()
     # endregion
+
+    def autoreply_feature_mask(self, guild_id: int, channel_id: int, user_id: int) -> int:
+        """
+        Resolves pause state, channel and user preferences in one go. Check the result with `mask_allows`.
+        Implementations with a cheaper way to resolve this should override it.
+        :param guild_id:
+        :param channel_id:
+        :param user_id:
+        :return: Packed feature bitmask, see `FEATURE_BITS`.
+        """
+        mask: int = pack_features(self.guild_channel_autoreplies_enabled(guild_id, channel_id))
+        mask |= pack_features(self.user_autoreplies_enabled(user_id)) << USER_FEATURE_SHIFT
+        if self.is_paused_channel(guild_id, channel_id):
+            mask |= PAUSED_BIT
+        return mask
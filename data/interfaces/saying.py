@@ -47,6 +47,14 @@ class SayingInterface(ABC):
         """
         raise NotImplementedError()
 
+    def get_compiled_saying(self) -> tuple[str, bytes | None]:
+        """
+        Like `get_saying`, but also returns the stored compiled form of the saying, if the implementation keeps one.
+        The compiled form is opaque to the data layer; see `piss.old.serialization`.
+        :return: (Unprocessed PISS-compatible string, compiled form or None)
+        """
+        return self.get_saying(), None
+
 
 class GlobalAdminSayingInterface(SayingInterface):
     @abstractmethod
@@ -0,0 +1,33 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Callable, TypeVar
+
+_T = TypeVar('_T')
+
+# A single worker serializes every data call and cache maintenance tick, so implementations with in-memory caches need
+# no locking of their own.
+# Raise only if every implementation behind the executor is thread-safe.
+DEFAULT_WORKERS: int = 1
+
+
+class DataExecutor:
+    """
+    Bounded thread pool that runs blocking data layer calls off the event loop.
+    SQL implementations keep one pooled connection per worker thread, so connections are reused across calls.
+    """
+
+    def __init__(self, max_workers: int = DEFAULT_WORKERS) -> None:
+        self._pool: ThreadPoolExecutor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='data')
+
+    async def run(self, func: Callable[..., _T], *args) -> _T:
+        """
+        Runs the function on a worker thread. Exceptions are raised to the awaiting caller.
+        """
+        return await asyncio.get_running_loop().run_in_executor(self._pool, partial(func, *args))
+
+    def shutdown(self, wait: bool = True) -> None:
+        """
+        Stops accepting calls and, if waiting, lets queued calls finish.
+        """
+        self._pool.shutdown(wait=wait)
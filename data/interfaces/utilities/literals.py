@@ -0,0 +1,239 @@
+import re as _re
+from functools import lru_cache
+# noinspection PyProtectedMember
+# The regex parser is private, but it is the only way to look inside a pattern without writing a parser of our own.
+import re._parser as _sre_parse
+# noinspection PyProtectedMember
+from re._constants import LITERAL, BRANCH, SUBPATTERN, ATOMIC_GROUP, MAX_REPEAT, MIN_REPEAT, POSSESSIVE_REPEAT
+from typing import Iterable, Iterator
+
+_REPEATS = {MAX_REPEAT, MIN_REPEAT, POSSESSIVE_REPEAT}
+# Characters `re` treats as case-equal to an ASCII letter that str.casefold does not fold onto it.
+_FOLD_EXTRA = str.maketrans({'\u0130': 'i', '\u0131': 'i'})
+
+
+@lru_cache(maxsize=256)
+def parse_pattern(pattern: str, flags: int = 0) -> _sre_parse.SubPattern:
+    """
+    Parses a regular expression into the tree `re` compiles from.
+    Cached, so analyses of the same pattern that run back to back share one parse.
+    The result is shared; do not modify it. Raises re.error on invalid patterns.
+    """
+    return _sre_parse.parse(pattern, flags)
+
+
+def fold(text: str) -> str:
+    """
+    Folds text for case-insensitive literal search, such that anything `re.IGNORECASE` considers equal to an ASCII
+    literal folds onto that literal.
+    """
+    return text.translate(_FOLD_EXTRA).casefold()
+
+
+class RequiredLiterals:
+    """
+    Record of the literals a pattern cannot match without.
+    Any match of the pattern contains at least one of `literals` as a substring.
+    """
+    __slots__ = ('literals', 'ignore_case')
+
+    def __init__(self, literals: frozenset[str], ignore_case: bool) -> None:
+        """
+        :param literals: Alternatives, at least one of which occurs in every match.
+        :param ignore_case: If True, the literals are folded and must be searched for in content passed through `fold`.
+        """
+        self.literals: frozenset[str] = literals
+        self.ignore_case: bool = ignore_case
+
+
+def _flatten(items: Iterable[tuple]) -> Iterator[tuple]:
+    """
+    Inlines groups, as they do not change what is concatenated. Flags are handled by the caller.
+    """
+    for op, av in items:
+        if op is SUBPATTERN:
+            yield from _flatten(av[-1])
+        elif op is ATOMIC_GROUP:
+            yield from _flatten(av)
+        else:
+            yield op, av
+
+
+def _score(literals: frozenset[str]) -> tuple[int, int]:
+    # Longest shortest alternative first, then the fewest alternatives.
+    return min(len(i) for i in literals), -len(literals)
+
+
+def _required(items: Iterable[tuple]) -> frozenset[str] | None:
+    """
+    Finds the most selective set of literal alternatives required by a parsed (sub)pattern.
+    Anything not understood ends the current literal run, which only ever makes the result less selective, never wrong.
+    :return: Literal alternatives, or None if nothing is required.
+    """
+    candidates: list[frozenset[str]] = []
+    run: list[str] = []
+
+    for op, av in _flatten(items):
+        if op is LITERAL:
+            run.append(chr(av))
+            continue
+
+        if run:
+            candidates.append(frozenset({''.join(run)}))
+            run = []
+
+        if op is BRANCH:
+            branches: list[frozenset[str] | None] = [_required(b) for b in av[1]]
+            if all(branches):
+                candidates.append(frozenset().union(*branches))
+        elif op in _REPEATS and av[0] >= 1:
+            inner: frozenset[str] | None = _required(av[2])
+            if inner:
+                candidates.append(inner)
+
+    if run:
+        candidates.append(frozenset({''.join(run)}))
+    if not candidates:
+        return None
+    return max(candidates, key=_score)
+
+
+def _ignores_case(items: Iterable[tuple]) -> bool:
+    """
+    Does any scoped flag group in the pattern turn on case-insensitivity?
+    """
+    for op, av in items:
+        if op is SUBPATTERN:
+            if av[1] & _re.IGNORECASE or _ignores_case(av[-1]):
+                return True
+        elif op is ATOMIC_GROUP:
+            if _ignores_case(av):
+                return True
+        elif op is BRANCH:
+            if any(_ignores_case(b) for b in av[1]):
+                return True
+        elif op in _REPEATS:
+            if _ignores_case(av[2]):
+                return True
+    return False
+
+
+def extract_required_literals(pattern: str, flags: int = 0) -> RequiredLiterals | None:
+    """
+    Extracts the literal substrings a regular expression cannot match without.
+    Raises re.error on invalid patterns.
+    :param pattern: Regular expression, as given to `re.compile`.
+    :param flags: Flags, as given to `re.compile`.
+    :return: The required literals, or None if the pattern has no usable required literal.
+    """
+    parsed: _sre_parse.SubPattern = parse_pattern(pattern, flags)
+    literals: frozenset[str] | None = _required(parsed)
+    if not literals:
+        return None
+
+    ignore_case: bool = bool(parsed.state.flags & _re.IGNORECASE) or _ignores_case(parsed)
+    if ignore_case:
+        literals = frozenset(fold(i) for i in literals)
+        # Unicode case folding can change lengths and does not line up with how `re` folds, only trust plain ASCII.
+        if not all(i.isascii() for i in literals):
+            return None
+    return RequiredLiterals(literals, ignore_case)
+
+
+class AhoCorasick:
+    """
+    Multi-pattern substring automaton. Finds which of a fixed set of words occur in a text in one pass over the text.
+    """
+
+    def __init__(self, words: Iterable[str]) -> None:
+        """
+        :param words: Words to search for. Empty strings are ignored.
+        """
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        self._out: list[tuple[str, ...]] = [()]
+
+        # Trie
+        for word in set(words):
+            if not word:
+                continue
+            state: int = 0
+            for char in word:
+                nxt: int | None = self._goto[state].get(char)
+                if nxt is None:
+                    nxt = len(self._goto)
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._out.append(())
+                    self._goto[state][char] = nxt
+                state = nxt
+            self._out[state] = (word,)
+
+        # Failure links, breadth-first so every parent link is done before its children.
+        queue: list[int] = list(self._goto[0].values())
+        for state in queue:
+            for char, nxt in self._goto[state].items():
+                queue.append(nxt)
+                fallback: int = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                link: int = self._goto[fallback].get(char, 0)
+                self._fail[nxt] = link if link != nxt else 0
+                self._out[nxt] = self._out[nxt] + self._out[self._fail[nxt]]
+
+    def __len__(self) -> int:
+        """
+        Number of states, including the root.
+        """
+        return len(self._goto)
+
+    def find(self, text: str) -> set[str]:
+        """
+        Finds all words that occur in the given text.
+        """
+        goto: list[dict[str, int]] = self._goto
+        fail: list[int] = self._fail
+        out: list[tuple[str, ...]] = self._out
+
+        found: set[str] = set()
+        state: int = 0
+        for char in text:
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            if out[state]:
+                found.update(out[state])
+        return found
+
+
+class PrefixTrie:
+    """
+    Character trie over a fixed set of words. Finds which of the words a text starts with in one walk down the text.
+    """
+
+    def __init__(self, words: Iterable[str]) -> None:
+        """
+        :param words: Prefixes to search for. Empty strings are ignored.
+        """
+        self._root: dict[str, dict] = {}
+        for word in words:
+            if not word:
+                continue
+            node: dict[str, dict] = self._root
+            for char in word:
+                node = node.setdefault(char, {})
+            node[''] = word  # End marker, the empty key cannot collide with a character.
+
+    def find(self, text: str) -> list[str]:
+        """
+        Finds all words the given text starts with, shortest first.
+        """
+        found: list[str] = []
+        node: dict[str, dict] = self._root
+        for char in text:
+            node = node.get(char)
+            if node is None:
+                break
+            if '' in node:
+                found.append(node[''])
+        return found
@@ -0,0 +1,22 @@
+from __future__ import annotations
+
+import asyncio
+from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from data.interfaces.utilities.executor import DataExecutor
+
+
+class CacheMaintenanceSource(ABC):
+    """
+    Implemented by data interfaces whose caches expire entries in the background, so the client can keep that running.
+    """
+
+    @abstractmethod
+    def get_cache_task(self, executor: DataExecutor) -> asyncio.Task:
+        """
+        Starts the cache maintenance loop. Call it from the event loop.
+        :param executor: Executor every other call to the interface runs on. Maintenance runs there as well.
+        """
+        pass
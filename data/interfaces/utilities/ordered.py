@@ -0,0 +1,112 @@
+import bisect
+from typing import Generic, Iterable, Iterator, TypeVar
+
+T = TypeVar('T')
+
+_HOLE = object()  # Marks a removed slot.
+
+
+class OrderStatisticIndex(Generic[T]):
+    """
+    Sequence that supports lookup, replacement and removal by position in O(log n), and appending in O(log n).
+    Items live in append-only slots counted by a Fenwick tree; removing an item leaves a hole in its slot.
+    Holes are compacted away once they outnumber the items.
+    """
+    __slots__ = ('_slots', '_tree', '_size')
+
+    def __init__(self, items: Iterable[T] = ()) -> None:
+        self._slots: list = []
+        self._tree: list[int] = [0]  # 1-based; _tree[i] counts the live slots in (i - lowbit(i), i].
+        self._size: int = 0
+        self._rebuild(list(items))
+
+    def _rebuild(self, items: list[T]) -> None:
+        n: int = len(items)
+        tree: list[int] = [0] + [1] * n
+        for i in range(1, n + 1):
+            parent: int = i + (i & -i)
+            if parent <= n:
+                tree[parent] += tree[i]
+        self._slots, self._tree, self._size = items, tree, n
+
+    # region Fenwick
+    def _prefix(self, i: int) -> int:
+        """
+        Number of live slots among the first i.
+        """
+        total: int = 0
+        while i > 0:
+            total += self._tree[i]
+            i -= i & -i
+        return total
+
+    def _slot(self, position: int) -> int:
+        """
+        0-based slot of the live item at the given position.
+        """
+        slot: int = 0
+        remaining: int = position + 1
+        step: int = 1 << (len(self._slots).bit_length() - 1) if self._slots else 0
+        while step:
+            nxt: int = slot + step
+            if nxt <= len(self._slots) and self._tree[nxt] < remaining:
+                slot = nxt
+                remaining -= self._tree[nxt]
+            step >>= 1
+        return slot
+
+    def _position(self, position: int) -> int:
+        if position < 0:
+            position += self._size
+        if not 0 <= position < self._size:
+            raise IndexError('Position out of range')
+        return position
+    # endregion
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __iter__(self) -> Iterator[T]:
+        return (item for item in self._slots if item is not _HOLE)
+
+    def __getitem__(self, position: int) -> T:
+        return self._slots[self._slot(self._position(position))]
+
+    def __setitem__(self, position: int, item: T) -> None:
+        self._slots[self._slot(self._position(position))] = item
+
+    def append(self, item: T) -> None:
+        self._slots.append(item)
+        i: int = len(self._slots)
+        # The new node covers (i - lowbit(i), i]: every slot in there but itself already exists.
+        self._tree.append(1 + self._prefix(i - 1) - self._prefix(i - (i & -i)))
+        self._size += 1
+
+    def pop(self, position: int = -1) -> T:
+        """
+        Removes and returns the item at the given position.
+        """
+        slot: int = self._slot(self._position(position))
+        item: T = self._slots[slot]
+        self._slots[slot] = _HOLE
+        i: int = slot + 1
+        while i < len(self._tree):
+            self._tree[i] -= 1
+            i += i & -i
+        self._size -= 1
+
+        if len(self._slots) - self._size > max(self._size, 32):
+            self._rebuild(list(self))
+        return item
+
+    def insort(self, item: T) -> None:
+        """
+        Inserts into an index kept in sorted order. O(log n) if the item sorts last, which new items usually do, but
+        O(n) otherwise.
+        """
+        if not self._size or not item < self[-1]:
+            self.append(item)
+        else:
+            items: list[T] = list(self)
+            bisect.insort(items, item)
+            self._rebuild(items)
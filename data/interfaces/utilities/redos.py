@@ -0,0 +1,294 @@
+# noinspection PyProtectedMember
+from re._constants import LITERAL, NOT_LITERAL, ANY, IN, RANGE, CATEGORY, CATEGORY_DIGIT, CATEGORY_WORD, \
+    CATEGORY_SPACE, BRANCH, SUBPATTERN, ATOMIC_GROUP, MAX_REPEAT, MIN_REPEAT, POSSESSIVE_REPEAT, MAXREPEAT, AT, \
+    ASSERT, ASSERT_NOT
+from typing import Literal, TypeAlias, Iterable, Iterator
+
+from data.interfaces.utilities.literals import parse_pattern
+
+risk_levels: TypeAlias = Literal['safe', 'polynomial', 'exponential']
+
+# Repeats bounded above this are treated as unbounded; {1,1000} backtracks just as badly as +.
+_UNBOUNDED_FROM: int = 64
+_CATEGORIES: dict[int, str] = {CATEGORY_DIGIT: 'digit', CATEGORY_WORD: 'word', CATEGORY_SPACE: 'space'}
+_CATEGORY_OVERLAP: dict[str, set[str]] = {'digit': {'digit', 'word'}, 'word': {'digit', 'word'}, 'space': {'space'}}
+
+
+class _CharSet:
+    """
+    Over-approximation of the characters a piece of pattern can consume.
+    """
+    __slots__ = ('chars', 'categories', 'anything')
+
+    def __init__(self, chars: Iterable[str] = (), categories: Iterable[str] = (), anything: bool = False) -> None:
+        self.chars: frozenset[str] = frozenset(chars)
+        self.categories: frozenset[str] = frozenset(categories)
+        self.anything: bool = anything
+
+    def __bool__(self) -> bool:
+        return self.anything or bool(self.chars) or bool(self.categories)
+
+    def __or__(self, other: '_CharSet') -> '_CharSet':
+        return _CharSet(self.chars | other.chars, self.categories | other.categories, self.anything or other.anything)
+
+    @staticmethod
+    def _in_category(char: str, category: str) -> bool:
+        match category:
+            case 'digit':
+                return char.isdigit()
+            case 'word':
+                return char.isalnum() or char == '_'
+            case 'space':
+                return char.isspace()
+        return True
+
+    def overlaps(self, other: '_CharSet') -> bool:
+        if not self or not other:
+            return False
+        if self.anything or other.anything or self.chars & other.chars:
+            return True
+        if any(self._in_category(c, cat) for c in self.chars for cat in other.categories):
+            return True
+        if any(self._in_category(c, cat) for c in other.chars for cat in self.categories):
+            return True
+        return any(other.categories & _CATEGORY_OVERLAP[cat] for cat in self.categories)
+
+
+_ANYTHING: _CharSet = _CharSet(anything=True)
+_NOTHING: _CharSet = _CharSet()
+
+
+class RegexRisk:
+    """
+    Result of a backtracking risk analysis on a single pattern.
+    """
+    __slots__ = ('level', 'degree', 'reasons', 'backtracks')
+
+    def __init__(self, level: risk_levels, degree: int, reasons: list[str], backtracks: bool = True) -> None:
+        """
+        :param level: `exponential` patterns can take forever on short input, `polynomial` ones slow down on long input.
+        :param degree: Polynomial degree of the worst-case run time in the input length. Meaningless for exponential.
+        :param reasons: Human-readable description of every issue found.
+        :param backtracks: Whether the pattern has any choice point at all. Patterns without one never backtrack, so
+        their run time is known without trusting the rest of the analysis.
+        """
+        self.level: risk_levels = level
+        self.degree: int = degree
+        self.reasons: list[str] = reasons
+        self.backtracks: bool = backtracks
+
+
+def _flatten(items: Iterable[tuple]) -> Iterator[tuple]:
+    # Capturing and flag groups do not change backtracking, so inline them.
+    for op, av in items:
+        if op is SUBPATTERN:
+            yield from _flatten(av[-1])
+        else:
+            yield op, av
+
+
+def _is_unbounded(op, av) -> bool:
+    # Possessive repeats never give characters back, so they cannot backtrack.
+    return op in (MAX_REPEAT, MIN_REPEAT) and (av[1] is MAXREPEAT or av[1] > _UNBOUNDED_FROM)
+
+
+def _is_iterated(op, av) -> bool:
+    """
+    Does the element repeat a body that can match in more than one way? Every way is then tried again on every
+    iteration, so a bound on the iterations only caps the exponent: (a{1,50}){1,50} is as bad as (a+)+.
+    """
+    return op in (MAX_REPEAT, MIN_REPEAT) and av[1] > 1 and any(_is_variable(*i) for i in av[2])
+
+
+def _backtracks(items: Iterable[tuple]) -> bool:
+    """
+    Do the given items have a choice point, anywhere? Only chains of characters, classes and anchors do not, nor do
+    lookarounds and fixed repeats of such chains.
+    """
+    for op, av in _flatten(items):
+        if op in (LITERAL, NOT_LITERAL, ANY, IN, AT):
+            continue
+        if op in (ASSERT, ASSERT_NOT) and not _backtracks(av[1]):
+            continue
+        if op in (MAX_REPEAT, MIN_REPEAT, POSSESSIVE_REPEAT) and av[0] == av[1] and not _backtracks(av[2]):
+            continue
+        return True
+    return False
+
+
+def _min_width(op, av) -> int:
+    if op in (LITERAL, NOT_LITERAL, ANY, IN):
+        return 1
+    if op is SUBPATTERN:
+        return sum(_min_width(*i) for i in av[-1])
+    if op is ATOMIC_GROUP:
+        return sum(_min_width(*i) for i in av)
+    if op is BRANCH:
+        return min(sum(_min_width(*i) for i in b) for b in av[1])
+    if op in (MAX_REPEAT, MIN_REPEAT, POSSESSIVE_REPEAT):
+        return av[0] * sum(_min_width(*i) for i in av[2])
+    return 0  # Anchors, lookarounds, backreferences.
+
+
+def _in_chars(av: list[tuple]) -> _CharSet:
+    chars: set[str] = set()
+    categories: set[str] = set()
+    for op, value in av:
+        if op is LITERAL:
+            chars.add(chr(value))
+        elif op is RANGE and value[1] - value[0] <= 256:
+            chars.update(chr(i) for i in range(value[0], value[1] + 1))
+        elif op is CATEGORY and value in _CATEGORIES:
+            categories.add(_CATEGORIES[value])
+        else:
+            return _ANYTHING  # Negations, wide ranges, negated categories.
+    return _CharSet(chars, categories)
+
+
+def _chars(items: Iterable[tuple]) -> _CharSet:
+    """
+    All characters the given items can consume, anywhere.
+    """
+    out: _CharSet = _NOTHING
+    for op, av in items:
+        if op is LITERAL:
+            out = out | _CharSet((chr(av),))
+        elif op is IN:
+            out = out | _in_chars(av)
+        elif op in (NOT_LITERAL, ANY):
+            return _ANYTHING
+        elif op is SUBPATTERN:
+            out = out | _chars(av[-1])
+        elif op is ATOMIC_GROUP:
+            out = out | _chars(av)
+        elif op is BRANCH:
+            for b in av[1]:
+                out = out | _chars(b)
+        elif op in (MAX_REPEAT, MIN_REPEAT, POSSESSIVE_REPEAT):
+            out = out | _chars(av[2])
+        elif op in (AT, ASSERT, ASSERT_NOT):
+            continue
+        else:
+            return _ANYTHING  # Backreferences and conditionals can repeat anything.
+    return out
+
+
+def _first(items: Iterable[tuple]) -> _CharSet:
+    """
+    Characters the given items can start with.
+    """
+    out: _CharSet = _NOTHING
+    for op, av in _flatten(items):
+        if op is BRANCH:
+            for b in av[1]:
+                out = out | _first(b)
+        elif op in (MAX_REPEAT, MIN_REPEAT, POSSESSIVE_REPEAT):
+            out = out | _first(av[2])
+        elif op is ATOMIC_GROUP:
+            out = out | _first(av)
+        else:
+            out = out | _chars([(op, av)])
+        if _min_width(op, av):
+            break
+    return out
+
+
+def _is_variable(op, av) -> bool:
+    """
+    Can the element match strings of different lengths, in a way that can be backtracked into?
+    """
+    if op is SUBPATTERN:
+        return any(_is_variable(*i) for i in av[-1])
+    if op is BRANCH:
+        if any(_is_variable(*i) for b in av[1] for i in b):
+            return True
+        return len({sum(_min_width(*i) for i in b) for b in av[1]}) > 1
+    if op in (MAX_REPEAT, MIN_REPEAT):
+        return av[0] != av[1] or any(_is_variable(*i) for i in av[2])
+    if op in (LITERAL, NOT_LITERAL, ANY, IN, AT, ASSERT, ASSERT_NOT, ATOMIC_GROUP, POSSESSIVE_REPEAT):
+        return False  # Atomic groups and possessive repeats never give characters back.
+    return True  # Backreferences and conditionals.
+
+
+def _check_repeat_body(body: list[tuple], reasons: list[str]) -> None:
+    """
+    Looks for ambiguity inside the body of an unbounded repeat, which makes the number of ways to split the input over
+    its iterations grow exponentially.
+    """
+    flat: list[tuple] = list(_flatten(body))
+
+    for position, (op, av) in enumerate(flat):
+        if op is BRANCH:
+            firsts: list[_CharSet] = [_first(b) for b in av[1]]
+            if any(firsts[i].overlaps(firsts[j]) for i in range(len(firsts)) for j in range(i + 1, len(firsts))):
+                reasons.append('repeated alternation whose branches can match the same text')
+                return
+
+        if not _is_variable(op, av):
+            continue
+        variable_chars: _CharSet = _chars([(op, av)])
+        # A mandatory element the variable part cannot consume pins down where each iteration ends.
+        separated: bool = any(
+            _min_width(o, a) and not _chars([(o, a)]).overlaps(variable_chars)
+            for i, (o, a) in enumerate(flat) if i != position
+        )
+        if not separated:
+            reasons.append('nested quantifiers without a separator between iterations')
+            return
+
+
+def _sequence_degree(items: Iterable[tuple], reasons: list[str]) -> int:
+    """
+    Length of the longest chain of unbounded repeats that can trade characters with each other.
+    Each extra link multiplies the number of ways to split the input by its length.
+    """
+    degree: int = 0
+    chain: int = 0
+    chain_chars: _CharSet = _NOTHING
+
+    for op, av in _flatten(items):
+        if op is BRANCH:
+            for b in av[1]:
+                degree = max(degree, _sequence_degree(b, reasons))
+        elif op is ATOMIC_GROUP:
+            degree = max(degree, _sequence_degree(av, reasons))
+        elif op in (ASSERT, ASSERT_NOT):
+            degree = max(degree, _sequence_degree(av[1], reasons))  # Zero-width, but backtracks all the same.
+        elif op in (MAX_REPEAT, MIN_REPEAT, POSSESSIVE_REPEAT):
+            inner: int = _sequence_degree(av[2], reasons)
+            # Each bounded iteration brings its own chain along: (.*a){12} is a chain of twelve.
+            degree = max(degree, inner * av[1] if av[1] is not MAXREPEAT and av[1] > 1 else inner)
+
+        if _is_iterated(op, av) or _is_unbounded(op, av):
+            _check_repeat_body(av[2], reasons)
+        if _is_unbounded(op, av):
+            body: _CharSet = _chars(av[2])
+            chain = chain + 1 if body.overlaps(chain_chars) else 1
+            chain_chars = body
+            degree = max(degree, chain)
+        elif _min_width(op, av) and not _chars([(op, av)]).overlaps(chain_chars):
+            chain, chain_chars = 0, _NOTHING  # Separator
+    return degree
+
+
+def analyze_pattern(pattern: str, flags: int = 0) -> RegexRisk:
+    """
+    Estimates how badly a pattern can backtrack, from its parse tree.
+    The analysis is conservative: it may call a harmless pattern risky, it should not call a harmful one safe.
+    Raises re.error on invalid patterns.
+    :param pattern: Regular expression, as given to `re.compile`.
+    :param flags: Flags, as given to `re.compile`.
+    """
+    parsed = parse_pattern(pattern, flags)
+    reasons: list[str] = []
+    degree: int = _sequence_degree(parsed, reasons)
+
+    backtracks: bool = _backtracks(parsed)
+
+    if reasons:
+        return RegexRisk('exponential', degree, reasons, backtracks)
+    if degree >= 2:
+        return RegexRisk('polynomial', degree, [f'{degree} repeats that can match the same text in a row'],
+                         backtracks)
+    return RegexRisk('safe', degree, [], backtracks)
+
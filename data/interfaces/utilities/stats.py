@@ -0,0 +1,15 @@
+from abc import ABC, abstractmethod
+
+
+class CacheStatsSource(ABC):
+    """
+    Implemented by data interfaces that cache, so the client can report how well their caches do.
+    """
+
+    @abstractmethod
+    def get_cache_stats(self) -> dict[str, dict[str, int | float | None]]:
+        """
+        Not thread-safe; call it on the data executor.
+        :return: Counters and size per tracked subtree, keyed by its path ('ROOT/...'). JSON serializable.
+        """
+        pass
@@ -0,0 +1,325 @@
+from __future__ import annotations
+
+import random as _r
+import re as _re
+from typing import Callable, TYPE_CHECKING
+
+from data.interfaces.autoreplies import SimpleAliasData, SimpleTriggerData
+from data.interfaces.utilities.literals import AhoCorasick, PrefixTrie, RequiredLiterals, extract_required_literals, \
+    fold
+from data.interfaces.utilities.redos import RegexRisk, analyze_pattern
+
+if TYPE_CHECKING:
+    from utilities.regex_sandbox import RegexSandbox
+
+_WORD: _re.Pattern = _re.compile(r'\w+')
+
+# Polynomial patterns of at least this degree are always evaluated in the sandbox.
+SANDBOX_DEGREE: int = 3
+# Content length from which any polynomial pattern is evaluated in the sandbox.
+SANDBOX_LONG_INPUT: int = 500
+
+
+def tokenize(content: str) -> list[str]:
+    """
+    Splits content into the words `word` triggers match against.
+    """
+    return _WORD.findall(content)
+
+
+def _compile(trigger: SimpleTriggerData) -> tuple[_re.Pattern | str | tuple[str, ...], RegexRisk | None]:
+    if trigger.type == 'regex':
+        pattern: _re.Pattern = _re.compile(trigger.data, _re.IGNORECASE if trigger.case_insensitive else 0)
+        risk: RegexRisk = analyze_pattern(pattern.pattern, pattern.flags)
+        if risk.level == 'exponential':
+            raise ValueError(f'Pattern can backtrack catastrophically: {'; '.join(risk.reasons)}')
+        return pattern, risk
+    if trigger.type not in ('literal', 'word', 'prefix', 'exact'):
+        raise TypeError(f'Trigger of invalid type **{trigger.type}**')
+
+    data: str = fold(trigger.data) if trigger.case_insensitive else trigger.data
+    if not data:
+        raise ValueError(f'Trigger of type **{trigger.type}** cannot be empty')
+    if trigger.type == 'word':
+        words: tuple[str, ...] = tuple(tokenize(data))
+        if not words:
+            raise ValueError('Trigger of type **word** needs at least one word character')
+        return words, None
+    return data, None
+
+
+def compile_trigger(trigger: SimpleTriggerData) -> _re.Pattern | str | tuple[str, ...]:
+    """
+    Compiles trigger data into the key its type is matched with.
+    Raises re.error on invalid patterns, ValueError on data that cannot match anything or on patterns that can
+    backtrack catastrophically, and TypeError on unsupported trigger types.
+    :return: A compiled pattern for `regex`, the word tuple for `word`, or the (folded) data for the other types.
+    """
+    return _compile(trigger)[0]
+
+
+def _contains_run(haystack: list[str], needle: tuple[str, ...]) -> bool:
+    size: int = len(needle)
+    return any(tuple(haystack[i:i + size]) == needle
+               for i, word in enumerate(haystack) if word == needle[0])
+
+
+class CompiledTrigger:
+    """
+    A single trigger, compiled and bound to the rate it resolves to.
+    """
+    __slots__ = ('alias', 'trigger', 'rate', 'key', 'pattern', 'risk', 'required')
+
+    def __init__(self, alias: SimpleAliasData, trigger: SimpleTriggerData,
+                 key: _re.Pattern | str | tuple[str, ...], risk: RegexRisk | None = None) -> None:
+        """
+        :param alias: Alias the trigger belongs to.
+        :param trigger: Raw trigger data the key was compiled from.
+        :param key: Compiled trigger, as given by `compile_trigger`.
+        :param risk: Backtracking analysis of the pattern, if already known. Only used for `regex`.
+        """
+        self.alias: SimpleAliasData = alias
+        self.trigger: SimpleTriggerData = trigger
+        self.rate: int = trigger.rate if trigger.rate else alias.rate
+        self.key: _re.Pattern | str | tuple[str, ...] = key
+        self.pattern: _re.Pattern | None = key if trigger.type == 'regex' else None
+        if self.pattern is not None and risk is None:
+            risk = analyze_pattern(key.pattern, key.flags)
+        self.risk: RegexRisk | None = risk
+        self.required: RequiredLiterals | None = extract_required_literals(key.pattern, key.flags) \
+            if self.pattern is not None else None
+
+    def needs_sandbox(self, content: str) -> bool:
+        """
+        Is this trigger too risky to evaluate on the event loop for the given content?
+        Patterns without a choice point and safe patterns never are. Polynomial patterns are from `SANDBOX_DEGREE` on,
+        or on content of at least `SANDBOX_LONG_INPUT` characters.
+        """
+        if self.risk is None or not self.risk.backtracks or self.risk.level == 'safe':
+            return False
+        return self.risk.degree >= SANDBOX_DEGREE or len(content) >= SANDBOX_LONG_INPUT
+
+    def matches(self, content: str, folded: str | None = None) -> bool:
+        """
+        Evaluates the trigger on its own against the given content.
+        :param content: Raw message content.
+        :param folded: `fold(content)`, if already known.
+        """
+        if self.pattern is not None:
+            return self.pattern.match(content) is not None
+
+        if self.trigger.case_insensitive:
+            content = folded if folded is not None else fold(content)
+        match self.trigger.type:
+            case 'literal':
+                return self.key in content
+            case 'prefix':
+                return content.startswith(self.key)
+            case 'exact':
+                return content == self.key
+            case 'word':
+                return _contains_run(tokenize(content), self.key)
+        return False
+
+
+class TriggerMatcher:
+    """
+    Immutable, compiled snapshot of the trigger pool.
+    Build one whenever aliases or triggers change, then reuse it for every message.
+
+    Each pattern's required literals are indexed in a substring automaton, so a message only pays for the regexes
+    whose literals it actually contains. Patterns without a required literal are always evaluated.
+    Non-regex triggers never touch `re`: they are looked up in hash maps (`exact`, `word`), a trie (`prefix`) or the
+    same automaton (`literal`).
+
+    Patterns that can backtrack catastrophically are rejected. Patterns that can slow down polynomially are evaluated
+    in a `RegexSandbox` by `match_async` once their degree or the content length gets too high; `match` evaluates
+    everything in-process and is meant for trusted pools.
+    """
+
+    def __init__(self, triggers_by_alias: dict[SimpleAliasData, list[SimpleTriggerData]],
+                 prefilter: bool = True) -> None:
+        """
+        Compiles every trigger in the given pool.
+        Triggers that fail to compile or that fail the backtracking analysis are left out and kept in `rejected`, so one
+        bad trigger cannot take down the rest.
+        Raises TypeError on unsupported trigger types.
+        :param triggers_by_alias: Trigger pool, as given by `TextAutoreplyInterface.get_triggers_by_alias`.
+        :param prefilter: If False, skips the indexes and evaluates every trigger. Meant for comparison only.
+        """
+        self.rejected: list[tuple[SimpleAliasData, SimpleTriggerData, _re.error | ValueError]] = []
+
+        # Flattened per alias, in pool order. Outer order decides output order.
+        self._aliases: list[tuple[SimpleAliasData, tuple[CompiledTrigger, ...]]] = []
+        # Flat trigger positions, in pool order, so sorted candidates come out in pool order too.
+        self._flat: list[tuple[int, CompiledTrigger]] = []
+        self._size: int = 0
+
+        for alias, triggers in triggers_by_alias.items():
+            compiled: list[CompiledTrigger] = []
+            for trigger in triggers:
+                try:
+                    key, risk = _compile(trigger)
+                except (_re.error, ValueError) as e:
+                    self.rejected.append((alias, trigger, e))
+                    continue
+                compiled.append(CompiledTrigger(alias, trigger, key, risk))
+            if compiled:
+                self._flat.extend((len(self._aliases), trigger) for trigger in compiled)
+                self._aliases.append((alias, tuple(compiled)))
+                self._size += len(compiled)
+
+        self.prefilter: bool = prefilter
+        if prefilter:
+            self._build_index()
+
+    def _build_index(self) -> None:
+        self._always: set[int] = set()
+
+        # Indexes come in pairs; the second one holds case-insensitive triggers and is searched with folded content.
+        self._by_literal: tuple[dict[str, list[int]], dict[str, list[int]]] = ({}, {})
+        self._by_prefix: tuple[dict[str, list[int]], dict[str, list[int]]] = ({}, {})
+        self._by_exact: tuple[dict[str, list[int]], dict[str, list[int]]] = ({}, {})
+        self._by_word: tuple[dict[str, list[int]], dict[str, list[int]]] = ({}, {})  # By first word
+
+        for position, (_, trigger) in enumerate(self._flat):
+            if trigger.pattern is not None:
+                required: RequiredLiterals | None = trigger.required
+                if required is None:
+                    self._always.add(position)
+                    continue
+                for literal in required.literals:
+                    self._by_literal[required.ignore_case].setdefault(literal, []).append(position)
+                continue
+
+            folded: bool = trigger.trigger.case_insensitive
+            match trigger.trigger.type:
+                case 'literal':
+                    self._by_literal[folded].setdefault(trigger.key, []).append(position)
+                case 'prefix':
+                    self._by_prefix[folded].setdefault(trigger.key, []).append(position)
+                case 'exact':
+                    self._by_exact[folded].setdefault(trigger.key, []).append(position)
+                case 'word':
+                    self._by_word[folded].setdefault(trigger.key[0], []).append(position)
+
+        self._literals: tuple[AhoCorasick | None, ...] = tuple(AhoCorasick(i) if i else None
+                                                               for i in self._by_literal)
+        self._prefixes: tuple[PrefixTrie | None, ...] = tuple(PrefixTrie(i) if i else None for i in self._by_prefix)
+        self._needs_fold: bool = any(i[True] for i in (self._by_literal, self._by_prefix, self._by_exact,
+                                                       self._by_word))
+
+    @property
+    def unfiltered(self) -> int:
+        """
+        Number of triggers without a usable required literal, which are evaluated for every message.
+        """
+        return len(self._always) if self.prefilter else self._size
+
+    def candidates(self, content: str, folded: str | None = None) -> list[int]:
+        """
+        Finds the triggers that could possibly match the given content, based on the indexes.
+        :param content: Raw message content.
+        :param folded: `fold(content)`, if already known.
+        :return: Sorted flat trigger positions.
+        """
+        found: set[int] = set(self._always)
+        texts: list[str] = [content]
+        if self._needs_fold:
+            texts.append(folded if folded is not None else fold(content))
+
+        for case_insensitive, text in enumerate(texts):
+            automaton: AhoCorasick | None = self._literals[case_insensitive]
+            if automaton is not None:
+                for literal in automaton.find(text):
+                    found.update(self._by_literal[case_insensitive][literal])
+
+            trie: PrefixTrie | None = self._prefixes[case_insensitive]
+            if trie is not None:
+                for prefix in trie.find(text):
+                    found.update(self._by_prefix[case_insensitive][prefix])
+
+            found.update(self._by_exact[case_insensitive].get(text, ()))
+
+            by_word: dict[str, list[int]] = self._by_word[case_insensitive]
+            if by_word:
+                for word in set(tokenize(text)):
+                    found.update(by_word.get(word, ()))
+        return sorted(found)
+
+    def __len__(self) -> int:
+        """
+        Number of compiled triggers in the snapshot.
+        """
+        return self._size
+
+    def match(self, content: str, roll: Callable[[int, int], int] = _r.randint) -> list[SimpleAliasData]:
+        """
+        Finds all aliases that fire for the given message content, in a single pass over the snapshot.
+        Each candidate trigger rolls against its rate before being evaluated; an alias fires at most once.
+        :param content: Raw message content.
+        :param roll: Random integer source for rate rolls, in the style of `random.randint`.
+        :return: Firing aliases, in pool order.
+        """
+        if self.prefilter:
+            return self._match_candidates(content, roll)
+
+        firing: list[SimpleAliasData] = []
+        folded: str = fold(content)
+        for alias, triggers in self._aliases:
+            for trigger in triggers:
+                if roll(1, 256) > trigger.rate:
+                    continue
+                if trigger.matches(content, folded):
+                    firing.append(alias)
+                    break  # Prevent repeated entries of same Alias
+        return firing
+
+    def _match_candidates(self, content: str, roll: Callable[[int, int], int]) -> list[SimpleAliasData]:
+        firing: list[SimpleAliasData] = []
+        fired: set[int] = set()
+        folded: str | None = fold(content) if self._needs_fold else None
+        for position in self.candidates(content, folded):
+            alias_pos, trigger = self._flat[position]
+            if alias_pos in fired:
+                continue
+            if roll(1, 256) > trigger.rate:
+                continue
+            if trigger.matches(content, folded):
+                firing.append(trigger.alias)
+                fired.add(alias_pos)  # Prevent repeated entries of same Alias
+        return firing
+
+    async def match_async(self, content: str, sandbox: RegexSandbox,
+                          roll: Callable[[int, int], int] = _r.randint) -> list[SimpleAliasData]:
+        """
+        Same as `match`, but evaluates risky patterns in the given sandbox instead of on the event loop.
+        Patterns the sandbox has quarantined never match.
+        :param content: Raw message content.
+        :param sandbox: Sandbox to evaluate risky patterns in.
+        :param roll: Random integer source for rate rolls, in the style of `random.randint`.
+        :return: Firing aliases, in pool order.
+        """
+        firing: list[SimpleAliasData] = []
+        fired: set[int] = set()
+        if self.prefilter:
+            folded: str | None = fold(content) if self._needs_fold else None
+            positions: list[int] = self.candidates(content, folded)
+        else:
+            folded: str | None = fold(content)
+            positions: range = range(len(self._flat))
+
+        for position in positions:
+            alias_pos, trigger = self._flat[position]
+            if alias_pos in fired:
+                continue
+            if roll(1, 256) > trigger.rate:
+                continue
+            if trigger.needs_sandbox(content):
+                matched: bool = await sandbox.match(trigger.pattern.pattern, trigger.pattern.flags, content)
+            else:
+                matched = trigger.matches(content, folded)
+            if matched:
+                firing.append(trigger.alias)
+                fired.add(alias_pos)  # Prevent repeated entries of same Alias
+        return firing
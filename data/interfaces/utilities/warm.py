@@ -0,0 +1,30 @@
+from abc import ABC, abstractmethod
+
+
+class WarmStartSource(ABC):
+    """
+    Implemented by data interfaces that cache, so their caches survive a restart and can be filled before traffic
+    arrives. None of these are thread-safe; call them on the data executor.
+    """
+
+    @abstractmethod
+    def save_cache_snapshot(self) -> None:
+        """
+        Writes the cache to disk, if a snapshot file was configured.
+        """
+        pass
+
+    @abstractmethod
+    def load_cache_snapshot(self) -> int:
+        """
+        Fills the cache from the last snapshot, if any.
+        :return: Number of entries loaded.
+        """
+        pass
+
+    def warm_cache(self, guild_ids: list[int]) -> None:
+        """
+        Preloads data that is about to be hot. Does nothing unless overridden.
+        :param guild_ids: Guilds the client is in.
+        """
+        pass
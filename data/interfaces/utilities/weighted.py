@@ -0,0 +1,55 @@
+import random as _r
+from typing import Callable, Generic, Sequence, TypeVar
+
+T = TypeVar('T')
+
+
+class AliasTable(Generic[T]):
+    """
+    Walker/Vose alias table over a fixed, weighted pool. Build once in O(n), then pick in O(1).
+    Works on integer weights only, so picks are exact rather than subject to float rounding.
+    """
+    __slots__ = ('items', '_total', '_threshold', '_alias')
+
+    def __init__(self, items: Sequence[T], weights: Sequence[int]) -> None:
+        """
+        Raises ValueError if the pool is empty, the lengths differ or any weight is not positive.
+        :param items: Pool to pick from.
+        :param weights: Relative integer weight of each item.
+        """
+        if not items:
+            raise ValueError('Cannot build an alias table over an empty pool')
+        if len(items) != len(weights):
+            raise ValueError('Every item needs exactly one weight')
+        if any(w < 1 for w in weights):
+            raise ValueError('Weights must be positive')
+
+        self.items: tuple[T, ...] = tuple(items)
+        n: int = len(self.items)
+        self._total: int = sum(weights)
+
+        # Every column holds `total` units: its own item up to the threshold, its alias after.
+        scaled: list[int] = [w * n for w in weights]
+        self._threshold: list[int] = [self._total] * n
+        self._alias: list[int] = list(range(n))
+
+        small: list[int] = [i for i, w in enumerate(scaled) if w < self._total]
+        large: list[int] = [i for i, w in enumerate(scaled) if w >= self._total]
+        while small and large:
+            s, g = small.pop(), large.pop()
+            self._threshold[s] = scaled[s]
+            self._alias[s] = g
+            scaled[g] -= self._total - scaled[s]
+            (small if scaled[g] < self._total else large).append(g)
+        # Leftovers are full columns, up to rounding that integer weights do not have.
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def pick(self, randrange: Callable[[int], int] = _r.randrange) -> T:
+        """
+        Picks an item with probability proportional to its weight.
+        :param randrange: Random integer source in the style of `random.randrange`.
+        """
+        column, offset = divmod(randrange(len(self.items) * self._total), self._total)
+        return self.items[column] if offset < self._threshold[column] else self.items[self._alias[column]]
@@ -12,6 +12,7 @@ CREATE TABLE IF NOT EXISTS LocalFacts (
     AuthorID    INTEGER NOT NULL,
     ModifiedAt  INTEGER NOT NULL,
     CreatedAt   INTEGER NOT NULL,
+    Compiled    BLOB,  -- Compiled form of Text, format versioned by the compiler. NULL if none.
 
     PRIMARY KEY (GuildID, Text)
 ) WITHOUT ROWID;
@@ -24,7 +25,8 @@ CREATE TABLE IF NOT EXISTS GlobalFacts (
     Text        TEXT NOT NULL PRIMARY KEY,
     AuthorID    INTEGER NOT NULL,
     ModifiedAt  INTEGER NOT NULL,
-    CreatedAt   INTEGER NOT NULL
+    CreatedAt   INTEGER NOT NULL,
+    Compiled    BLOB  -- Compiled form of Text, format versioned by the compiler. NULL if none.
 ) WITHOUT ROWID;
 
 CREATE INDEX IF NOT EXISTS idx_globalfacts_creation
@@ -7,10 +7,11 @@ from discord.abc import Messageable
 from discord.app_commands import Choice, Transform
 
 from configuration.global_config import CFG
-from data.interfaces.fact import LocalAdminFactInterface, SimpleFactEditorData
-from data.interfaces.moderation import LocalAdminModerationInterface
+from data.interfaces.asynchronous import AsyncLocalAdminFactInterface, AsyncLocalAdminModerationInterface, \
+    AsyncPreferencesInterface
+from data.interfaces.fact import SimpleFactEditorData
 from data.interfaces.other import LocalAdminDataInterface
-from data.interfaces.pref import GuildChannelPreferenceData, PreferencesInterface, supported_autoreply_features
+from data.interfaces.pref import GuildChannelPreferenceData, supported_autoreply_features
 from discorduser.logger import GlobalLogger
 from discorduser.logger.local import LocalLogger
 from discorduser.user.abstract import BotClient
@@ -27,8 +28,8 @@ from utilities.selection_window import selection_window
 @app_commands.guild_only()
 @app_commands.default_permissions(administrator=True)
 class LocalAdminCog(CustomGroupCog, group_name='admin'):
-    def __init__(self, client: BotClient, fact: LocalAdminFactInterface, mod: LocalAdminModerationInterface,
-                 pref: PreferencesInterface, db: LocalAdminDataInterface, logger: GlobalLogger,
+    def __init__(self, client: BotClient, fact: AsyncLocalAdminFactInterface, mod: AsyncLocalAdminModerationInterface,
+                 pref: AsyncPreferencesInterface, db: LocalAdminDataInterface, logger: GlobalLogger,
                  local_logger: LocalLogger) -> None:
         super().__init__(client)
         self.fact = fact
@@ -38,29 +39,29 @@ class LocalAdminCog(CustomGroupCog, group_name='admin'):
         self.logger = logger
         self.local_logger = local_logger
 
-    def restricted(self, guild_id: int, user_id: int) -> UseRestriction:
+    async def restricted(self, guild_id: int, user_id: int) -> UseRestriction:
         """
         Returns the highest level restriction block on the given user/guild.
         """
-        userban: bool = self.mod.is_banned_user(user_id)
+        userban: bool = await self.mod.is_banned_user(user_id)
         if userban:
             return UseRestriction.USER
-        guildban: bool = self.mod.is_banned_guild(guild_id)
+        guildban: bool = await self.mod.is_banned_guild(guild_id)
         if guildban:
             return UseRestriction.GUILD
         return UseRestriction.NONE
 
-    def user_authorize_check(self, guild_id: int, user_id: int) -> None:
+    async def user_authorize_check(self, guild_id: int, user_id: int) -> None:
         """
         Raises Exception if lacking full access to this command suite.
         This is to be handled by the BotClient's Exception handler.
         Does nothing if the user has access.
         """
-        restrictions: UseRestriction = self.restricted(guild_id, user_id)
+        restrictions: UseRestriction = await self.restricted(guild_id, user_id)
         if restrictions != UseRestriction.NONE:
             raise RestrictedUseException(restrictions)
 
-    def fact_limit_check(self, guild_id: int, text: str, edit: bool = False) -> None:
+    async def fact_limit_check(self, guild_id: int, text: str, edit: bool = False) -> None:
         """
         Checks given input and sees if it can be created as a fact.
         Will raise an Exception if the check fails.
@@ -69,18 +70,18 @@ class LocalAdminCog(CustomGroupCog, group_name='admin'):
         :param edit: If true, ignores fact limit check (considers it as replacing the fact)
         :return: Permission.
         """
-        if self.mod.is_super_server(guild_id):
+        if await self.mod.is_super_server(guild_id):
             return
 
         if len(text) > CFG.FACT_CHAR_LIMIT:
             raise RestrictedUseException(UseRestriction.CHAR_LIMIT)
 
         if not edit:
-            if self.fact.get_fact_count(guild_id) >= CFG.FACT_COUNT_MAXIMUM:
+            if await self.fact.get_fact_count(guild_id) >= CFG.FACT_COUNT_MAXIMUM:
                 raise RestrictedUseException(UseRestriction.FACT_LIMIT)
 
     async def kill_switch_check(self, interaction: Interaction) -> bool:
-        if self.fact.is_killswitch():
+        if await self.fact.is_killswitch():
             await self.client.user_feedback(interaction, title='This feature is currently disabled.', ephemeral=True)
             return False
         return True
@@ -99,12 +100,12 @@ class LocalAdminCog(CustomGroupCog, group_name='admin'):
         if interaction.user.bot:
             raise RestrictedUseException(UseRestriction.USER)
 
-        self.user_authorize_check(guild.id, interaction.user.id)
-        self.fact_limit_check(guild.id, text)
+        await self.user_authorize_check(guild.id, interaction.user.id)
+        await self.fact_limit_check(guild.id, text)
 
         if not await input_test(self.client, interaction, text, ephemeral):
             return
-        self.fact.create_fact(guild.id, interaction.user.id, text)
+        await self.fact.create_fact(guild.id, interaction.user.id, text)
 
         await self.logger.local_fact_create(guild, interaction, text)
         await self.local_logger.fact_create(interaction, text)
@@ -125,13 +126,13 @@ class LocalAdminCog(CustomGroupCog, group_name='admin'):
         # Always instance available as this is a guild_only command.
         # noinspection bad-assignment
         guild: Guild = interaction.guild
-        self.user_authorize_check(guild.id, interaction.user.id)
-        self.fact_limit_check(guild.id, text, edit=True)
+        await self.user_authorize_check(guild.id, interaction.user.id)
+        await self.fact_limit_check(guild.id, text, edit=True)
 
         if not await input_test(self.client, interaction, text, ephemeral):
             return
         try:
-            old: SimpleFactEditorData = self.fact.edit_fact(guild.id, index, text, interaction.user.id)
+            old: SimpleFactEditorData = await self.fact.edit_fact(guild.id, index, text, interaction.user.id)
         except IndexError:
             await self.client.user_feedback(interaction, title='Index is out of range.', ephemeral=ephemeral)
             return
@@ -154,7 +155,7 @@ class LocalAdminCog(CustomGroupCog, group_name='admin'):
         # noinspection bad-assignment
         guild: Guild = interaction.guild
         try:
-            old: SimpleFactEditorData = self.fact.delete_fact(guild.id, index)
+            old: SimpleFactEditorData = await self.fact.delete_fact(guild.id, index)
         except IndexError:
             await self.client.user_feedback(interaction, title='Index is out of range.', ephemeral=ephemeral)
             return
@@ -230,7 +231,7 @@ class LocalAdminCog(CustomGroupCog, group_name='admin'):
         # noinspection bad-assignment
         guild: Guild = interaction.guild
 
-        local_facts: list[SimpleFactEditorData] = self.fact.get_local_facts(guild.id)
+        local_facts: list[SimpleFactEditorData] = await self.fact.get_local_facts(guild.id)
         if not local_facts:
             await self.client.user_feedback(interaction, ephemeral=ephemeral, title='Local Facts',
                                             desc='There are no local facts. Go add some!')
@@ -297,7 +298,7 @@ class LocalAdminCog(CustomGroupCog, group_name='admin'):
         guild_id: int = interaction.guild_id
 
         channel_id: int | None = interaction.channel_id if here else None
-        pref: GuildChannelPreferenceData = self.pref.guild_channel_autoreplies_enabled(guild_id, channel_id)
+        pref: GuildChannelPreferenceData = await self.pref.guild_channel_autoreplies_enabled(guild_id, channel_id)
         desc: str = 'Preferences for ' + (f'<#{channel_id}>' if channel_id else '**Server-wide override**') + '\n'
         if not (numbers or letters or text or saying):
             await self.client.user_feedback(interaction, title=desc.removesuffix('\n'),
@@ -329,7 +330,7 @@ class LocalAdminCog(CustomGroupCog, group_name='admin'):
             raise RuntimeError('Set of selected features is 0 even though some feature was selected.')
 
         # todo: return updated data and then use that to save a DB call.
-        self.pref.toggle_autoreply_feature(guild_id, channel_id, feat)
+        await self.pref.toggle_autoreply_feature(guild_id, channel_id, feat)
         await self.local_logger.set_channel_preferences(interaction, channel, pref)
 
         desc = desc.removesuffix('\n')
@@ -381,7 +382,7 @@ class LocalAdminCog(CustomGroupCog, group_name='admin'):
         # noinspection bad-assignment
         guild: Guild = interaction.guild
 
-        self.pref.pause_all_in_channel(guild.id, interaction.channel_id, CFG.CHANNEL_PAUSE_DURATION)
+        await self.pref.pause_all_in_channel(guild.id, interaction.channel_id, CFG.CHANNEL_PAUSE_DURATION)
         await self.client.user_feedback(interaction, ephemeral=ephemeral, title='Features paused',
                                         desc=f'Features put on pause for another {CFG.CHANNEL_PAUSE_DURATION} seconds.')
 
@@ -393,7 +394,7 @@ class LocalAdminCog(CustomGroupCog, group_name='admin'):
         # noinspection bad-assignment
         guild: Guild = interaction.guild
 
-        facts: list[SimpleFactEditorData] = self.fact.get_local_facts(guild.id)
+        facts: list[SimpleFactEditorData] = await self.fact.get_local_facts(guild.id)
         if not facts:
             return [Choice[int](name='No local facts', value=-1)]
 
@@ -4,16 +4,19 @@ import random
 from discord import app_commands, Interaction, Message, InteractionResponded
 from discord.ext import commands
 
-from data.interfaces.saying import SayingInterface
+from data.interfaces.asynchronous import AsyncSayingInterface
+from discorduser.cogs.regular.dispatch import MessageHandler, MessageContext
 from discorduser.user.abstract import BotClient
-from piss.old import Instruction, parse_variables
+from piss.old import Instruction
 from piss.old.instructionexecutor import InstructionExecutor
 
 _ask_command_name: str = 'ask'
 
 @app_commands.guild_only()
-class AskPatrick(commands.Cog):
-    def __init__(self, client: BotClient, saying: SayingInterface) -> None:
+class AskPatrick(commands.Cog, MessageHandler):
+    guild_only = False  # Asking works anywhere the bot can read.
+
+    def __init__(self, client: BotClient, saying: AsyncSayingInterface) -> None:
         self.client = client
         self.saying = saying
 
@@ -22,11 +25,10 @@ class AskPatrick(commands.Cog):
     async def ask_patrick_command(self, interaction: Interaction, question: str):
         await self.ask_patrick(interaction, question)
 
-    @commands.Cog.listener("on_message")
-    async def ask_patrick_listener(self, message: Message):
+    async def handle_message(self, context: MessageContext) -> None:
         # noinspection unresolved-references
         # Id is available at this moment in runtime.
-        if not message.content.lower().startswith(f"ask <@{self.client.user.id}>"):
+        if not context.lower.startswith(f"ask <@{self.client.user.id}>"):
             return
         """
         try:
@@ -44,10 +46,10 @@ class AskPatrick(commands.Cog):
 
         # How to decide here?
         """
-        split_content = message.content.split()
+        split_content = context.content.split()
         if len(split_content) < 3:
             return  # Ignore if no question asked.
-        await self.ask_patrick(message, " ".join(split_content[3:]))
+        await self.ask_patrick(context.message, " ".join(split_content[3:]))
 
     async def ask_patrick(self, message: Message | Interaction, question: str):
         async def ask_reply(replyable: Message | Interaction, content: str,
@@ -84,8 +86,8 @@ class AskPatrick(commands.Cog):
         elif number <= 901:
             await ask_reply(message, "No")
         elif number <= 951:
-            saying: str = self.saying.get_saying()
-            parsed: list[Instruction] = parse_variables(saying)
+            saying, compiled = await self.saying.get_compiled_saying()
+            parsed: list[Instruction] = self.client.parse_cache.load(saying, compiled)
             executor: InstructionExecutor = InstructionExecutor(self.client)
             executor.fresh = False if isinstance(message, Message) else True # So we can reply to it if it is a message.
             await executor.run(parsed, message)
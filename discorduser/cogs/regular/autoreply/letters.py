@@ -1,8 +1,7 @@
-import discord
 from discord import app_commands
 from discord.ext import commands
 
-from data.interfaces.pref import PreferencesInterface
+from discorduser.cogs.regular.dispatch import MessageHandler, MessageContext
 from discorduser.user.abstract import BotClient
 
 _letterdict = {"a": "b", "b": "c", "c": "d",
@@ -16,35 +15,22 @@ _letterdict = {"a": "b", "b": "c", "c": "d",
                "y": "z", "z": "a"}
 
 @app_commands.guild_only()
-class LetterAutoreplyCog(commands.Cog):
-    def __init__(self, client: BotClient, pref: PreferencesInterface) -> None:
+class LetterAutoreplyCog(commands.Cog, MessageHandler):
+    def __init__(self, client: BotClient) -> None:
         self.client = client
-        self.pref = pref
 
-    @commands.Cog.listener("on_message")
-    async def letter_only_replies(self, message: discord.Message):
-        if not message.guild:
+    async def handle_message(self, context: MessageContext) -> None:
+        if len(context.content) != 1:
             return
 
-        if message.author.bot:
+        if context.lower not in _letterdict.keys():
             return
 
-        if len(message.content) != 1:
+        if not await context.autoreply_enabled('letter'):
             return
 
-        if message.content.lower() not in _letterdict.keys():
-            return
-
-        if self.pref.is_paused_channel(message.guild.id, message.channel.id):
-            return
-        if not self.pref.is_user_autoreply_enabled(message.author.id, 'letter'):
-            return
-
-        if not self.pref.is_autoreply_enabled(message.guild.id, message.channel.id, 'letter'):
-            return
-
-        letter: str = _letterdict[message.content.lower()]
-        if message.content.isupper():
+        letter: str = _letterdict[context.lower]
+        if context.content.isupper():
             letter = letter.upper()
 
-        await message.reply(mention_author=False, content=letter)
+        await context.message.reply(mention_author=False, content=letter)
@@ -1,29 +1,16 @@
-import discord
 from discord import app_commands
 from discord.ext import commands
 
-from data.interfaces.pref import PreferencesInterface
+from discorduser.cogs.regular.dispatch import MessageHandler, MessageContext
 from discorduser.user.abstract import BotClient
 
 @app_commands.guild_only()
-class NumberAutoreplyCog(commands.Cog):
-    def __init__(self, client: BotClient, pref: PreferencesInterface) -> None:
+class NumberAutoreplyCog(commands.Cog, MessageHandler):
+    def __init__(self, client: BotClient) -> None:
         self.client = client
-        self.pref = pref
 
-    @commands.Cog.listener("on_message")
-    async def number_only_replies(self, message: discord.Message):
-        if not message.guild:
-            return
-
-        if message.author.bot:
-            return
-
-        if self.pref.is_paused_channel(message.guild.id, message.channel.id):
-            return
-        if not self.pref.is_user_autoreply_enabled(message.author.id, 'number'):
-            return
-        if not self.pref.is_autoreply_enabled(message.guild.id, message.channel.id, 'number'):
+    async def handle_message(self, context: MessageContext) -> None:
+        if not await context.autoreply_enabled('number'):
             return
 
         # Todo: optimizable / improvable
@@ -31,7 +18,7 @@ class NumberAutoreplyCog(commands.Cog):
 
         # todo: fixme;; 1231087891741,100009908 -> 1231087891742.1
         # Solution: cast to int, lose floating point, remove that as the prefix, keep the remainder, append that at the end.
-        txt: str = message.content
+        txt: str = context.content
         try:
             num: float = float(txt)
         except ValueError:
@@ -46,4 +33,4 @@ class NumberAutoreplyCog(commands.Cog):
         num += 1
 
         txt = str(num)
-        await message.reply(txt, mention_author=False)
+        await context.message.reply(txt, mention_author=False)
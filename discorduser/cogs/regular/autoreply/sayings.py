@@ -1,42 +1,29 @@
 import random as _r
 
-import discord
 from discord import app_commands
 from discord.ext import commands
 
 from configuration.global_config import CFG
-from data.interfaces.pref import PreferencesInterface
-from data.interfaces.saying import SayingInterface
+from data.interfaces.asynchronous import AsyncSayingInterface
+from discorduser.cogs.regular.dispatch import MessageHandler, MessageContext
 from discorduser.user.abstract import BotClient
-from piss.old import Instruction, parse_variables
+from piss.old import Instruction
 from piss.old.instructionexecutor import InstructionExecutor
 
 @app_commands.guild_only()
-class RandomAutoreplyCog(commands.Cog):
-    def __init__(self, client: BotClient, say: SayingInterface, pref: PreferencesInterface) -> None:
+class RandomAutoreplyCog(commands.Cog, MessageHandler):
+    def __init__(self, client: BotClient, say: AsyncSayingInterface) -> None:
         self.client = client
         self.say = say
-        self.pref = pref
-
-    @commands.Cog.listener("on_message")
-    async def random_saying_replies(self,
-                                    message: discord.Message):  # todo: rename 'saying', like what the fuck is this dude.
-        if not message.guild:
-            return
-
-        if message.author.bot:
-            return
 
+    async def handle_message(self, context: MessageContext) -> None:  # todo: rename 'saying', like what the fuck is this dude.
         if _r.randint(1, CFG.SAYING_PROBABILITY) != 1:
             return
 
-        if self.pref.is_paused_channel(message.guild.id, message.channel.id):
-            return
-
-        if not self.pref.is_autoreply_enabled(message.guild.id, message.channel.id, 'saying'):
+        if not await context.autoreply_enabled('saying', check_user=False):
             return
 
-        line_raw: str = self.say.get_saying()
-        line: list[Instruction] = parse_variables(line_raw)
+        line_raw, compiled = await self.say.get_compiled_saying()
+        line: list[Instruction] = self.client.parse_cache.load(line_raw, compiled)
         executor: InstructionExecutor = InstructionExecutor(self.client)
-        await executor.run(line, interaction=message)
+        await executor.run(line, interaction=context.message)
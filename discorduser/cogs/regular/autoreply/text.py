@@ -1,58 +1,40 @@
 import random as _r
-import re as _re
 
 import discord
 from discord import app_commands
 from discord.ext import commands
 
-from data.interfaces.autoreplies import TextAutoreplyInterface, SimpleAliasData, SimpleReplyData
-from data.interfaces.pref import PreferencesInterface
+from data.interfaces.asynchronous import AsyncTextAutoreplyInterface
+from data.interfaces.autoreplies import SimpleAliasData, SimpleReplyData
+from data.interfaces.utilities.triggers import TriggerMatcher
+from discorduser.cogs.regular.dispatch import MessageHandler, MessageContext
 from discorduser.user.abstract import BotClient
-from piss.old import Instruction, parse_variables
+from piss.old import Instruction
 from piss.old.instructionexecutor import InstructionExecutor
+from utilities.regex_sandbox import RegexSandbox
 
 @app_commands.guild_only()
-class MessageContentAutoreplyCog(commands.Cog):
-    def __init__(self, client: BotClient, pref: PreferencesInterface, replies: TextAutoreplyInterface) -> None:
+class MessageContentAutoreplyCog(commands.Cog, MessageHandler):
+    def __init__(self, client: BotClient, replies: AsyncTextAutoreplyInterface) -> None:
         self.client = client
-        self.pref = pref
         self.repl = replies
+        # Risky patterns are evaluated out of process, so they cannot stall the event loop.
+        self.sandbox: RegexSandbox = RegexSandbox(on_quarantine=self._on_quarantine)
 
-    @commands.Cog.listener("on_message")
-    async def message_content_replies(self, message: discord.Message):
-        if not message.guild:
-            return
+    async def cog_unload(self) -> None:
+        self.sandbox.close()
 
-        if message.author.bot:
-            return
+    async def _on_quarantine(self, pattern: str, flags: int) -> None:
+        await self.client.logger.trigger_quarantine(pattern, flags, self.sandbox.timeout)
 
-        if self.pref.is_paused_channel(message.guild.id, message.channel.id):
-            return
-        if not self.pref.is_user_autoreply_enabled(message.author.id, 'text'):
-            return
-        if not self.pref.is_autoreply_enabled(message.guild.id, message.channel.id, 'text'):
+    async def handle_message(self, context: MessageContext) -> None:
+        if not await context.autoreply_enabled('text'):
             return
 
-        a_data = self.repl.get_triggers_by_alias()
-
-        triggering_aliases: list[SimpleAliasData] = []
-
-        for alias, triggers in a_data.items():
-            for trigger in triggers:
-                # Calculate if the trigger would be accepted
-                num: int = _r.randint(1, 256)
-                rate: int = (trigger.rate if trigger.rate else alias.rate)
-                if num > rate:
-                    continue
-
-                # For each trigger type, try to match. Raising exception if not to enforce compatibility of types.
-                if trigger.type == 'regex':
-                    match = _re.match(trigger.data, message.content)
-                    if match:
-                        triggering_aliases.append(alias)
-                        break  # Prevent repeated entries of same Alias
-                else:
-                    raise TypeError(f'Trigger of invalid type **{trigger.type}**')
+        message: discord.Message = context.message
+        # Compiled once per pool change, not per message. A rebuild reads the pool, so it runs on the data executor.
+        matcher: TriggerMatcher = await self.repl.get_trigger_matcher()
+        triggering_aliases: list[SimpleAliasData] = await matcher.match_async(context.content, self.sandbox)
         if not triggering_aliases:
             return
 
@@ -60,14 +42,14 @@ class MessageContentAutoreplyCog(commands.Cog):
         while reply is None and triggering_aliases:
             index: int = _r.randint(0, len(triggering_aliases) - 1)
             alias: SimpleAliasData = triggering_aliases.pop(index)
-            reply: SimpleReplyData | None = self.repl.get_reply(alias.name)  # Can throw an error on bad Alias name.
-            # However, if that happens, we wanna pass it through.
+            # Can throw an error on bad Alias name. However, if that happens, we wanna pass it through.
+            reply: SimpleReplyData | None = await self.repl.get_reply(alias.name)
         if not reply:
             return
             # also do not be a dumbo and put a cooldown on that log pretty please.
 
         if reply.type == 'text':
-            instructions: list[Instruction] = parse_variables(reply.data)
+            instructions: list[Instruction] = self.client.parse_cache.load(reply.data, reply.compiled)
             executor: InstructionExecutor = InstructionExecutor(self.client)
             await executor.run(instructions, message)
         elif reply.type == 'reaction':
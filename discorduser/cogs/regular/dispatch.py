@@ -0,0 +1,126 @@
+import asyncio
+
+import discord
+from discord.ext import commands
+
+from data.interfaces.asynchronous import AsyncPreferencesInterface, AsyncLocalAdminModerationInterface
+from data.interfaces.pref import supported_autoreply_features, mask_allows, PAUSED_BIT
+from discorduser.logger.errors import ListenerErrorContext
+from discorduser.user.abstract import BotClient
+
+
+class MessageContext:
+    """
+    Everything the message handlers need to know about a single message, resolved at most once per message.
+    Preference and ban lookups are deferred until a handler first awaits them, and concurrent handlers share the one
+    lookup, so a message no handler is interested in costs no lookups at all.
+    """
+
+    def __init__(self, message: discord.Message, pref: AsyncPreferencesInterface,
+                 mod: AsyncLocalAdminModerationInterface) -> None:
+        self.message: discord.Message = message
+        self._pref: AsyncPreferencesInterface = pref
+        self._mod: AsyncLocalAdminModerationInterface = mod
+
+        self.content: str = message.content
+        self.lower: str = message.content.lower()
+
+        self.author_id: int = message.author.id
+        self.guild_id: int | None = message.guild.id if message.guild else None
+        self.channel_id: int = message.channel.id
+
+        self._features: asyncio.Future[int] | None = None
+        self._user_banned: asyncio.Future[bool] | None = None
+        self._guild_banned: asyncio.Future[bool] | None = None
+
+    # region Preferences
+    async def features(self) -> int:
+        """
+        Resolved pause and preference bitmask for this guild, channel and author. Zero outside of guilds.
+        """
+        if self.guild_id is None:
+            return 0
+        if self._features is None:
+            self._features = asyncio.ensure_future(
+                self._pref.autoreply_feature_mask(self.guild_id, self.channel_id, self.author_id))
+        return await self._features
+
+    async def paused(self) -> bool:
+        """
+        Is interaction in this channel temporarily paused? Never the case outside of guilds.
+        """
+        return bool(await self.features() & PAUSED_BIT)
+
+    async def autoreply_enabled(self, feature: supported_autoreply_features, check_user: bool = True) -> bool:
+        """
+        May the given autoreply feature respond to this message?
+        :param feature: Feature to check for.
+        :param check_user: Also respect the author's preference. Features not tied to the author skip this.
+        :return: Not paused, and enabled for the channel and (optionally) the author.
+        """
+        return mask_allows(await self.features(), feature, check_user)
+    # endregion
+
+    # region Moderation
+    async def user_banned(self) -> bool:
+        if self._user_banned is None:
+            self._user_banned = asyncio.ensure_future(self._mod.is_banned_user(self.author_id))
+        return await self._user_banned
+
+    async def guild_banned(self) -> bool:
+        if self.guild_id is None:
+            return False
+        if self._guild_banned is None:
+            self._guild_banned = asyncio.ensure_future(self._mod.is_banned_guild(self.guild_id))
+        return await self._guild_banned
+    # endregion
+
+
+class MessageHandler:
+    """
+    Mixin for Cogs that respond to regular messages. Handlers do not listen to `on_message` themselves; the
+    `MessageDispatchCog` builds one `MessageContext` per message and passes it to each of them.
+    """
+    guild_only: bool = True  # Only receive messages sent in guilds.
+
+    async def handle_message(self, context: MessageContext) -> None:
+        raise NotImplementedError()
+
+
+class MessageDispatchCog(commands.Cog):
+    """
+    Single `on_message` listener for every `MessageHandler`. Drops bot messages, then runs the handlers concurrently on
+    a shared context. A failing handler is logged and does not affect the others.
+    """
+
+    def __init__(self, client: BotClient, pref: AsyncPreferencesInterface, mod: AsyncLocalAdminModerationInterface,
+                 handlers: list[MessageHandler]) -> None:
+        self.client = client
+        self.pref = pref
+        self.mod = mod
+        self.handlers: list[MessageHandler] = handlers
+        self._direct_handlers: list[MessageHandler] = [h for h in handlers if not h.guild_only]
+
+    async def _run(self, handler: MessageHandler, context: MessageContext) -> None:
+        try:
+            await handler.handle_message(context)
+        except Exception as e:
+            await self.client.handle_exception(ListenerErrorContext(
+                error=e,
+                event='on_message',
+                params=(('handler', type(handler).__name__), ('message', str(context.message.id)),),
+                author=context.message.author,
+                guild=context.message.guild,
+            ))
+
+    @commands.Cog.listener("on_message")
+    async def dispatch_message(self, message: discord.Message):
+        if message.author.bot:
+            return
+
+        handlers: list[MessageHandler] = self.handlers if message.guild else self._direct_handlers
+        if not handlers:
+            return
+
+        context: MessageContext = MessageContext(message, self.pref, self.mod)
+        await asyncio.gather(*(self._run(handler, context) for handler in handlers))
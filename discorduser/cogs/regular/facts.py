@@ -2,15 +2,15 @@ from discord import app_commands, Interaction
 from discord.ext import commands
 
 from configuration.global_config import CFG
-from data.interfaces.fact import FactInterface
+from data.interfaces.asynchronous import AsyncFactInterface
 from discorduser.user.abstract import BotClient
-from piss.old import parse_variables, Instruction
+from piss.old import Instruction
 from piss.old.instructionexecutor import InstructionExecutor
 
 
 @app_commands.guild_only()
 class FactsCog(commands.Cog):
-    def __init__(self, client: BotClient, fact: FactInterface) -> None:
+    def __init__(self, client: BotClient, fact: AsyncFactInterface) -> None:
         self.client = client
         self.fact = fact
 
@@ -19,12 +19,13 @@ class FactsCog(commands.Cog):
     @app_commands.checks.cooldown(1, CFG.FACT_COOLDOWN, key=lambda i: (i.guild_id, i.user.id))
     async def fact_give(self, interaction: Interaction, index: int | None = None):
         try:
-            fact_raw: str = self.fact.get_fact(interaction.guild_id if not self.fact.is_killswitch() else None, index)
+            fact_raw, compiled = await self.fact.get_compiled_fact(
+                interaction.guild_id if not await self.fact.is_killswitch() else None, index)
         except IndexError:
             await self.client.user_feedback(interaction, ephemeral=True, desc=f'Index {index} is out of range.')
             return
 
-        fact: list[Instruction] = parse_variables(fact_raw)
+        fact: list[Instruction] = self.client.parse_cache.load(fact_raw, compiled)
         executor: InstructionExecutor = InstructionExecutor(self.client)
         await executor.run(fact, interaction=interaction)
 
@@ -33,8 +34,8 @@ class FactsCog(commands.Cog):
                 # hardcoded 10s because this command is not as useful
                 # and I'd like to save on DB calls
     async def fact_index(self, interaction: Interaction):
-        global_fact_count: int = self.fact.get_fact_count(None)
-        local_fact_count: int = self.fact.get_fact_count(interaction.guild_id) if not self.fact.is_killswitch() else 0
+        global_fact_count, local_fact_count = await self.fact.get_fact_counts(
+            interaction.guild_id if not await self.fact.is_killswitch() else None)
         total_fact_count: int = global_fact_count + local_fact_count
         title = "Current fact count"
         desc = f"Total: {total_fact_count}\n" \
@@ -1,13 +1,14 @@
 from discord import app_commands, Interaction
 from discord.ext import commands
 
-from data.interfaces.pref import PreferencesInterface, supported_autoreply_features, UserPreferenceData
+from data.interfaces.asynchronous import AsyncPreferencesInterface
+from data.interfaces.pref import supported_autoreply_features, UserPreferenceData
 from discorduser.user.abstract import BotClient
 
 
 @app_commands.guild_only()
 class UserPreferenceCog(commands.Cog):
-    def __init__(self, client: BotClient, pref: PreferencesInterface) -> None:
+    def __init__(self, client: BotClient, pref: AsyncPreferencesInterface) -> None:
         self.client = client
         self.pref = pref
 
@@ -21,7 +22,7 @@ class UserPreferenceCog(commands.Cog):
                                      text: bool = False):
         # Not allowing to disable sayings is on purpose.
         await interaction.response.defer(ephemeral=True, thinking=True)
-        pref: UserPreferenceData = self.pref.user_autoreplies_enabled(interaction.user.id)
+        pref: UserPreferenceData = await self.pref.user_autoreplies_enabled(interaction.user.id)
         if not (numbers or letters or text):
             await self.client.user_feedback(interaction,
                                             title=f'User preference for {interaction.user.name}',
@@ -45,7 +46,7 @@ class UserPreferenceCog(commands.Cog):
             raise RuntimeError('Set of selected features is 0 even though some feature was selected.')
 
         # todo: return updated data and then use that to save a DB call.
-        self.pref.toggle_user_autoreply_feature(interaction.user.id, feat)
+        await self.pref.toggle_user_autoreply_feature(interaction.user.id, feat)
 
         desc = desc.removesuffix('\n')
         await self.client.user_feedback(
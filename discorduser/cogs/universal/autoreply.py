@@ -1,14 +1,16 @@
 # NOTE: COMMANDS ARE NOT GLOBALLY USABLE, THEY ARE GLOBAL ADMIN
 import io
 import json as _json
+import re as _re
 
 import discord
 from discord import app_commands, Interaction, Embed, Colour
 from discord.app_commands import Choice
 
 from configuration.global_config import CFG
-from data.interfaces.autoreplies import GlobalTextAutoreplyInterface, reply_types, \
+from data.interfaces.autoreplies import GlobalTextAutoreplyInterface, reply_types, trigger_types, \
     SimpleAliasData, SimpleTriggerData, SimpleReplyData
+from data.interfaces.utilities.triggers import compile_trigger
 from discorduser.logger import GlobalLogger
 from discorduser.user.abstract import BotClient
 from discorduser.user.custom_cog import CustomGroupCog
@@ -128,7 +130,7 @@ class _AliasGlobalAdminCog(CustomGroupCog, group_name='alias'):
                     # Triggers
                     out += f'## Triggers:\n'
                     for t in self.repl.get_triggers_for_alias(a.name):
-                        out += f'[{t.type};{t.rate}] {t.data}\n'
+                        out += f'[{t.type}{'/i' if t.case_insensitive else ''};{t.rate}] {t.data}\n'
 
                     # Line between each header, then replies header
                     out += f'\n## Replies:\n'
@@ -180,37 +182,53 @@ class _TriggerGlobalAdminCog(CustomGroupCog, group_name='trigger'):
 
     # region commands
     @app_commands.command(name='create', description='Create a new Trigger')
-    @app_commands.describe(alias='The Alias this Trigger belongs to.', text='Trigger RegEx to match to.',
+    @app_commands.describe(alias='The Alias this Trigger belongs to.',
+                           text='Trigger data to match to. A RegEx for type regex, plain text otherwise.',
+                           trigger_type='How the text is matched to messages. Default: regex',
+                           case_insensitive='Ignore letter case when matching. Default: False',
                            rate='The relative rate this Trigger will proc to, overriding the Alias rate if given. Range 1-256',
                            ephemeral=CFG.EPHEMERAL_DESCRIPTION)
-    async def create_trigger(self, interaction: Interaction, alias: str, text: str, rate: int | None = None,
-                             ephemeral: bool = False):
+    @app_commands.rename(trigger_type='type')
+    async def create_trigger(self, interaction: Interaction, alias: str, text: str,
+                             trigger_type: trigger_types = 'regex', case_insensitive: bool = False,
+                             rate: int | None = None, ephemeral: bool = False):
         if rate is not None and not (1 <= rate <= 256):
             await self.client.user_feedback(interaction, title='Trigger creation failed',
                                             desc='The given rate is not in range **[1..256]**.', ephemeral=ephemeral)
             return
+        if not await self._check_trigger(interaction, 'Trigger creation failed',
+                                         SimpleTriggerData(trigger_type, text, rate, case_insensitive), ephemeral):
+            return
         try:
-            self.repl.add_trigger(alias, trigger_type='regex', data=text,
-                                  rate=rate)  # todo: create and support other trigger types.
+            self.repl.add_trigger(alias, trigger_type=trigger_type, data=text, rate=rate,
+                                  case_insensitive=case_insensitive)
         except ValueError:
             await self.client.user_feedback(interaction, title='Trigger creation failed',
                                             desc=f'The given Alias {alias} does not exist.', ephemeral=ephemeral)
             return
-        await self.logger.trigger_create(interaction, alias, 'regex', text, rate)
+        await self.logger.trigger_create(interaction, alias, trigger_type, text, rate, case_insensitive)
         await self.client.user_feedback(interaction, title='Trigger created successfully',
-                                        desc=f'Alias: {alias}\n*Type: Regex*\nContent: **{text}**', ephemeral=ephemeral)
+                                        desc=f'Alias: {alias}\n'
+                                             f'*Type: {trigger_type}{' (case-insensitive)' if case_insensitive else ''}*\n'
+                                             f'Content: **{text}**',
+                                        ephemeral=ephemeral)
 
     @app_commands.command(name='edit', description='Edit a Trigger')
     @app_commands.describe(alias='The Alias this Trigger belongs to.',
                            index='The index of this trigger.',
-                           text='Trigger RegEx to match to.',
+                           text='Trigger data to match to. A RegEx for type regex, plain text otherwise.',
+                           trigger_type='How the text is matched to messages. Keeps the current type if not given.',
+                           case_insensitive='Ignore letter case when matching.',
                            rate='The relative rate this Trigger will proc to, overriding the Alias rate if given. Range 1-256',
                            ephemeral=CFG.EPHEMERAL_DESCRIPTION)
-    async def edit_trigger(self, interaction: Interaction, alias: str, index: int, text: str | None = None, rate: int | None = None,
-                           ephemeral: bool = False):
-        if text is None and rate is None:
+    @app_commands.rename(trigger_type='type')
+    async def edit_trigger(self, interaction: Interaction, alias: str, index: int, text: str | None = None,
+                           trigger_type: trigger_types | None = None, case_insensitive: bool | None = None,
+                           rate: int | None = None, ephemeral: bool = False):
+        if text is None and rate is None and trigger_type is None and case_insensitive is None:
             await self.client.user_feedback(interaction, title='Trigger edit failed',
-                                            desc='You need to update at least one of text and rate.',
+                                            desc='You need to update at least one of text, type, case_insensitive '
+                                                 'and rate.',
                                             ephemeral=ephemeral)
             return
         if rate is not None and not (1 <= rate <= 256):
@@ -220,7 +238,16 @@ class _TriggerGlobalAdminCog(CustomGroupCog, group_name='trigger'):
 
         try:
             old: SimpleTriggerData = self.repl.get_trigger_by_index(alias, index)
-            self.repl.edit_trigger(alias, index, trigger_type='regex', data=text, rate=rate)
+            new: SimpleTriggerData = SimpleTriggerData(
+                trigger_type if trigger_type is not None else old.type,
+                text if text is not None else old.data,
+                rate,
+                case_insensitive if case_insensitive is not None else old.case_insensitive
+            )
+            if not await self._check_trigger(interaction, 'Trigger edit failed', new, ephemeral):
+                return
+            self.repl.edit_trigger(alias, index, trigger_type=trigger_type, data=text, rate=rate,
+                                   case_insensitive=case_insensitive)
         except ValueError:
             await self.client.user_feedback(interaction, title='Trigger edit failed',
                                             desc='The given alias does not exist.', ephemeral=ephemeral)
@@ -230,7 +257,7 @@ class _TriggerGlobalAdminCog(CustomGroupCog, group_name='trigger'):
                                             desc='Trigger index out of bounds',
                                             ephemeral=ephemeral)
             return
-        await self.logger.trigger_edit(interaction, alias, old, text, rate)
+        await self.logger.trigger_edit(interaction, alias, old, text, rate, trigger_type, case_insensitive)
         await self.client.user_feedback(interaction, title='Trigger edited successfully', ephemeral=ephemeral)
 
     @app_commands.command(name='delete', description='Delete a Trigger')
@@ -252,6 +279,20 @@ class _TriggerGlobalAdminCog(CustomGroupCog, group_name='trigger'):
         await self.logger.trigger_delete(interaction, alias, old)
         await self.client.user_feedback(interaction, title='Trigger deleted successfully', ephemeral=ephemeral)
 
+    async def _check_trigger(self, interaction: Interaction, title: str, trigger: SimpleTriggerData,
+                             ephemeral: bool) -> bool:
+        """
+        Checks whether the given trigger compiles, and gives feedback to the user if it does not.
+        :return: True if the trigger is usable.
+        """
+        try:
+            compile_trigger(trigger)
+        except (_re.error, ValueError) as e:
+            await self.client.user_feedback(interaction, title=title, desc=f'Invalid trigger: {e}',
+                                            ephemeral=ephemeral)
+            return False
+        return True
+
     # endregion
 
     # region autocomplete
@@ -281,7 +322,8 @@ class _TriggerGlobalAdminCog(CustomGroupCog, group_name='trigger'):
         lower, upper = selection_window(len(triggers), current, 5, favour='higher')
         return [
             # Offset like this because indexing is by 1 for users.
-            Choice[int](name=f'{offset + 1} ({trigger.type}): {trigger.data[:80]}', value=offset + 1)
+            Choice[int](name=f'{offset + 1} ({trigger.type}{', i' if trigger.case_insensitive else ''}): '
+                             f'{trigger.data[:80]}', value=offset + 1)
             for offset, trigger in enumerate(triggers[lower:upper])
         ]
 
@@ -9,8 +9,8 @@ from discord.app_commands import Choice, Transform
 
 from configuration.global_config import CFG
 from configuration.logger import loggable
-from data.interfaces.fact import GlobalAdminFactInterface, SimpleFactEditorData
-from data.interfaces.moderation import GlobalAdminModerationInterface
+from data.interfaces.asynchronous import AsyncGlobalAdminFactInterface, AsyncGlobalAdminModerationInterface
+from data.interfaces.fact import SimpleFactEditorData
 from data.interfaces.other import LocalAdminDataInterface
 from discorduser.logger import GlobalLogger
 from discorduser.logger.local import LocalLogger
@@ -26,7 +26,8 @@ from utilities.selection_window import selection_window
 @app_commands.default_permissions(administrator=True)
 @app_commands.guilds(discord.Object(id=CFG.GLOBAL_ADMIN_SERVER_ID))
 class GlobalFactAdminCog(CustomGroupCog, group_name='gfact'):
-    def __init__(self, client: BotClient, fact: GlobalAdminFactInterface, logger: GlobalLogger, local_logger: LocalLogger) -> None:
+    def __init__(self, client: BotClient, fact: AsyncGlobalAdminFactInterface, logger: GlobalLogger,
+                 local_logger: LocalLogger) -> None:
         super().__init__(client)
         self.fact = fact
         self.logger = logger
@@ -39,7 +40,7 @@ class GlobalFactAdminCog(CustomGroupCog, group_name='gfact'):
     async def add(self, interaction: Interaction, text: str, ephemeral: bool = False) -> None:
         if not await input_test(self.client, interaction, text, ephemeral):
             return
-        self.fact.create_global_fact(interaction.user.id, text)
+        await self.fact.create_global_fact(interaction.user.id, text)
         await self.logger.fact_create(interaction, text)
         await self.client.user_feedback(interaction, ephemeral=ephemeral, title='Success',
                                         desc=f'Fact created successfully.')
@@ -52,7 +53,7 @@ class GlobalFactAdminCog(CustomGroupCog, group_name='gfact'):
         if not await input_test(self.client, interaction, text, ephemeral):
             return
         try:
-            old: SimpleFactEditorData = self.fact.edit_global_fact(index, interaction.user.id, text)
+            old: SimpleFactEditorData = await self.fact.edit_global_fact(index, interaction.user.id, text)
         except IndexError:
             await self.client.user_feedback(interaction, title='Index is out of range.', ephemeral=ephemeral)
             return
@@ -65,7 +66,7 @@ class GlobalFactAdminCog(CustomGroupCog, group_name='gfact'):
     @app_commands.describe(index='The index of the fact to delete', ephemeral=CFG.EPHEMERAL_DESCRIPTION)
     async def delete(self, interaction: Interaction, index: int, ephemeral: bool = False) -> None:
         try:
-            old: SimpleFactEditorData = self.fact.delete_global_fact(index)
+            old: SimpleFactEditorData = await self.fact.delete_global_fact(index)
         except IndexError:
             await self.client.user_feedback(interaction, title='Index is out of range.', ephemeral=ephemeral)
             return
@@ -80,8 +81,8 @@ class GlobalFactAdminCog(CustomGroupCog, group_name='gfact'):
                            json='Export data in JSON format.', local='Also export local facts, indexed by guild ID')
     async def index(self, interaction: Interaction, json: bool = False, local: bool = False,
                     ephemeral: bool = True, ) -> None:
-        global_facts: list[SimpleFactEditorData] = self.fact.get_global_facts()
-        local_facts: dict[int, list[SimpleFactEditorData]] = {} if not local else self.fact.get_all_local_facts()
+        global_facts: list[SimpleFactEditorData] = await self.fact.get_global_facts()
+        local_facts: dict[int, list[SimpleFactEditorData]] = {} if not local else await self.fact.get_all_local_facts()
         # Always instance available as this is a guild_only command.
         # noinspection bad-assignment
         iguild: Guild = interaction.guild
@@ -181,9 +182,9 @@ class GlobalFactAdminCog(CustomGroupCog, group_name='gfact'):
         try:
             if not delete:
                 text: str
-                old: SimpleFactEditorData = self.fact.edit_fact(guild_id, index, text, interaction.user.id)
+                old: SimpleFactEditorData = await self.fact.edit_fact(guild_id, index, text, interaction.user.id)
             else:
-                old: SimpleFactEditorData = self.fact.delete_fact(guild_id, index)
+                old: SimpleFactEditorData = await self.fact.delete_fact(guild_id, index)
         except IndexError:
             await self.client.user_feedback(interaction, title='Fact modification failed',
                                             desc=f'Index {index} out of range.', ephemeral=ephemeral)
@@ -216,7 +217,7 @@ class GlobalFactAdminCog(CustomGroupCog, group_name='gfact'):
                            guild_id='The ID of the guild you wish to index from.', )
     async def index_local(self, interaction: Interaction, guild_id: int, ephemeral: bool = False,
                           json: bool = False) -> None:
-        local_facts: list[SimpleFactEditorData] = self.fact.get_local_facts(guild_id)
+        local_facts: list[SimpleFactEditorData] = await self.fact.get_local_facts(guild_id)
         if not local_facts:
             await interaction.response.send_message(
                 ephemeral=ephemeral,
@@ -264,7 +265,7 @@ class GlobalFactAdminCog(CustomGroupCog, group_name='gfact'):
     async def _gfact_index_autocomplete_impl(self, _: Interaction, current: int) -> list[Choice[int]]:
         if not current:
             current = 0
-        facts: list[SimpleFactEditorData] = self.fact.get_global_facts()
+        facts: list[SimpleFactEditorData] = await self.fact.get_global_facts()
         lower, upper = selection_window(len(facts), current, 11, favour='higher')
 
         return [
@@ -281,7 +282,7 @@ class GlobalFactAdminCog(CustomGroupCog, group_name='gfact'):
         guild_id: int = interaction.namespace.guild_id
         if not guild_id:
             return [Choice[int](name='Bad guild ID', value=-1)]
-        facts: list[SimpleFactEditorData] = self.fact.get_local_facts(guild_id)
+        facts: list[SimpleFactEditorData] = await self.fact.get_local_facts(guild_id)
         if not facts:
             return [Choice[int](name='No local facts', value=-1)]
 
@@ -304,7 +305,7 @@ class GlobalFactAdminCog(CustomGroupCog, group_name='gfact'):
 @app_commands.default_permissions(administrator=True)
 @app_commands.guilds(discord.Object(id=CFG.GLOBAL_ADMIN_SERVER_ID))
 class GlobalAdminCog(CustomGroupCog, group_name='global'):
-    def __init__(self, client: BotClient, fact: GlobalAdminFactInterface, mod: GlobalAdminModerationInterface,
+    def __init__(self, client: BotClient, fact: AsyncGlobalAdminFactInterface, mod: AsyncGlobalAdminModerationInterface,
                  db: LocalAdminDataInterface, logger: GlobalLogger) -> None:
         super().__init__(client)
         self.fact = fact
@@ -318,7 +319,7 @@ class GlobalAdminCog(CustomGroupCog, group_name='global'):
                            reason='A reason, for logging purposes.')
     async def ban_user(self, interaction: Interaction, user_id: int, reason: str | None = None,
                        ephemeral: bool = False) -> None:
-        state: bool = self.mod.toggle_ban('user', user_id)
+        state: bool = await self.mod.toggle_ban('user', user_id)
         user = self.client.get_user(user_id)
 
         await self.logger.ban_user(interaction, user_id, user, state, reason)
@@ -343,7 +344,7 @@ class GlobalAdminCog(CustomGroupCog, group_name='global'):
                            reason='A reason, for logging purposes.')
     async def ban_guild(self, interaction: Interaction, guild_id: int, reason: str | None = None,
                         ephemeral: bool = False) -> None:
-        state: bool = self.mod.toggle_ban('guild', guild_id)
+        state: bool = await self.mod.toggle_ban('guild', guild_id)
         guild = self.client.get_guild(guild_id)
 
         await self.logger.ban_guild(interaction, guild_id, guild, state, reason)
@@ -366,7 +367,7 @@ class GlobalAdminCog(CustomGroupCog, group_name='global'):
                           description='Disables any interaction with, or addition to, the Local Fact database.')
     @app_commands.describe(ephemeral=CFG.EPHEMERAL_DESCRIPTION)
     async def killswitch(self, interaction: Interaction, ephemeral: bool = False):
-        state: bool = self.fact.toggle_local_fact_killswitch()
+        state: bool = await self.fact.toggle_local_fact_killswitch()
         await self.client.user_feedback(interaction, desc=f'Killswitch state set to {state}', ephemeral=ephemeral)
         embed: Embed = Embed(
                 title='[[ KILLSWITCH TOGGLE ]]',
@@ -407,5 +408,34 @@ class GlobalAdminCog(CustomGroupCog, group_name='global'):
             await self.client.user_feedback(interaction, title='Log output update failed', desc='Channel not found',
                                             ephemeral=ephemeral)
 
+    @app_commands.command(name='cache_stats',
+                          description='Shows hit, miss, load, eviction and expiry counters of the data caches.')
+    @app_commands.describe(ephemeral=CFG.EPHEMERAL_DESCRIPTION, json='Export data in JSON format.')
+    async def cache_stats(self, interaction: Interaction, json: bool = False, ephemeral: bool = True) -> None:
+        stats: dict[str, dict[str, dict[str, int | float | None]]] = await self.client.cache_stats()
+
+        if json:
+            with _io.StringIO(_json.dumps(stats, indent=4)) as text_stream:
+                # noinspection bad-argument-type
+                await interaction.response.send_message(
+                    ephemeral=ephemeral, file=discord.File(fp=text_stream, filename='cache_stats.json'),
+                    embed=Embed(title='Cache statistics', description='JSON data attached'))
+            return
+
+        embed: Embed = Embed(title='Cache statistics', colour=Colour.blue(),
+                             description=None if stats else 'None of the data interfaces cache.')
+        for source, subtrees in stats.items():
+            lines: list[str] = []
+            for path, s in subtrees.items():
+                ratio: str = f'{s['hit_ratio']:.1%}' if s['hit_ratio'] is not None else '-'
+                load: str = f'{s['mean_load_ms']:.1f} ms' if s['mean_load_ms'] is not None else '-'
+                lines.append(f'`{path}` {ratio} hits ({s['hits']}/{s['hits'] + s['misses']}), '
+                             f'{s['loads']} loads ({s['load_errors']} failed) avg {load}, '
+                             f'{s['evictions']} evicted, {s['expirations']} expired, '
+                             f'{s['entries']} entries ~{s['bytes'] / 1024:.0f} KiB')
+            value: str = '\n'.join(lines) if lines else 'No traffic yet.'
+            embed.add_field(name=source, value=value if len(value) <= 1024 else value[:1021] + '...', inline=False)
+        await interaction.response.send_message(ephemeral=ephemeral, embed=embed)
+
     # todo: backup command, creating a host-side backup of the db. Keep up to 3 backups.
     # endregion
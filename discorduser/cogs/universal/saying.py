@@ -6,7 +6,8 @@ from discord import app_commands, Interaction, Colour, Embed
 from discord.app_commands import Choice
 
 from configuration.global_config import CFG
-from data.interfaces.saying import GlobalAdminSayingInterface, SimpleSayingEditorData, SayingEditorData
+from data.interfaces.asynchronous import AsyncGlobalAdminSayingInterface
+from data.interfaces.saying import SimpleSayingEditorData, SayingEditorData
 from discorduser.logger import GlobalLogger
 from discorduser.user.abstract import BotClient
 from discorduser.user.custom_cog import CustomGroupCog
@@ -18,7 +19,7 @@ from utilities.selection_window import selection_window
 @app_commands.default_permissions(administrator=True)
 @app_commands.guilds(discord.Object(id=CFG.GLOBAL_ADMIN_SERVER_ID))
 class GlobalAdminSayingCog(CustomGroupCog, group_name='saying'):
-    def __init__(self, client: BotClient, saying: GlobalAdminSayingInterface, logger: GlobalLogger) -> None:
+    def __init__(self, client: BotClient, saying: AsyncGlobalAdminSayingInterface, logger: GlobalLogger) -> None:
         super().__init__(client)
         self.saying = saying
         self.logger = logger
@@ -29,7 +30,7 @@ class GlobalAdminSayingCog(CustomGroupCog, group_name='saying'):
         if not await input_test(self.client, interaction, saying, ephemeral):
             return
 
-        self.saying.create_saying(saying)
+        await self.saying.create_saying(saying)
         await self.logger.saying_create(interaction, saying)
         await self.client.user_feedback(interaction, ephemeral=ephemeral, title='Success',
                                         desc='Saying created successfully')
@@ -43,7 +44,7 @@ class GlobalAdminSayingCog(CustomGroupCog, group_name='saying'):
             return
 
         try:
-            old: SimpleSayingEditorData = self.saying.edit_saying(index, saying)
+            old: SimpleSayingEditorData = await self.saying.edit_saying(index, saying)
         except IndexError:
             await self.client.user_feedback(interaction, title='Index is out of range.', ephemeral=ephemeral)
             return
@@ -57,7 +58,7 @@ class GlobalAdminSayingCog(CustomGroupCog, group_name='saying'):
                            ephemeral=CFG.EPHEMERAL_DESCRIPTION)
     async def saying_delete(self, interaction: Interaction, index: int, ephemeral: bool = False) -> None:
         try:
-            old: SimpleSayingEditorData = self.saying.delete_saying(index)
+            old: SimpleSayingEditorData = await self.saying.delete_saying(index)
         except IndexError:
             await self.client.user_feedback(interaction, title='Index is out of range.', ephemeral=ephemeral)
             return
@@ -69,7 +70,7 @@ class GlobalAdminSayingCog(CustomGroupCog, group_name='saying'):
     @app_commands.command(name='index', description='Display all of the stored Sayings.')
     @app_commands.describe(json='Output to a json file', ephemeral=CFG.EPHEMERAL_DESCRIPTION)
     async def index(self, interaction: Interaction, json: bool = False, ephemeral: bool = True) -> None:
-        sayings: list[SayingEditorData] = self.saying.get_sayings()
+        sayings: list[SayingEditorData] = await self.saying.get_sayings()
         if json:
             sayings: list[dict] = [i.as_json() for i in sayings]
             with io.StringIO(_json.dumps(sayings, indent=4)) as text_stream:
@@ -102,7 +103,7 @@ class GlobalAdminSayingCog(CustomGroupCog, group_name='saying'):
     async def _index_autocomplete_callback_impl(self, _: Interaction, current: int) -> list[Choice[int]]:
         if not current:
             current = 0
-        sayings: list[SimpleSayingEditorData] = self.saying.get_sayings()
+        sayings: list[SimpleSayingEditorData] = await self.saying.get_sayings()
         lower, upper = selection_window(len(sayings), current, 4, favour='higher')
 
         return [
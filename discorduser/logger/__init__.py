@@ -429,15 +429,16 @@ class GlobalLogger:
     # endregion
     # region trigger
     async def trigger_create(self, interaction: Interaction, alias: str, trigger_type: trigger_types, data: str,
-                             rate: int | None):
+                             rate: int | None, case_insensitive: bool = False):
         self._console_log(
-            f'[ TRIGGER CREATE ] by {interaction.user.display_name} ({interaction.user.id}) to Alias {alias} :: [Type: {trigger_type}; Rate: {rate}; Data: {data}]',
+            f'[ TRIGGER CREATE ] by {interaction.user.display_name} ({interaction.user.id}) to Alias {alias} :: [Type: {trigger_type}; Case-insensitive: {case_insensitive}; Rate: {rate}; Data: {data}]',
             'create_trigger')
         embed: Embed = Embed(
             title='Trigger created',
             description=f'**Alias:** {alias}\n'
                         f'**New:**\n'
                         f'Type: {trigger_type}\n'
+                        f'Case-insensitive: {case_insensitive}\n'
                         f'Rate: {rate}\n'
                         f'Data: {data}',
             colour=Colour.green()
@@ -448,19 +449,23 @@ class GlobalLogger:
         await self._channel_log(embed=embed, act='create_trigger')
 
     async def trigger_edit(self, interaction: Interaction, alias: str, old: SimpleTriggerData, data: str | None,
-                           rate: int | None) -> None:
+                           rate: int | None, trigger_type: trigger_types | None = None,
+                           case_insensitive: bool | None = None) -> None:
         self._console_log(
-            f'[ TRIGGER EDIT]  by {interaction.user.display_name} ({interaction.user.id}) from Alias {alias}, Old: [Type: {old.type}; Rate: {old.rate}; Data: {old.data}] ::to:: [Rate: {rate}; Data: {data}]',
+            f'[ TRIGGER EDIT]  by {interaction.user.display_name} ({interaction.user.id}) from Alias {alias}, Old: [Type: {old.type}; Case-insensitive: {old.case_insensitive}; Rate: {old.rate}; Data: {old.data}] ::to:: [Type: {trigger_type}; Case-insensitive: {case_insensitive}; Rate: {rate}; Data: {data}]',
             'edit_trigger')
         embed: Embed = Embed(
             title='Trigger edited',
             description=f'**Alias:** {alias}\n'
                         f'**Old:**\n'
                         f'Type: {old.type}\n'
+                        f'Case-insensitive: {old.case_insensitive}\n'
                         f'Data: {old.data}\n'
                         f'Rate: {old.rate}\n'
                         f'\n'
                         f'**New:**\n'
+                        f'Type: {trigger_type if trigger_type is not None else '[ Not changed ]'}\n'
+                        f'Case-insensitive: {case_insensitive if case_insensitive is not None else '[ Not changed ]'}\n'
                         f'Data: {data if data is not None else '[ Not changed ]'}\n'
                         f'Rate: {rate if rate is not None else '[ Not changed ]'}',
             colour=Colour.yellow()
@@ -488,6 +493,24 @@ class GlobalLogger:
 
         await self._channel_log(embed=embed, act='delete_trigger')
 
+    async def trigger_quarantine(self, pattern: str, flags: int, timeout: float) -> None:
+        """
+        Log a regex trigger that ran out of time in the sandbox, and is no longer evaluated until restart.
+        Goes to the 'general' channel, as no interaction is involved.
+        """
+        self._console_log(
+            f'[ TRIGGER QUARANTINE ] Pattern ran out of time ({timeout} s) and will no longer be evaluated :: [Flags: {flags}; Data: {pattern}]',
+            'general')
+        embed: Embed = Embed(
+            title='Trigger quarantined',
+            description=f'Pattern ran out of time ({timeout} s) and will no longer be evaluated until restart.\n'
+                        f'Flags: {flags}\n'
+                        f'Data: {pattern}',
+            colour=Colour.orange()
+        )
+
+        await self._channel_log(embed=embed, act='general')
+
     # endregion
     # region reply
     async def reply_create(self, interaction: Interaction, alias: str, reply_type: reply_types, data: str,
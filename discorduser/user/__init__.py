@@ -13,6 +13,7 @@ from discorduser.cogs.regular.autoreply.letters import LetterAutoreplyCog
 from discorduser.cogs.regular.autoreply.numbers import NumberAutoreplyCog
 from discorduser.cogs.regular.autoreply.sayings import RandomAutoreplyCog
 from discorduser.cogs.regular.autoreply.text import MessageContentAutoreplyCog
+from discorduser.cogs.regular.dispatch import MessageDispatchCog
 from discorduser.cogs.regular.facts import FactsCog
 from discorduser.cogs.regular.fun import MainCommandsCog
 from discorduser.cogs.regular.preferences import UserPreferenceCog
@@ -37,24 +38,31 @@ class BotClient(_AbstractClient):
 
         # Global
         await attach_autoreply_cogs(self, self.autoreplies, self.logger)
-        await self.add_cog(GlobalFactAdminCog(self, self.fact, self.logger, self.local_logger))
-        await self.add_cog(GlobalAdminCog(self, self.fact, self.mod, self.db, self.logger))
-        await self.add_cog(GlobalAdminSayingCog(self, self.saying, self.logger))
+        await self.add_cog(GlobalFactAdminCog(self, self.async_fact, self.logger, self.local_logger))
+        await self.add_cog(GlobalAdminCog(self, self.async_fact, self.async_mod, self.db, self.logger))
+        await self.add_cog(GlobalAdminSayingCog(self, self.async_saying, self.logger))
 
         # Local
-        await self.add_cog(LocalAdminCog(self, self.fact, self.mod, self.pref, self.db, self.logger, self.local_logger))
+        await self.add_cog(LocalAdminCog(self, self.async_fact, self.async_mod, self.async_pref, self.db, self.logger,
+                                         self.local_logger))
 
         # Common
-        await self.add_cog(AskPatrick(self, self.saying))
-        await self.add_cog(FactsCog(self, self.fact))
+        ask: AskPatrick = AskPatrick(self, self.async_saying)
+        await self.add_cog(ask)
+        await self.add_cog(FactsCog(self, self.async_fact))
         await self.add_cog(MainCommandsCog(self))
-        await self.add_cog(UserPreferenceCog(self, self.pref))
+        await self.add_cog(UserPreferenceCog(self, self.async_pref))
 
         # Auto
-        await self.add_cog(LetterAutoreplyCog(self, self.pref))
-        await self.add_cog(NumberAutoreplyCog(self, self.pref))
-        await self.add_cog(RandomAutoreplyCog(self, self.saying, self.pref))
-        await self.add_cog(MessageContentAutoreplyCog(self, self.pref, self.autoreplies))
+        letters: LetterAutoreplyCog = LetterAutoreplyCog(self)
+        numbers: NumberAutoreplyCog = NumberAutoreplyCog(self)
+        sayings: RandomAutoreplyCog = RandomAutoreplyCog(self, self.async_saying)
+        text: MessageContentAutoreplyCog = MessageContentAutoreplyCog(self, self.async_autoreplies)
+        for cog in (letters, numbers, sayings, text):
+            await self.add_cog(cog)
+
+        # One on_message listener for all of the above, sharing lookups per message.
+        await self.add_cog(MessageDispatchCog(self, self.async_pref, self.async_mod, [ask, letters, numbers, sayings, text]))
 
         # Finalize
         await super().setup_hook()  # call to toolkit version.
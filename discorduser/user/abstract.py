@@ -7,16 +7,24 @@ from discord.app_commands import TransformerError, AppCommandError
 from discord.ext import commands
 
 from configuration.logger import LocalLoggerConfig, GlobalLoggerConfig
+from data.interfaces.asynchronous import AsyncGlobalAdminFactInterface, AsyncGlobalAdminModerationInterface, \
+    AsyncPreferencesInterface, AsyncGlobalAdminSayingInterface, AsyncTextAutoreplyInterface
+from data.implementation.pref import CachedPreferences
 from data.interfaces.autoreplies import GlobalTextAutoreplyInterface
 from data.interfaces.fact import GlobalAdminFactInterface
 from data.interfaces.moderation import GlobalAdminModerationInterface
 from data.interfaces.other import LocalAdminDataInterface
 from data.interfaces.pref import PreferencesInterface
 from data.interfaces.saying import GlobalAdminSayingInterface
+from data.interfaces.utilities.executor import DataExecutor
+from data.interfaces.utilities.maintenance import CacheMaintenanceSource
+from data.interfaces.utilities.stats import CacheStatsSource
+from data.interfaces.utilities.warm import WarmStartSource
 from discorduser.logger import GlobalLogger, LoggableErrorContext
 from discorduser.logger.errors import ListenerErrorContext, AppCommandErrorContext, \
     AutocompleteErrorContext, TaskErrorContext, TransformerErrorContext
 from discorduser.logger.local import LocalLogger
+from piss.old.cache import ParseCache
 
 
 class BotClient(commands.Bot):
@@ -28,16 +36,33 @@ class BotClient(commands.Bot):
     def __init__(self, global_logger_config: GlobalLoggerConfig, local_logger_config: LocalLoggerConfig,
                  autoreplies: GlobalTextAutoreplyInterface, fact: GlobalAdminFactInterface,
                  mod: GlobalAdminModerationInterface, db: LocalAdminDataInterface, pref: PreferencesInterface,
-                 saying: GlobalAdminSayingInterface) -> None:
+                 saying: GlobalAdminSayingInterface, cache_snapshot_interval: float = 300) -> None:
+        """
+        :param cache_snapshot_interval: Seconds between cache snapshots of the data interfaces that support them.
+        """
         self.logger: GlobalLogger = GlobalLogger(self, global_logger_config)
         self.local_logger: LocalLogger = LocalLogger(self, local_logger_config, db)
         self.autoreplies: GlobalTextAutoreplyInterface = autoreplies
         self.fact: GlobalAdminFactInterface = fact
         self.mod: GlobalAdminModerationInterface = mod
         self.db: LocalAdminDataInterface = db
-        self.pref: PreferencesInterface = pref
+        # Checked for every message, so answered from cached bitmasks unless the given interface already caches.
+        self.pref: PreferencesInterface = pref if isinstance(pref, CachedPreferences) else CachedPreferences(pref)
         self.saying: GlobalAdminSayingInterface = saying
 
+        # Awaitable views of the above, for use from the event loop. Calls run on the executor, off the gateway loop.
+        self.executor: DataExecutor = DataExecutor()
+        self.async_autoreplies: AsyncTextAutoreplyInterface = AsyncTextAutoreplyInterface(autoreplies, self.executor)
+        self.async_fact: AsyncGlobalAdminFactInterface = AsyncGlobalAdminFactInterface(fact, self.executor)
+        self.async_mod: AsyncGlobalAdminModerationInterface = AsyncGlobalAdminModerationInterface(mod, self.executor)
+        self.async_pref: AsyncPreferencesInterface = AsyncPreferencesInterface(self.pref, self.executor)
+        self.async_saying: AsyncGlobalAdminSayingInterface = AsyncGlobalAdminSayingInterface(saying, self.executor)
+
+        self.cache_snapshot_interval: float = cache_snapshot_interval
+        # Parsed PISS of stored facts, sayings and replies. Only used from the event loop.
+        self.parse_cache: ParseCache = ParseCache()
+        self._cache_tasks: list[asyncio.Task] = []
+
         intents: discord.Intents = discord.Intents.default()
         # IDK why PyCharm decided this does not exist, as it does.
         # Anyhows, this will unfortunately have to do.
@@ -90,6 +115,16 @@ class BotClient(commands.Bot):
 
         self.tree.on_error = on_tree_error
 
+        for name, coro in (('Cache warm-up', self.warm_caches()), ('Cache snapshots', self._cache_snapshot_loop())):
+            task: asyncio.Task = asyncio.create_task(coro, name=name)
+            task.add_done_callback(self.handle_task_done)
+            self._cache_tasks.append(task)
+        for source in self._data_interfaces().values():
+            if isinstance(source, CacheMaintenanceSource):
+                task: asyncio.Task = source.get_cache_task(self.executor)
+                task.add_done_callback(self.handle_task_done)
+                self._cache_tasks.append(task)
+
     async def handle_exception(self, error_context: LoggableErrorContext) -> None:
         # TODO: Holy shit holy fucking shitty shit do NOT log Autocomplete errors they will SPAM EVERYTHING
         if isinstance(error_context, AutocompleteErrorContext):
@@ -122,6 +157,61 @@ class BotClient(commands.Bot):
         # todo: terminate?
     # endregion
 
+    # region caches
+    def _data_interfaces(self) -> dict[str, object]:
+        return {'autoreplies': self.autoreplies, 'fact': self.fact, 'mod': self.mod, 'db': self.db, 'pref': self.pref,
+                'saying': self.saying}
+
+    async def cache_stats(self) -> dict[str, dict[str, dict[str, int | float | None]]]:
+        """
+        Cache statistics of every data interface that caches, keyed by interface name, and of the PISS parse cache
+        under 'piss'. See `CacheStatsSource`.
+        """
+        sources: dict[str, CacheStatsSource] = {name: source for name, source in self._data_interfaces().items()
+                                                if isinstance(source, CacheStatsSource)}
+        stats: dict[str, dict[str, dict[str, int | float | None]]] = await self.executor.run(
+            lambda: {name: source.get_cache_stats() for name, source in sources.items()})
+        stats['piss'] = self.parse_cache.get_stats()
+        return stats
+
+    def _warm_start_sources(self) -> list[WarmStartSource]:
+        return [source for source in self._data_interfaces().values() if isinstance(source, WarmStartSource)]
+
+    async def warm_caches(self) -> None:
+        """
+        Warm-starts the caches from their snapshots and builds the trigger matcher while the client logs in.
+        Once ready, lets every cache preload for the guilds the client is in.
+        """
+        sources: list[WarmStartSource] = self._warm_start_sources()
+        await self.executor.run(lambda: [source.load_cache_snapshot() for source in sources])
+        await self.executor.run(self.autoreplies.get_trigger_matcher)
+
+        await self.wait_until_ready()
+        guild_ids: list[int] = [guild.id for guild in self.guilds]
+        await self.executor.run(lambda: [source.warm_cache(guild_ids) for source in sources])
+
+    async def save_cache_snapshots(self) -> None:
+        sources: list[WarmStartSource] = self._warm_start_sources()
+        await self.executor.run(lambda: [source.save_cache_snapshot() for source in sources])
+
+    async def _cache_snapshot_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.cache_snapshot_interval)
+            try:
+                await self.save_cache_snapshots()
+            except Exception as e:  # Keep snapshotting; a full disk may clear up.
+                await self.handle_exception(TaskErrorContext(e, asyncio.current_task()))
+    # endregion
+
+    async def close(self) -> None:
+        await super().close()
+        for task in self._cache_tasks:
+            task.cancel()
+        try:
+            await self.save_cache_snapshots()
+        finally:
+            self.executor.shutdown(wait=False)  # Lets queued data calls finish in the background.
+
     # noinspection method-may-be-static
     async def user_feedback(self, interaction: Interaction | discord.Message, title: str | None = None, desc: str | None = None,
                             ephemeral: bool = False) -> None:
@@ -58,25 +58,5 @@ if __name__ == '__main__':
 
     import asyncio
     async def main():
-        from data.implementation.utilities.abstract import CachedAbstractSQLDatabase
-        # Just for an example to myself for later
-        dummy: CachedAbstractSQLDatabase
-
-        maintenance_loops = [
-            dummy.get_cache_task()
-        ]
-
-        for loop in maintenance_loops:
-            loop.add_done_callback(client.handle_task_done)
-
-        # Run the client, and then clean up after. Raise any leftover exceptions.
-        try:
-            await client.start(token=token_config.token)
-        finally:
-            for task in maintenance_loops:
-                task.cancel()
-
-            await asyncio.gather(
-                *maintenance_loops,
-                return_exceptions=True,
-            )
+        # The client starts the cache maintenance loops of its data interfaces itself, and stops them on close.
+        await client.start(token=token_config.token)
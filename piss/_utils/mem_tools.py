@@ -1,5 +1,8 @@
 # Just for making memory stack usage easier.
-from typing import TypeVar as _TypeVar
+from __future__ import annotations
+
+from types import MappingProxyType as _MappingProxyType
+from typing import Generic as _Generic, Mapping as _Mapping, TypeVar as _TypeVar
 import datetime as _datetime
 
 
@@ -56,45 +59,55 @@ INITIAL_MEMORY_TYPES: dict[str, type] = {
 
 _T = _TypeVar('_T')
 
-def _flatten(memory_stack: list[dict[str, _T]]) -> dict[str, _T]:
-    """
-    Flatten a given memory stack into available entries in local scope.
+class Scope(_Generic[_T]):
     """
-    mem: dict[str, _T] = {}
-    for scope in reversed(memory_stack):
-        for k, v in scope.items():
-            mem[k] = v
-
-    return mem
-
-def _find_scope(memory_stack: list[dict[str, _T]], key: str) -> int | None:
+    One scope of memory, linked to the scope it is nested in, like a ChainMap: reads look through this scope and then
+    its parents, innermost first, in O(depth); writes go into this scope only, in O(1). Nothing is copied, so a scope
+    built on a shared mapping should be given a read-only view of it, and be written to through a child only.
     """
-    Find the scope the given key belongs to. Returns scope index, with 0 being top-level.
-    """
-    if not memory_stack:
-        raise IndexError('Memory stack is empty.')
-
-    for i, scope in enumerate(memory_stack):
-        if key in scope.keys():
-            return i
-    return None
-
-def fetch(memory_stack: list[dict[str, _T]], key: str) -> _T | None:
-    """
-    Find entry in memory_stack. Returns None if not found.
-    """
-    mem = _flatten(memory_stack)
-    return mem[key] if key in mem.keys() else None
-
-def assign(memory_stack: list[dict[str, _T]], key: str, value: _T) -> None:
-    """
-    Assign value to the key's corresponding scope.
-    Creates local scope entry
-    """
-    # Find scope
-    scope: int | None = _find_scope(memory_stack, key)
-    if scope is None:
-        scope = len(memory_stack) - 1
-    scope: int
-
-    memory_stack[scope][key] = value
\ No newline at end of file
+    __slots__ = ('entries', 'parent')
+
+    def __init__(self, entries: _Mapping[str, _T] | None = None, parent: Scope[_T] | None = None) -> None:
+        """
+        :param entries: Entries of this scope. Used as given, not copied; a read-only mapping makes a read-only scope.
+        :param parent: Scope this one is nested in, if any.
+        """
+        self.entries: _Mapping[str, _T] = {} if entries is None else entries
+        self.parent: Scope[_T] | None = parent
+
+    def child(self) -> Scope[_T]:
+        """
+        New, empty scope nested in this one.
+        """
+        return Scope(parent=self)
+
+    def fetch(self, key: str) -> _T | None:
+        """
+        Find entry in this scope or the ones it is nested in. Returns None if not found.
+        """
+        scope: Scope[_T] | None = self
+        while scope is not None:
+            entries: _Mapping[str, _T] = scope.entries
+            if key in entries:
+                return entries[key]
+            scope = scope.parent
+        return None
+
+    def assign(self, key: str, value: _T) -> None:
+        """
+        Assign value in this scope, shadowing entries of the same key in the scopes it is nested in.
+        Raises TypeError on read-only scopes.
+        """
+        self.entries[key] = value
+
+    def __contains__(self, key: str) -> bool:
+        scope: Scope[_T] | None = self
+        while scope is not None:
+            if key in scope.entries:
+                return True
+            scope = scope.parent
+        return False
+
+
+# Root of every parse: the types of the initial memory, read-only as the dict is shared by every parse.
+INITIAL_MEMORY_SCOPE: Scope[type] = Scope(_MappingProxyType(INITIAL_MEMORY_TYPES))
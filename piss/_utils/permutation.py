@@ -0,0 +1,61 @@
+import random as _r
+
+"""
+Random permutations of an index range that are never materialized: every index is mapped on demand, in O(1) memory.
+"""
+
+_MASK_64: int = (1 << 64) - 1
+
+
+class Permutation:
+    """
+    Keyed pseudo-random permutation of range(size). A balanced Feistel network over the smallest power-of-four domain
+    covering size, cycle-walked back into the range: every index maps to a distinct index, in O(1) expected time, as
+    the domain is less than four times the size.
+    The same instance always maps an index the same way; a new instance draws new keys.
+    """
+    __slots__ = ('size', '_bits', '_mask', '_keys')
+    ROUNDS: int = 4
+
+    def __init__(self, size: int, rng: _r.Random | None = None) -> None:
+        """
+        :param size: Length of the permuted range.
+        :param rng: Source of the round keys. Defaults to the module-level random generator.
+        """
+        if size < 1:
+            raise ValueError('Cannot permute an empty range.')
+        self.size: int = size
+        self._bits: int = max(1, ((size - 1).bit_length() + 1) // 2)  # Bits per Feistel half.
+        self._mask: int = (1 << self._bits) - 1
+        rng = rng or _r
+        self._keys: tuple[int, ...] = tuple(rng.getrandbits(64) for _ in range(self.ROUNDS))
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __getitem__(self, index: int) -> int:
+        if not 0 <= index < self.size:
+            raise IndexError(f'Permutation index {index} out of range for size {self.size}.')
+        bits: int = self._bits
+        mask: int = self._mask
+
+        value: int = index
+        while True:
+            left: int = value >> bits
+            right: int = value & mask
+            for key in self._keys:
+                left, right = right, left ^ (_mix(right ^ key) & mask)
+            value = (left << bits) | right
+            # Values outside the range are walked on through the permutation; the walk ends back inside it, at the
+            # latest at index itself.
+            if value < self.size:
+                return value
+
+
+def _mix(value: int) -> int:
+    """
+    Round function: splitmix64 finalizer.
+    """
+    value = (value ^ (value >> 30)) * 0xBF58476D1CE4E5B9 & _MASK_64
+    value = (value ^ (value >> 27)) * 0x94D049BB133111EB & _MASK_64
+    return value ^ (value >> 31)
@@ -1,98 +1,120 @@
-from typing import Any as _Any
+from contextlib import AbstractAsyncContextManager as _AbstractAsyncContextManager
+from itertools import islice as _islice
+from typing import Any as _Any, Awaitable as _Awaitable, Callable as _Callable, Mapping as _Mapping
 import random as _r
 import asyncio as _asyncio
 
 from discord import Message as _Message, Interaction as _Interaction, Member as _Member
 
 from discorduser.user.abstract import BotClient
+from piss.executing.compiler import Op, Program, compile_instructions
 from piss.instructions.abstract import Instruction as _Instruction
 from piss.instructions.build import BuildInstruction
-from piss.instructions.choice import ChoiceInstruction
 from piss.instructions.memory import MemoryInstruction
 from piss.instructions.push import PushInstruction
 from piss.instructions.randnum import RandomNumberInstruction
 from piss.instructions.randuser import RandomUserInstruction
 from piss.instructions.sleep import SleepInstruction
-from piss.instructions.writing import WritingInstruction
-from piss._utils.mem_tools import fetch as _fetch
+from piss._utils.mem_tools import Scope as _Scope
+# noinspection protected-member
+from piss._utils.permutation import Permutation as _Permutation
 from piss.exceptions import InstructionExecutionError as _InstructionExecutionError
-from utilities.exceptions import CustomDiscordException as _CustomDiscordException, ErrorTooltip as _ErrorTooltip
 
-MAX_EXECUTION_RECURSION_DEPTH = 5  # todo: into config file you go.
+# (instruction, interaction, memory stack, build). Extends or pushes the build in place.
+_Handler = _Callable[[_Instruction, _Message | _Interaction, _Scope[_Any], list[str]], None]
+_AsyncHandler = _Callable[[_Instruction, _Message | _Interaction, _Scope[_Any], list[str]], _Awaitable[None]]
+
 
 class InstructionExecutor:
     def __init__(self, client: BotClient) -> None:
         self.client: BotClient = client
         self._first_reply: bool = True
 
-        self._shuffled_member_list: list[_Member] = []
+        # tru(n): n maps through a random permutation of the guild member indices, drawn on first use. The member at
+        # that index is found by walking the member cache, never copying it, and kept so the same n names the same
+        # member for the rest of the execution, even if the guild changes.
+        self._member_permutation: _Permutation | None = None
+        self._members: dict[int, _Member] = {}  # By permuted index.
 
+        # Handlers indexed by Op, up to the control flow Ops. Bound here so subclasses can override handlers.
+        self._handlers: list[_Handler | _AsyncHandler] = [
+            self._build,  # Op.BUILD
+            self._memory,  # Op.MEMORY
+            self._rnd_num,  # Op.RANDOM_NUMBER
+            self._rnd_usr,  # Op.RANDOM_USER
+            self._push_build,  # Op.PUSH
+            self._sleep,  # Op.SLEEP
+        ]
 
-    async def run(self, instructions: list[_Instruction], interaction: _Message | _Interaction):
+    async def run(self, instructions: list[_Instruction] | Program, interaction: _Message | _Interaction):
         """
         Run the given Instructions in the context of the given interaction.
+        :param instructions: Parsed Instructions, or those compiled ahead of time by `compile_instructions`.
         """
+        program: Program = instructions if isinstance(instructions, Program) else compile_instructions(instructions)
         await self._exec(
-            instructions=instructions,
+            program=program,
             interaction=interaction,
-            recursion_depth=-1, # Incremented by _exec to 0
-            memory_stack=None, # todo: init memory
+            memory_stack=_Scope(), # todo: init memory
             push_final_build=True,
-            build=''
+            build=[]
         )
 
-    async def _exec(self, instructions: list[_Instruction], interaction: _Message | _Interaction,
-                    recursion_depth: int, memory_stack: list[dict[str, _Any]],
-                    push_final_build: bool,
-                    build: str) -> str:
-        recursion_depth += 1
-        if recursion_depth > MAX_EXECUTION_RECURSION_DEPTH:
-            raise _CustomDiscordException(
-                message=f'Maximum recursion depth of {recursion_depth} exceeded maximal value when executing Instructions.\n'
-                        f'{"\n".join(str(i) for i in instructions)}', error_type='ParsedExecutionRecursionDepthLimit',
-                tooltip=_ErrorTooltip.WIKI)
-        
-        i: int = 0
-        n: int = len(instructions)
-        
-        
-        while i < n:
-            instruction: _Instruction = instructions[i]
-            
-            # faster with a 'switch' case but is that even available.
-            if isinstance(instruction, BuildInstruction):
-                build += self._build(instruction)
-            elif isinstance(instruction, PushInstruction):
-                await self._push(instruction, build, interaction)
-                build = ''
-            elif isinstance(instruction, ChoiceInstruction):
-                build = await self._choice(instruction, interaction, recursion_depth, memory_stack, build)
-            elif isinstance(instruction, MemoryInstruction):
-                build += await self._memory(instruction, memory_stack)
-            elif isinstance(instruction, RandomNumberInstruction):
-                build += str(await self._rnd_num(instruction))
-            elif isinstance(instruction, RandomUserInstruction):
-                build += await self._rnd_usr(instruction, interaction)
-            elif isinstance(instruction, SleepInstruction):
-                await self._sleep(instruction)
-            elif isinstance(instruction, WritingInstruction):
-                build = await self._writing(instruction, interaction, recursion_depth, memory_stack, build)
-            else:
-                raise _CustomDiscordException() # todo: proper execution raise required.
+    async def _exec(self, program: Program, interaction: _Message | _Interaction, memory_stack: _Scope[_Any],
+                    push_final_build: bool, build: list[str]) -> None:
+        """
+        Runs a Program from start to end in one loop: nested Instructions are jumps, not calls.
+        :param build: Pieces of the message built so far, extended in place. Pushing it empties it.
+        """
+        code: list[tuple[Op, _Any]] = program.code
+        handlers: list[_Handler | _AsyncHandler] = self._handlers
+        typing: list[_AbstractAsyncContextManager] = []  # Typing indicators of the writing blocks entered.
+
+        pc: int = 0
+        n: int = len(code)
+        try:
+            while pc < n:
+                op, arg = code[pc]
+                pc += 1
+
+                if op < Op.PUSH:
+                    handlers[op](arg, interaction, memory_stack, build)
+                elif op < Op.CHOICE:
+                    await handlers[op](arg, interaction, memory_stack, build)
+                elif op is Op.CHOICE:
+                    pc = _r.choice(arg)
+                elif op is Op.JUMP:
+                    pc = arg
+                elif op is Op.WRITING_ENTER:
+                    indicator: _AbstractAsyncContextManager = interaction.channel.typing()
+                    await indicator.__aenter__()
+                    typing.append(indicator)
+                else:
+                    await typing.pop().__aexit__(None, None, None)
+        except BaseException as e:
+            while typing:
+                await typing.pop().__aexit__(type(e), e, e.__traceback__)
+            raise
 
         if push_final_build:
-            await self._push(PushInstruction(), build, interaction)
-            build = ''
-
-        return build
+            await self._push_build(PushInstruction(), interaction, memory_stack, build)
 
     # noinspection PyMethodMayBeStatic
     # this way to make testing framework easier to implement.
-    async def _build(self, instruction: BuildInstruction) -> str:
+    def _build(self, instruction: BuildInstruction, interaction: _Message | _Interaction,
+               memory_stack: _Scope[_Any], build: list[str]) -> None:
+        """
+        Extends build based on instruction.
+        """
+        build.append(instruction.text)
+
+    async def _push_build(self, instruction: PushInstruction, interaction: _Message | _Interaction,
+                          memory_stack: _Scope[_Any], build: list[str]) -> None:
         """
-        Returns build extension based on instruction.
+        Pushes the build so far and empties it.
         """
-        return instruction.text
+        await self._push(instruction, ''.join(build), interaction)
+        build.clear()
 
     async def _push(self, instruction: PushInstruction, build: str, interaction: _Interaction | _Message) -> None:
         """
@@ -113,44 +135,44 @@ class InstructionExecutor:
 
         self._first_reply = False
 
-    async def _choice(self, instruction: ChoiceInstruction, interaction: _Message | _Interaction, recursion_depth: int, memory_stack: list[dict[str, _Any]], build: str) -> str:
-        """
-        Branches Choice instruction and returns leftover build.
-        """
-        branch: list[_Instruction] = _r.choice(instruction.options)
-        build = await self._exec(
-            instructions=branch,
-            interaction=interaction,
-            recursion_depth=recursion_depth,
-            memory_stack=memory_stack,
-            push_final_build=False,
-            build=build)
-
-        return build
-
     # noinspection PyMethodMayBeStatic
     # this way to make testing framework easier to implement.
-    async def _memory(self, instruction: MemoryInstruction, memory_stack: list[dict[str, _Any]]) -> str:
-        return _fetch(memory_stack, instruction.key)
+    def _memory(self, instruction: MemoryInstruction, interaction: _Message | _Interaction,
+                memory_stack: _Scope[_Any], build: list[str]) -> None:
+        """
+        Extends build with the memory entry.
+        """
+        build.append(str(memory_stack.fetch(instruction.key)))
 
     # noinspection PyMethodMayBeStatic
     # this way to make testing framework easier to implement.
-    async def _rnd_num(self, instruction: RandomNumberInstruction) -> int:
+    def _rnd_num(self, instruction: RandomNumberInstruction, interaction: _Message | _Interaction,
+                 memory_stack: _Scope[_Any], build: list[str]) -> None:
         """
-        Returns random number from instruction parameters. Requires string-conversion to be usable for building.
+        Extends build with a random number from instruction parameters.
         """
-        return _r.randint(instruction.a, instruction.b)
+        build.append(str(_r.randint(instruction.a, instruction.b)))
 
-    async def _rnd_usr(self, instruction: RandomUserInstruction, interaction: _Interaction | _Message) -> str:
+    def _rnd_usr(self, instruction: RandomUserInstruction, interaction: _Interaction | _Message,
+                 memory_stack: _Scope[_Any], build: list[str]) -> None:
         """
-        Returns direct conversion user attribute from instruction parameters.
+        Extends build with the direct conversion of a user attribute from instruction parameters.
         """
-        if not self._shuffled_member_list:
-            self._shuffled_member_list = list(interaction.guild.members)
-            _r.shuffle(self._shuffled_member_list)
+        build.append(self._member_attribute(instruction, interaction))
 
-        index: int = instruction.index % len(self._shuffled_member_list)
-        member: _Member = self._shuffled_member_list[index]
+    def _member_attribute(self, instruction: RandomUserInstruction, interaction: _Interaction | _Message) -> str:
+        # noinspection PyProtectedMember
+        # guild.members copies the member cache on first index, so the cache itself is walked instead.
+        cache: _Mapping[int, _Member] = interaction.guild._members
+        if self._member_permutation is None:
+            self._member_permutation = _Permutation(len(cache))
+        permutation: _Permutation = self._member_permutation
+        index: int = permutation[instruction.index % len(permutation)]
+        member: _Member | None = self._members.get(index)
+        if member is None:
+            # The guild may have shrunk since the permutation was drawn.
+            member = next(_islice(cache.values(), index % len(cache), None))
+            self._members[index] = member
 
         if instruction.attribute == 'id':
             return str(member.id)
@@ -169,23 +191,9 @@ class InstructionExecutor:
 
     # noinspection PyMethodMayBeStatic
     # this way to make testing framework easier to implement.
-    async def _sleep(self, instruction: SleepInstruction) -> None:
+    async def _sleep(self, instruction: SleepInstruction, interaction: _Message | _Interaction,
+                     memory_stack: _Scope[_Any], build: list[str]) -> None:
         """
         Asynchronously sleeps for given time interval.
         """
         await _asyncio.sleep(instruction.time)
-
-    async def _writing(self, instruction: WritingInstruction, interaction: _Interaction, recursion_depth: int, memory_stack: list[dict[str, _Any]], build: str) -> str:
-        """
-        Executes embedded instructions while showing the typing indicator in the channel.
-        Returns leftover build.
-        """
-        async with interaction.channel.typing():
-            return await self._exec(
-                instructions=instruction.instructions,
-                recursion_depth=recursion_depth,
-                memory_stack=memory_stack,
-                build=build,
-                push_final_build=False,
-                interaction=interaction
-            )
\ No newline at end of file
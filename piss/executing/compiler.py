@@ -0,0 +1,132 @@
+from enum import IntEnum as _IntEnum
+from typing import Any as _Any
+
+from piss.exceptions import InstructionExecutionError as _InstructionExecutionError
+from piss.instructions.abstract import Instruction as _Instruction
+from piss.instructions.build import BuildInstruction
+from piss.instructions.choice import ChoiceInstruction
+from piss.instructions.memory import MemoryInstruction
+from piss.instructions.push import PushInstruction
+from piss.instructions.randnum import RandomNumberInstruction
+from piss.instructions.randuser import RandomUserInstruction
+from piss.instructions.sleep import SleepInstruction
+from piss.instructions.writing import WritingInstruction
+from utilities.exceptions import CustomDiscordException as _CustomDiscordException, ErrorTooltip as _ErrorTooltip
+
+"""
+Lowers parsed Instructions into a flat Program for the executor, which runs it in one loop without recursion.
+
+Every step of a Program is an (Op, argument) pair. Nested Instruction lists are laid out inline:
+- choice: CHOICE with the start address of every option, each option but the last ending in a JUMP past the others.
+- writing: its Instructions between WRITING_ENTER and WRITING_EXIT.
+"""
+
+MAX_EXECUTION_RECURSION_DEPTH = 5  # todo: into config file you go.
+
+
+class Op(_IntEnum):
+    # Extend the build, run synchronously. Argument: the Instruction.
+    BUILD = 0
+    MEMORY = 1
+    RANDOM_NUMBER = 2
+    RANDOM_USER = 3
+
+    # Awaited. Argument: the Instruction.
+    PUSH = 4
+    SLEEP = 5
+
+    # Control flow, run by the executor loop itself.
+    CHOICE = 6  # Argument: start addresses of the options.
+    JUMP = 7  # Argument: address.
+    WRITING_ENTER = 8  # Argument: None.
+    WRITING_EXIT = 9  # Argument: None.
+
+
+_opcodes: dict[type[_Instruction], Op] = {
+    BuildInstruction: Op.BUILD,
+    MemoryInstruction: Op.MEMORY,
+    RandomNumberInstruction: Op.RANDOM_NUMBER,
+    RandomUserInstruction: Op.RANDOM_USER,
+    PushInstruction: Op.PUSH,
+    SleepInstruction: Op.SLEEP,
+    ChoiceInstruction: Op.CHOICE,
+    WritingInstruction: Op.WRITING_ENTER,
+}
+
+
+class Program:
+    def __init__(self, code: list[tuple[Op, _Any]]) -> None:
+        """
+        :param code: Steps, as made by `compile_instructions`.
+        """
+        self.code: list[tuple[Op, _Any]] = code
+
+    def __len__(self) -> int:
+        return len(self.code)
+
+
+def compile_instructions(instructions: list[_Instruction]) -> Program:
+    """
+    :param instructions: Parsed Instructions.
+    :return: The Instructions as a flat Program.
+    :raises CustomDiscordException: Instructions nest deeper than MAX_EXECUTION_RECURSION_DEPTH.
+    :raises InstructionExecutionError: An Instruction type the executor has no Op for.
+    """
+    code: list[tuple[Op, _Any]] = []
+    _lower(instructions, code, 0)
+    return Program(code)
+
+
+def _opcode(instruction: _Instruction) -> Op:
+    """
+    Op of an Instruction, or of the nearest base of its type that has one.
+    """
+    op: Op | None = _opcodes.get(type(instruction))
+    if op is not None:
+        return op
+    for base in type(instruction).__mro__[1:]:
+        op = _opcodes.get(base)
+        if op is not None:
+            _opcodes[type(instruction)] = op
+            return op
+    raise _InstructionExecutionError(instruction, reason=f'No Op for Instruction type {type(instruction).__name__}.')
+
+
+def _lower(instructions: list[_Instruction], code: list[tuple[Op, _Any]], depth: int) -> None:
+    if depth > MAX_EXECUTION_RECURSION_DEPTH:
+        raise _CustomDiscordException(
+            message=f'Maximum recursion depth of {depth} exceeded maximal value when executing Instructions.\n'
+                    f'{"\n".join(str(i) for i in instructions)}', error_type='ParsedExecutionRecursionDepthLimit',
+            tooltip=_ErrorTooltip.WIKI)
+
+    for instruction in instructions:
+        op: Op = _opcode(instruction)
+
+        if op is Op.CHOICE:
+            instruction: ChoiceInstruction
+            if not instruction.options:
+                continue
+            choice_at: int = len(code)
+            code.append((Op.CHOICE, None))  # Patched once the options are laid out.
+
+            starts: list[int] = []
+            jumps: list[int] = []  # Addresses of the JUMPs ending the options, to patch.
+            for i, option in enumerate(instruction.options):
+                starts.append(len(code))
+                _lower(option, code, depth + 1)
+                if i < len(instruction.options) - 1:
+                    jumps.append(len(code))
+                    code.append((Op.JUMP, None))
+
+            code[choice_at] = (Op.CHOICE, tuple(starts))
+            for jump_at in jumps:
+                code[jump_at] = (Op.JUMP, len(code))
+
+        elif op is Op.WRITING_ENTER:
+            instruction: WritingInstruction
+            code.append((Op.WRITING_ENTER, None))
+            _lower(instruction.instructions, code, depth + 1)
+            code.append((Op.WRITING_EXIT, None))
+
+        else:
+            code.append((op, instruction))
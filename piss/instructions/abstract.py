@@ -1,8 +1,22 @@
+from __future__ import annotations
+
 from abc import ABC as ABC, abstractmethod as abstractmethod
 from re import Match as _Match
 
+# noinspection protected-member
+from piss._utils.mem_tools import Scope as _Scope
+
 
 class Instruction(ABC):
+    @staticmethod
+    @abstractmethod
+    def keywords() -> tuple[str, ...]:
+        """
+        Leading identifiers of this Instruction type's signatures, which the parser dispatches on.
+        Only statements starting with one of these, followed by `(`, are matched against the signatures.
+        """
+        raise NotImplementedError()
+
     @staticmethod
     @abstractmethod
     def signatures() -> tuple[tuple[str, int], ...]:
@@ -14,7 +28,7 @@ class Instruction(ABC):
 
     @staticmethod
     @abstractmethod
-    def from_match(match: _Match, ident: int, memory_stack: list[dict[str, type]], recursion_depth: int, writing: bool) -> Instruction:
+    def from_match(match: _Match, ident: int, memory_stack: _Scope[type], recursion_depth: int, writing: bool) -> Instruction:
         """
         Take one of the class' RegEx signature matches to create an Instruction.
         Requires Match input identifier.
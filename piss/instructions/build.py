@@ -1,6 +1,10 @@
+from __future__ import annotations
+
 from re import Match as _Match
 
 from piss.instructions.abstract import Instruction as _Instruction
+# noinspection protected-member
+from piss._utils.mem_tools import Scope as _Scope
 from piss.exceptions import InstructionParseError as _InstructionParseError
 from utilities.exceptions import ErrorTooltip as _ErrorTooltip
 
@@ -10,13 +14,20 @@ class BuildInstruction(_Instruction):
         return super().__str__() + f'[text={self.text}]'
 
     @staticmethod
-    def from_match(match: _Match, ident: int, memory_stack: list[dict[str, type]], recursion_depth: int,
+    def from_match(match: _Match, ident: int, memory_stack: _Scope[type], recursion_depth: int,
                    writing: bool) -> BuildInstruction:
         raise _InstructionParseError(
             'BuildInstruction incompatible with Signatures and from_match.',
             tooltip=_ErrorTooltip.ISSUE
         )
 
+    @staticmethod
+    def keywords() -> tuple[str, ...]:
+        raise _InstructionParseError(
+            'BuildInstruction incompatible with Signatures and from_match.',
+            tooltip=_ErrorTooltip.ISSUE
+        )
+
     @staticmethod
     def signatures() -> tuple[tuple[str, int], ...]:
         raise _InstructionParseError(
@@ -1,10 +1,11 @@
+from __future__ import annotations
+
 from re import Match as _Match
 import ast as _ast
 
 from piss.instructions.abstract import Instruction as _Instruction
-# noinspection PyProtectedMember
-from piss.parsing import _parse_top_level
-# todo fixme: circular import! parser -> parse order -> ChoiceInstruction -> parser
+# noinspection protected-member
+from piss._utils.mem_tools import Scope as _Scope
 
 class ChoiceInstruction(_Instruction):
     def __init__(self, options: list[list[_Instruction]]):
@@ -13,12 +14,16 @@ class ChoiceInstruction(_Instruction):
     def __str__(self) -> str:
         return super().__str__() + f'[opt={self.options}]'
 
+    @staticmethod
+    def keywords() -> tuple[str, ...]:
+        return 'choice',
+
     @staticmethod
     def signatures() -> tuple[tuple[str, int], ...]:
         return (r'^choice\(\s*(?P<options>.*)\s*\)$', 0),
 
     @staticmethod
-    def from_match(match: _Match, ident: int, memory_stack: list[dict[str, type]], recursion_depth: int,
+    def from_match(match: _Match, ident: int, memory_stack: _Scope[type], recursion_depth: int,
                    writing: bool) -> ChoiceInstruction:
         if not ident == 0:
             raise ValueError('Unsupported match identifier for Instruction of type Choice')
@@ -38,7 +43,9 @@ class ChoiceInstruction(_Instruction):
 
         opt_raw: tuple[str, ...]
 
-        # Turn into Instructions
+        # Turn into Instructions. Imported here, as the parser imports this module through its parse order.
+        # noinspection PyProtectedMember
+        from piss.parsing import _parse_top_level
         options: list[list[_Instruction]] = []
         for x in opt_raw:
             instr: list[_Instruction] = _parse_top_level(x, recursion_depth + 1, memory_stack, writing)
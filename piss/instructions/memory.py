@@ -1,18 +1,26 @@
+from __future__ import annotations
+
 from re import Match as _Match
 
 from piss.instructions.abstract import Instruction as _Instruction
+# noinspection protected-member
+from piss._utils.mem_tools import Scope as _Scope
 
 
 class MemoryInstruction(_Instruction):
     def __str__(self) -> str:
         return super().__str__() + f'[key={self.key}]'
 
+    @staticmethod
+    def keywords() -> tuple[str, ...]:
+        raise RuntimeError('MemoryInstruction incompatible with Signatures and from_match.')
+
     @staticmethod
     def signatures() -> tuple[tuple[str, int], ...]:
         raise RuntimeError('MemoryInstruction incompatible with Signatures and from_match.')
 
     @staticmethod
-    def from_match(match: _Match, ident: int, memory_stack: list[dict[str, type]], recursion_depth: int,
+    def from_match(match: _Match, ident: int, memory_stack: _Scope[type], recursion_depth: int,
                    writing: bool) -> MemoryInstruction:
         raise RuntimeError('MemoryInstruction incompatible with Signatures and from_match.')
 
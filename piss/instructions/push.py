@@ -1,9 +1,13 @@
+from __future__ import annotations
+
 from enum import Enum as _Enum
 from re import Match as _Match
 
 from discord import AllowedMentions as _AllowedMentions
 
 from piss.instructions.abstract import Instruction as _Instruction
+# noinspection protected-member
+from piss._utils.mem_tools import Scope as _Scope
 from piss.exceptions import InstructionParseError as _InstructionParseError
 
 
@@ -13,12 +17,16 @@ class PushInstruction(_Instruction):
         # so be it for some random list moment
         return super().__str__() + f'[ev={self.pingable.everyone}; usr={self.pingable.users}; role={self.pingable.roles}; reply={self.pingable.replied_user}]'
 
+    @staticmethod
+    def keywords() -> tuple[str, ...]:
+        return 'push',
+
     @staticmethod
     def signatures() -> tuple[tuple[str, int], ...]:
         return (r'^push\((?P<pingable>(\d?))\)$', 0),
 
     @staticmethod
-    def from_match(match: _Match, ident: int, memory_stack: list[dict[str, type]], recursion_depth: int,
+    def from_match(match: _Match, ident: int, memory_stack: _Scope[type], recursion_depth: int,
                    writing: bool) -> PushInstruction:
         if not ident == 0:
             raise ValueError('Unsupported match identifier for Instruction of type Push')
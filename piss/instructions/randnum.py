@@ -1,6 +1,10 @@
+from __future__ import annotations
+
 from re import Match as _Match
 
 from piss.instructions.abstract import Instruction as _Instruction
+# noinspection protected-member
+from piss._utils.mem_tools import Scope as _Scope
 from piss.exceptions import InstructionParseError as _InstructionParseError
 
 
@@ -8,12 +12,16 @@ class RandomNumberInstruction(_Instruction):
     def __str__(self) -> str:
         return super().__str__() + f'[a={self.a}; b={self.b}]'
 
+    @staticmethod
+    def keywords() -> tuple[str, ...]:
+        return 'rand', 'random'
+
     @staticmethod
     def signatures() -> tuple[tuple[str, int], ...]:
         return (r'^rand(om)?\((?P<a>-?\d+),\s?(?P<b>-?\d+)\)$', 0), # todo: make b optional s.t. it is 0-a (inclusive)
 
     @staticmethod
-    def from_match(match: _Match, ident: int, memory_stack: list[dict[str, type]], recursion_depth: int,
+    def from_match(match: _Match, ident: int, memory_stack: _Scope[type], recursion_depth: int,
                    writing: bool) -> RandomNumberInstruction:
         if not ident == 0:
             raise ValueError('Unsupported match identifier for Instruction of type RandomNumber')
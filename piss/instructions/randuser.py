@@ -1,7 +1,11 @@
+from __future__ import annotations
+
 from re import Match as _Match
-from typing import TypeAlias as _TypeAlias, Literal as _Literal
+from typing import TypeAlias as _TypeAlias, Literal as _Literal, get_args as _get_args
 
 from piss.instructions.abstract import Instruction as _Instruction
+# noinspection protected-member
+from piss._utils.mem_tools import Scope as _Scope
 from piss.exceptions import InstructionParseError as _InstructionParseError
 
 
@@ -12,12 +16,16 @@ class RandomUserInstruction(_Instruction):
     def __str__(self) -> str:
         return super().__str__() + f'[i={self.index}; attr={self.attribute}]'
 
+    @staticmethod
+    def keywords() -> tuple[str, ...]:
+        return 'tru',
+
     @staticmethod
     def signatures() -> tuple[tuple[str, int], ...]:
         return (r'^tru\((?P<num>-?\d+)(?:,\s*(?P<attr>\w+))?\)$', 0),
 
     @staticmethod
-    def from_match(match: _Match, ident: int, memory_stack: list[dict[str, type]], recursion_depth: int,
+    def from_match(match: _Match, ident: int, memory_stack: _Scope[type], recursion_depth: int,
                    writing: bool) -> RandomUserInstruction:
         if not ident == 0:
             raise ValueError('Unsupported match identifier for Instruction of type RandomUser')
@@ -32,10 +40,10 @@ class RandomUserInstruction(_Instruction):
 
         if not attr:
             attr = 'account'
-        if attr not in UserAttributeOptions:
+        if attr not in _get_args(UserAttributeOptions):
             raise _InstructionParseError(match.group(0), f'Incompatible attribute.\n'
                                                     f'Received: **{attr}**.\n'
-                                                    f'Expected: Element in **{UserAttributeOptions}**.')
+                                                    f'Expected: Element in **{_get_args(UserAttributeOptions)}**.')
         return RandomUserInstruction(index=num, attribute=attr)
 
     def __init__(self, index: int, attribute: UserAttributeOptions) -> None:
@@ -1,7 +1,11 @@
+from __future__ import annotations
+
 from re import Match as _Match
 
 from piss.exceptions import InstructionParseError as _InstructionParseError
 from piss.instructions.abstract import Instruction as _Instruction
+# noinspection protected-member
+from piss._utils.mem_tools import Scope as _Scope
 
 SLEEP_TIMER_UPPER_BOUND: float = 3600  # in seconds
 SLEEP_TIMER_LOWER_BOUND: float = 0.5
@@ -12,7 +16,7 @@ class SleepInstruction(_Instruction):
         return super().__str__() + f'[t={self.time}]'
 
     @staticmethod
-    def from_match(match: _Match, ident: int, memory_stack: list[dict[str, type]], recursion_depth: int,
+    def from_match(match: _Match, ident: int, memory_stack: _Scope[type], recursion_depth: int,
                    writing: bool) -> SleepInstruction:
         if not ident == 0:
             raise ValueError('Unsupported match identifier for Instruction of type Sleep')
@@ -34,6 +38,10 @@ class SleepInstruction(_Instruction):
                                                          f'Received: **{time}**. Maximum: **{SLEEP_TIMER_UPPER_BOUND}**.')
         return SleepInstruction(time)
 
+    @staticmethod
+    def keywords() -> tuple[str, ...]:
+        return 'sleep',
+
     @staticmethod
     def signatures() -> tuple[tuple[str, int], ...]:
         return (r'^sleep\((?P<time>(\d{1,4}(\.\d{1,2})?)?)\)$', 0),
@@ -1,20 +1,27 @@
+from __future__ import annotations
+
 from re import Match as _Match
 
 from piss.instructions.abstract import Instruction as _Instruction
+# noinspection protected-member
+from piss._utils.mem_tools import Scope as _Scope
 from piss.exceptions import InstructionParseError as _InstructionParseError
-from piss.parsing import _parse_instruction_block
 
 
 class WritingInstruction(_Instruction):
     def __str__(self) -> str:
         return super().__str__() + f'[instr={self.instructions}]'
 
+    @staticmethod
+    def keywords() -> tuple[str, ...]:
+        return 'writing',
+
     @staticmethod
     def signatures() -> tuple[tuple[str, int], ...]:
         return (r'^writing\((?P<instr>(.*))\)$', 0),
 
     @staticmethod
-    def from_match(match: _Match, ident: int, memory_stack: list[dict[str, type]], recursion_depth: int,
+    def from_match(match: _Match, ident: int, memory_stack: _Scope[type], recursion_depth: int,
                    writing: bool) -> WritingInstruction:
         if not ident == 0:
             raise ValueError('Unsupported match identifier for Instruction of type Writing')
@@ -23,6 +30,9 @@ class WritingInstruction(_Instruction):
             raise _InstructionParseError(match.group(0),
                                         f'Writing Instruction cannot be used inside of another Writing Instruction')
         content = match.group('instr')
+        # Imported here, as the parser imports this module through its parse order.
+        # noinspection PyProtectedMember
+        from piss.parsing import _parse_instruction_block
         content_instr: list[_Instruction] = _parse_instruction_block(content, memory_stack, recursion_depth + 1, writing=True)
         if not content_instr:
             raise _InstructionParseError(match.group(0),
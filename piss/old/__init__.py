@@ -509,3 +509,24 @@ def parse_variables(parse_string: str, depth: int = 0, memstack: list[dict[str,
     if build: instructions.append(Instruction(InstructionType.BUILD, content=build))
 
     return instructions
+
+
+def memory_keys(instructions: list[Instruction]) -> set[str]:
+    """
+    Memory entries parsed instructions read, including those in nested writing and choice blocks.
+    Lets the executor build only those.
+    :param instructions: Output of `parse_variables`.
+    """
+    keys: set[str] = set()
+    pending: list[list[Instruction]] = [instructions]
+    while pending:
+        for instruction in pending.pop():
+            if instruction.type == InstructionType.BASIC_REPLACE:
+                keys.add(instruction.options['key'])
+            elif instruction.type == InstructionType.SLEEP and isinstance(instruction.options['time'], str):
+                keys.add(instruction.options['time'])
+            elif instruction.type == InstructionType.WRITING:
+                pending.append(instruction.options['instructions'])
+            elif instruction.type == InstructionType.CHOICE:
+                pending.extend(instruction.options['options'])
+    return keys
@@ -0,0 +1,88 @@
+import hashlib as _hashlib
+from collections import OrderedDict
+from time import perf_counter
+
+from data.implementation.utilities.eviction import approximate_size
+from data.implementation.utilities.statistics import CacheStats
+from piss.old import Instruction, parse_variables
+from piss.old.serialization import load_instructions
+
+
+class ParseCache:
+    """
+    Size-bounded LRU cache of parsed PISS strings, keyed by a hash of their source text, so stored facts, sayings and
+    replies are parsed once rather than on every use.
+    Parsed Instructions are shared between callers: treat them as read-only. Parse errors are raised, not cached.
+    """
+
+    def __init__(self, max_entries: int = 4096) -> None:
+        """
+        :param max_entries: Parsed strings kept, least recently used are evicted first.
+        """
+        if max_entries < 1:
+            raise ValueError('Parse cache must hold at least one entry.')
+        self.max_entries: int = max_entries
+        # Source text digest -> parsed Instructions and their approximate size in bytes.
+        self._entries: OrderedDict[bytes, tuple[list[Instruction], int]] = OrderedDict()
+        self._bytes: int = 0
+        self.stats: CacheStats = CacheStats()  # Every miss is a load: the time spent parsing.
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def _key(text: str) -> bytes:
+        return _hashlib.blake2b(text.encode(), digest_size=16).digest()
+
+    def parse(self, text: str) -> list[Instruction]:
+        """
+        `parse_variables`, served from cache when the same text was parsed before.
+        :param text: PISS source.
+        :raises InstructionParseError: Source does not parse.
+        """
+        return self.load(text, None)
+
+    def load(self, text: str, compiled: bytes | None) -> list[Instruction]:
+        """
+        Like `parse`, but on a miss it loads the stored form of the text instead, if it has one of the current format
+        version. See `piss.old.serialization`.
+        :param text: PISS source.
+        :param compiled: Stored form of the source, if any.
+        :raises InstructionParseError: Source has no usable stored form and does not parse.
+        """
+        key: bytes = self._key(text)
+        entry: tuple[list[Instruction], int] | None = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+            self.stats.hits += 1
+            return entry[0]
+
+        self.stats.misses += 1
+        start: float = perf_counter()
+        try:
+            instructions: list[Instruction] | None = load_instructions(compiled) if compiled is not None else None
+            if instructions is None:
+                instructions = parse_variables(text)
+        except BaseException:
+            self.stats.record_load(perf_counter() - start, failed=True)
+            raise
+        self.stats.record_load(perf_counter() - start, failed=False)
+
+        size: int = approximate_size(instructions)
+        self._entries[key] = (instructions, size)
+        self._bytes += size
+        while len(self._entries) > self.max_entries:
+            _, (_, evicted_size) = self._entries.popitem(last=False)
+            self._bytes -= evicted_size
+            self.stats.evictions += 1
+        return instructions
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._bytes = 0
+
+    def get_stats(self) -> dict[str, dict[str, int | float | None]]:
+        """
+        Counters and size, in the layout of `RecursiveCacheHandler.get_stats`.
+        """
+        return {'ROOT': self.stats.as_json() | {'entries': len(self._entries), 'bytes': self._bytes}}
@@ -1,7 +1,8 @@
 import asyncio as _asyncio
 import datetime as _datetime
 import random as _r
-from typing import Any
+from itertools import islice
+from typing import Any, Callable, Mapping, TypeVar
 
 import discord
 from discord import AllowedMentions, Message, Interaction, Member, VoiceChannel, StageChannel, Thread, TextChannel, \
@@ -10,9 +11,13 @@ from discord.abc import Messageable
 
 from discorduser.user.abstract import BotClient
 from utilities.exceptions import CustomDiscordException, ErrorTooltip, IncompatibleTargetChannel
-from piss.old import Instruction, InstructionType, MentionOptions, INITIAL_MEMORY_TYPES, UserAttributeOptions
+# noinspection protected-member
+from piss._utils.permutation import Permutation
+from piss.old import Instruction, InstructionType, MentionOptions, INITIAL_MEMORY_TYPES, UserAttributeOptions, \
+    memory_keys
 
 MAX_EXECUTION_RECURSION_DEPTH = 5  # todo: into config file you go.
+FACT_COUNT_KEYS: frozenset[str] = frozenset({'local_facts', 'global_facts', 'total_facts'})
 
 
 class ParsedExecutionFailure(CustomDiscordException):
@@ -22,6 +27,49 @@ class ParsedExecutionFailure(CustomDiscordException):
             cause)
 
 
+_T = TypeVar('_T')
+
+
+def _require(value: _T | None) -> _T:
+    if value is None:
+        raise ValueError('Cannot prepare memory data, missing required data to construct initial memory.')
+    return value
+
+
+class InitialMemory(dict[str, Any]):
+    """
+    Initial memory of one execution. Every entry is computed when first read and kept, so a program only pays for the
+    entries it uses. Reads of entries outside INITIAL_MEMORY_TYPES raise KeyError, like a plain dict.
+    """
+
+    def __init__(self, resolvers: dict[str, Callable[[], Any]]) -> None:
+        """
+        :param resolvers: Function computing each entry, for every key of INITIAL_MEMORY_TYPES not set directly.
+        """
+        super().__init__()
+        self._resolvers: dict[str, Callable[[], Any]] = resolvers
+
+    def __missing__(self, key: str) -> Any:
+        resolver: Callable[[], Any] | None = self._resolvers.get(key)
+        if resolver is None:
+            raise KeyError(key)
+        try:
+            val = resolver()
+        except CustomDiscordException as e:
+            raise e
+        except Exception as e:
+            raise CustomDiscordException(message=f'Initial Instruction Memory failed to build **{key}**.', cause=e,
+                                         error_type='InstructionMemoryError')
+        expected: type = INITIAL_MEMORY_TYPES[key]
+        if type(val) != expected:
+            raise CustomDiscordException(error_type='InstructionMemoryError',
+                                         message=f'Initial Instruction Memory has a typing mismatch from parser specification at **{key}** (expected **{expected.__name__}**, given **{type(val)} ({val})**).\n'
+                                                 f'This is *probably* an implementation error and probably has to be fixed by developers manually.\n'
+                                                 f'Aborting execution to preserve memory safety.')
+        self[key] = val
+        return val
+
+
 class InstructionExecutor:
     """
     Executes given instructions using asynchronous run method.
@@ -30,7 +78,10 @@ class InstructionExecutor:
 
     def __init__(self, client: BotClient):
         self.client = client
-        self.shuffled_memberlist: list[Member] = []
+        # RANDOMUSER: random order of the guild member indices, drawn on first use. Members are found by walking the
+        # member cache, never copying it, and kept by permuted index so a num keeps naming the same member.
+        self.member_permutation: Permutation | None = None
+        self.members: dict[int, Member] = {}
         self.fresh: bool = True
         self.guild_id = None
 
@@ -56,7 +107,7 @@ class InstructionExecutor:
 
         i: int = 0
         build: str = build if build else ''
-        mem: dict[str, Any] = {} if memstack else self.init_memory(interaction)
+        mem: dict[str, Any] = {} if memstack else await self.init_memory(interaction, memory_keys(instructions))
         memstack = memstack if memstack else []  # outer scope memory. Initialize here for now.
         local_scope = memstack + [mem]
         while i < len(instructions):
@@ -78,12 +129,12 @@ class InstructionExecutor:
                     build += self.basic_replace(local_scope, instruction.options['key'])
                 elif instruction.type == InstructionType.WRITING:
                     build = await self.is_writing(instruction.options['instructions'], interaction, depth, build,
-                                                  memstack)
+                                                  local_scope)
                     if build is None:
                         raise TypeError(
                             'Instruction of type WRITING returned None value instead of String.')  # todo : this can't be right
                 elif instruction.type == InstructionType.CHOICE:
-                    build = await self.choice(instruction.options['options'], interaction, depth, build, memstack)
+                    build = await self.choice(instruction.options['options'], interaction, depth, build, local_scope)
                 elif instruction.type == InstructionType.RANDOM_REPL:
                     build += str(self.random(instruction.options['left'], instruction.options['right']))
                 elif instruction.type == InstructionType.RANDOMUSER:
@@ -102,96 +153,95 @@ class InstructionExecutor:
         else:
             return build
 
-    def init_memory(self, interaction: Interaction | Message) -> dict[str, Any]:
-
+    async def init_memory(self, interaction: Interaction | Message, keys: set[str] | None = None) -> dict[str, Any]:
+        """
+        Prepares the initial memory. Entries are only computed once read, except for the fact counts, which take a
+        database call: those are loaded here, and only if any of them is in `keys`.
+        :param interaction: Interaction context.
+        :param keys: Entries the instructions read, see `memory_keys`. All entries if None.
+        """
         # noinspection bad-assignment
         guild: discord.Guild = interaction.guild
         if not guild:
             raise PermissionError('Cannot execute instructions outside of Guild context.')
 
         # todo : pretty sure this don't work on messages.
-        if isinstance(interaction, Interaction):
-            user: discord.User | discord.Member = interaction.user
-            member: discord.Member | None = guild.get_member(interaction.user.id)
-        else:
-            user: discord.User | discord.Member = interaction.author
-            member: discord.Member | None = guild.get_member(interaction.author.id)
-
+        user: discord.User | discord.Member = interaction.user if isinstance(interaction, Interaction) \
+            else interaction.author
         me: discord.ClientUser | None = self.client.user
-        if not me:
-            raise ValueError('Cannot prepare memory data, missing required data to construct initial memory.')
 
-        me_member: discord.Member | None = guild.get_member(me.id)
         if not isinstance(interaction.channel, (TextChannel, VoiceChannel, StageChannel, Thread)):
             raise IncompatibleTargetChannel(interaction.channel, Messageable.__name__)
         channel: TextChannel | VoiceChannel | StageChannel | Thread = interaction.channel
-        # noinspection bad-assignment
-        # always exists.
-        owner: discord.Member = guild.owner  # guild owner
 
-        local_facts: int = self.client.fact.get_fact_count(guild.id)
-        global_facts: int = self.client.fact.get_fact_count(None)
-        total_facts: int = local_facts + global_facts
+        def member() -> discord.Member:
+            return _require(guild.get_member(user.id))
 
-        if None in [member, me, me_member] or not isinstance(me, discord.abc.User):
-            raise ValueError('Cannot prepare memory data, missing required data to construct initial memory.')
-        try:
-            # noinspection unresolved-references
-            # Any Nones should be excluded by the statements above.
-            out = {
-                '\\n': '\n',
-
-                # interaction target
-                'user.id': user.id,
-                'user': user.display_name,
-                'user.name': user.display_name,
-                'user.created_at': user.created_at,
-                'user.account': user.name,
-                'user.mutual_guilds': len(member.mutual_guilds),
-                'user.roles': len(member.roles),
-
-                'self.id': me.id,
-                'self': me.display_name,
-                'self.name': me.display_name,
-                'self.created_at': me.created_at,
-                'self.account': me.name,
-                'self.roles': len(me_member.roles) if me_member else 0,
-
-                'channel': channel.name,
-                'channel.id': channel.id,
-                'channel.name': channel.name,
-                'channel.created_at': channel.created_at,
-                'channel.jump_url': channel.jump_url,
-
-                'guild': guild.name,
-                'guild.id': guild.id,
-                'guild.name': guild.name,
-                'guild.created_at': guild.created_at,
-                'guild.members': guild.member_count,
-                'guild.roles': len(guild.roles),
-
-                # guild owner
-                'owner.id': owner.id,
-                'owner': owner.display_name,
-                'owner.name': owner.display_name,
-                'owner.created_at': owner.created_at,
-                'owner.account': owner.name,
-                'owner.roles': len(owner.roles) if owner else 0,
-                'owner.mutual_guilds': len(owner.mutual_guilds),
-
-                # external
-                'local_facts': local_facts,
-                'global_facts': global_facts,
-                'total_facts': total_facts,
-            }
+        def me_member() -> discord.Member | None:
+            return guild.get_member(_require(me).id)
+
+        def owner() -> discord.Member:
+            # guild owner
+            return _require(guild.owner)
+
+        # noinspection unresolved-references
+        # Nones are refused by _require when read.
+        out = InitialMemory({
+            '\\n': lambda: '\n',
+
+            # interaction target
+            'user.id': lambda: user.id,
+            'user': lambda: user.display_name,
+            'user.name': lambda: user.display_name,
+            'user.created_at': lambda: user.created_at,
+            'user.account': lambda: user.name,
+            'user.mutual_guilds': lambda: len(member().mutual_guilds),
+            'user.roles': lambda: len(member().roles),
+
+            'self.id': lambda: _require(me).id,
+            'self': lambda: _require(me).display_name,
+            'self.name': lambda: _require(me).display_name,
+            'self.created_at': lambda: _require(me).created_at,
+            'self.account': lambda: _require(me).name,
+            'self.roles': lambda: len(m.roles) if (m := me_member()) else 0,
+
+            'channel': lambda: channel.name,
+            'channel.id': lambda: channel.id,
+            'channel.name': lambda: channel.name,
+            'channel.created_at': lambda: channel.created_at,
+            'channel.jump_url': lambda: channel.jump_url,
+
+            'guild': lambda: guild.name,
+            'guild.id': lambda: guild.id,
+            'guild.name': lambda: guild.name,
+            'guild.created_at': lambda: guild.created_at,
+            'guild.members': lambda: guild.member_count,
+            'guild.roles': lambda: len(guild.roles),
+
+            'owner.id': lambda: owner().id,
+            'owner': lambda: owner().display_name,
+            'owner.name': lambda: owner().display_name,
+            'owner.created_at': lambda: owner().created_at,
+            'owner.account': lambda: owner().name,
+            'owner.roles': lambda: len(owner().roles),
+            'owner.mutual_guilds': lambda: len(owner().mutual_guilds),
+        })
+
+        # external
+        if keys is None or not FACT_COUNT_KEYS.isdisjoint(keys):
+            try:
+                global_facts, local_facts = await self.client.async_fact.get_fact_counts(guild.id)
+            except Exception as e:
+                raise CustomDiscordException(message='Initial Instruction Memory failed to build.', cause=e,
+                                             error_type='InstructionMemoryError')
+            out.update(local_facts=local_facts, global_facts=global_facts, total_facts=local_facts + global_facts)
+
+        if keys is None:
+            for key in INITIAL_MEMORY_TYPES.keys():
+                _ = out[key]
             # check for safety if all keys from parser specification are present.
             self.check_init_memory(out)
-            return out
-        except CustomDiscordException as e:
-            raise e  # Pass pre-constructed Exceptions up to user layer.
-        except Exception as e:
-            raise CustomDiscordException(message='Initial Instruction Memory failed to build.', cause=e,
-                                         error_type='InstructionMemoryError')
+        return out
 
     def check_init_memory(self, mem: dict[str, Any]) -> None:  # noqa intentional static defined as non-static
         """
@@ -231,15 +281,16 @@ class InstructionExecutor:
         :param keys: The keys to look up.
         :return: A { key: value } dictionary for each key in keys. None if no value found.
         """
-        # merge memdict into a single dict:
-        mem: dict[str, Any] = {}
-        for frame in reversed(memdict):  # reversed so, if somehow duplicates exist, the top-framed one takes precedence
-            for k, v in frame.items():
-                mem[
-                    k] = v  # todo: do I set this up such that it's returned from a function, that way I can also make other merged-mem functions (like keys)
-
-        memkeys = mem.keys()
-        return {key: mem[key] if key in memkeys else None for key in keys}
+        out: dict[str, Any] = {}
+        for key in keys:
+            out[key] = None
+            for frame in reversed(memdict):  # reversed so, if somehow duplicates exist, the top-framed one takes precedence
+                try:
+                    out[key] = frame[key]  # Indexed rather than iterated, so an InitialMemory frame builds the entry.
+                    break
+                except KeyError:
+                    continue
+        return out
 
     def random_user(self, num: int, attribute: UserAttributeOptions, interaction: Interaction | Message) -> str:
         # noinspection bad-assignment
@@ -249,12 +300,17 @@ class InstructionExecutor:
             raise PermissionError(
                 f'Cannot run RANDOMUSER Instruction, as Executor instance holds data from a different guild.\n'
                 f'To prevent data leakage, aborting execution.')
-        if not self.guild_id or not self.shuffled_memberlist:
+        # noinspection PyProtectedMember
+        # guild.members copies the member cache on first index, so the cache itself is walked instead.
+        cache: Mapping[int, Member] = guild._members
+        if not self.guild_id or self.member_permutation is None:
             self.guild_id = guild.id
-            self.shuffled_memberlist = [i for i in guild.members if i is not None]
-            _r.shuffle(self.shuffled_memberlist)
-        index = num % len(self.shuffled_memberlist)
-        member = self.shuffled_memberlist[index]
+            self.member_permutation = Permutation(len(cache))
+        index: int = self.member_permutation[num % len(self.member_permutation)]
+        if index not in self.members:
+            # The guild may have shrunk since the permutation was drawn.
+            self.members[index] = next(islice(cache.values(), index % len(cache), None))
+        member: Member = self.members[index]
         options_dict: dict[UserAttributeOptions, Any] = {
             UserAttributeOptions.ID: member.id,
             UserAttributeOptions.NAME: member.display_name,
@@ -370,7 +426,7 @@ class DebugInstructionExecutor(InstructionExecutor):
         out += ' } CHOICE[' + str(index) + '] END}' if not self.pure_output else ''
         return out
 
-    def init_memory(self, interaction: Interaction | Message) -> dict[str, Any]:
+    async def init_memory(self, interaction: Interaction | Message, keys: set[str] | None = None) -> dict[str, Any]:
         now: _datetime.datetime = _datetime.datetime.now()
         out = {
             '\\n': '\n',
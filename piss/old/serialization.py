@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import json as _json
+from enum import Enum
+
+from piss.old import Instruction, InstructionParseError, InstructionType, MentionOptions, UserAttributeOptions, \
+    parse_variables
+
+"""
+Compact, versioned storage form of parsed PISS, so stored strings need not be parsed again at runtime.
+
+Layout: MAGIC, one byte FORMAT_VERSION, then compact JSON of the Instruction tree:
+- Instruction: {"t": type value, "o": {option: value}}
+- Enum member: {"e": enum name, "v": member value}
+- lists and JSON scalars as themselves.
+Bump FORMAT_VERSION whenever Instructions or their options change shape; stored forms of other versions are then
+ignored and their source text is parsed instead.
+"""
+
+MAGIC: bytes = b'PISS'
+FORMAT_VERSION: int = 1
+_ENUMS: dict[str, type[Enum]] = {e.__name__: e for e in (MentionOptions, UserAttributeOptions)}
+
+
+def _encode(val):
+    if isinstance(val, Instruction):
+        return {'t': val.type.value, 'o': {k: _encode(v) for k, v in val.options.items()}}
+    if isinstance(val, Enum):
+        return {'e': type(val).__name__, 'v': val.value}
+    if isinstance(val, (list, tuple)):
+        return [_encode(v) for v in val]
+    if val is None or isinstance(val, (str, int, float, bool)):
+        return val
+    raise TypeError(f'Cannot serialize Instruction option of type {type(val)}')
+
+
+def _decode(val):
+    if isinstance(val, list):
+        return [_decode(v) for v in val]
+    if isinstance(val, dict):
+        if 't' in val:
+            return Instruction(InstructionType(val['t']), **{k: _decode(v) for k, v in val['o'].items()})
+        return _ENUMS[val['e']](val['v'])
+    return val
+
+
+def dump_instructions(instructions: list[Instruction]) -> bytes:
+    """
+    :param instructions: Parsed PISS, as returned by `parse_variables`.
+    :return: Storage form of the instructions.
+    """
+    body: str = _json.dumps(_encode(instructions), separators=(',', ':'), ensure_ascii=False)
+    return MAGIC + bytes((FORMAT_VERSION,)) + body.encode()
+
+
+def is_current(data: bytes) -> bool:
+    """
+    Is the data a storage form of the current format version? Meant to be handed to the data layer, which compiles
+    stored forms that are not again.
+    """
+    return len(data) > len(MAGIC) and data.startswith(MAGIC) and data[len(MAGIC)] == FORMAT_VERSION
+
+
+def load_instructions(data: bytes) -> list[Instruction] | None:
+    """
+    :param data: Storage form made by `dump_instructions`.
+    :return: The instructions, or None if the data is of another format version or unreadable.
+    """
+    if not is_current(data):
+        return None
+    try:
+        return _decode(_json.loads(data[len(MAGIC) + 1:]))
+    except (ValueError, KeyError, TypeError):
+        return None
+
+
+def compile_source(text: str) -> bytes | None:
+    """
+    Parses PISS source into its storage form. Meant to be handed to the data layer, which stores it next to the text.
+    :return: Storage form, or None if the text does not parse.
+    """
+    try:
+        return dump_instructions(parse_variables(text))
+    except InstructionParseError:
+        return None
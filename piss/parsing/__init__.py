@@ -1,23 +1,165 @@
-import datetime as _datetime
 import re as _re
-from re import Match as _Match
+from re import Match as _Match, Pattern as _Pattern
 
 from piss.instructions.memory import MemoryInstruction as _MemoryInstruction
+from piss.parsing.lexer import Token as _Token, TokenType as _TokenType, statement_text as _statement_text, \
+    tokenize as _tokenize
 from piss.parsing.parse_order import parse_order as _parse_order
 from piss.exceptions import InstructionParseError as _InstructionParseError
 from piss.instructions.abstract import Instruction as _Instruction
 from piss.instructions.build import BuildInstruction as _BuildInstruction
 # noinspection protected-member
-from piss._utils.mem_tools import fetch as _fetch, INITIAL_MEMORY_TYPES
-# noinspection protected-member
-from piss._utils.symbols import be_map, bounds, doubles, escapes, terminator
+from piss._utils.mem_tools import INITIAL_MEMORY_SCOPE, Scope as _Scope
 from utilities.exceptions import CustomDiscordException as _CustomDiscordException
 
 MAX_RECURSION_DEPTH: int = 5 # todo: config
 
 # todo: improve feedback information
 
-def _parse_top_level(parse_string: str, recursion_depth: int, memory_stack: list[dict[str, type]], writing: bool) -> list[_Instruction]:
+# Leading identifier -> compiled signatures to try for it, in parse order.
+_dispatch: dict[str, list[tuple[_Pattern, int, type[_Instruction]]]] = {}
+for _inst_type in _parse_order:
+    for _keyword in _inst_type.keywords():
+        _dispatch.setdefault(_keyword, []).extend(
+            (_re.compile(sig), ident, _inst_type) for sig, ident in _inst_type.signatures())
+
+
+class _Parser:
+    """
+    Recursive-descent parser over the tokens of one source string.
+    Text becomes Build Instructions; every block is split into statements on top-level `;`, each of which is matched
+    only against the signatures of the Instruction its leading identifier names, or else read as a memory call.
+    """
+
+    def __init__(self, source: str, tokens: list[_Token], memory_stack: _Scope[type], recursion_depth: int,
+                 writing: bool) -> None:
+        self.source: str = source
+        self.tokens: list[_Token] = tokens
+        self.pos: int = 0  # Index of the next token.
+        self.memory_stack: _Scope[type] = memory_stack  # Scope of the block being parsed.
+        self.recursion_depth: int = recursion_depth
+        self.writing: bool = writing
+
+    def top_level(self) -> list[_Instruction]:
+        instructions: list[_Instruction] = []
+        text: list[str] = []  # Text since the last block.
+
+        source: str = self.source
+        tokens: list[_Token] = self.tokens
+        n: int = len(tokens)
+
+        while self.pos < n:
+            token: _Token = tokens[self.pos]
+            self.pos += 1
+
+            if token.type is _TokenType.BLOCK_OPEN:
+                if text:
+                    instructions.append(_BuildInstruction(text=''.join(text)))
+                    text = []
+                instructions += self.block()
+            elif token.type is _TokenType.ESCAPE:
+                text.append(source[token.start + 1:token.end])
+            else:
+                text.append(source[token.start:token.end])
+
+        if text: instructions.append(_BuildInstruction(text=''.join(text)))
+        return instructions
+
+    def block(self) -> list[_Instruction]:
+        """
+        Parses statements up to the end of the current block, and consumes its closing token if it has one.
+        """
+        tokens: list[_Token] = self.tokens
+        n: int = len(tokens)
+
+        # region Step 1: separate into statements, as (first token, past last token).
+        statements: list[tuple[int, int]] = []
+        start: int = self.pos
+        depth: int = 0  # Brackets opened within the current statement.
+
+        while self.pos < n:
+            token_type: _TokenType = tokens[self.pos].type
+            if token_type is _TokenType.BLOCK_CLOSE:
+                break
+            elif token_type is _TokenType.OPEN:
+                depth += 1
+            elif token_type is _TokenType.CLOSE:
+                depth -= 1
+            elif token_type is _TokenType.TERMINATOR and not depth:
+                statements.append((start, self.pos))
+                start = self.pos + 1
+            self.pos += 1
+
+        statements.append((start, self.pos))
+        self.pos += 1  # Block closing token.
+        # endregion
+
+        outer: _Scope[type] = self.memory_stack
+        self.memory_stack = outer.child()
+
+        # region Step 2: Instruction recognition
+        try:
+            statements = [(start, end) for start, end in statements if self._skip_space(start, end) < end]
+            last: int = len(statements) - 1
+            return [self.statement(start, end, i == last) for i, (start, end) in enumerate(statements)]
+        finally:
+            self.memory_stack = outer
+        # endregion
+
+    def statement(self, start: int, end: int, last: bool) -> _Instruction:
+        """
+        :param start: Index of the statement's first token.
+        :param end: Index past the statement's last token.
+        :param last: If this is the last statement of its block, the only place a memory call is allowed.
+        """
+        tokens: list[_Token] = self.tokens
+        start = self._skip_space(start, end)
+        text: str = _statement_text(self.source, tokens, start, end)
+
+        head: _Token = tokens[start]
+        if head.type is _TokenType.IDENT and start + 1 < end and self.source[tokens[start + 1].start] == '(':
+            keyword: str = self.source[head.start:head.end]
+            signatures: list[tuple[_Pattern, int, type[_Instruction]]] | None = _dispatch.get(keyword)
+            if signatures is not None:
+                return self._instruction(text, keyword, signatures)
+
+        # Perform memory call;
+        # 1. If not at the end, cannot perform a memory call for an instruction block
+        # 2. See if the key exists
+        # 3. See if resulting type is compatible for output.
+        if not last:
+            raise _InstructionParseError(self.source, reason=f'Found memory print instruction **{text}** before '
+                                                             f'the end of its block.')
+        res_type: type | None = self.memory_stack.fetch(text)
+        if res_type is None:
+            raise _InstructionParseError(text, f'Key {text} not found.')
+        # todo: supported output memory type?
+        return _MemoryInstruction(key=text)
+
+    def _instruction(self, text: str, keyword: str,
+                     signatures: list[tuple[_Pattern, int, type[_Instruction]]]) -> _Instruction:
+        for sig, ident, inst_type in signatures:
+            match: _Match | None = sig.match(text)
+            if not match:
+                continue
+            try:
+                return inst_type.from_match(match, ident, self.memory_stack, self.recursion_depth, self.writing)
+            except _CustomDiscordException as e:
+                raise e
+            except Exception as e:
+                err = _InstructionParseError(text, f'Error occurred when trying to parse input for input '
+                                                   f'({inst_type.__name__} signature ID {ident})')
+                err.cause = e
+                raise err
+        raise _InstructionParseError(text, f'Arguments do not match any signature of **{keyword}**.')
+
+    def _skip_space(self, start: int, end: int) -> int:
+        while start < end and self.tokens[start].type is _TokenType.SPACE:
+            start += 1
+        return start
+
+
+def _parse_top_level(parse_string: str, recursion_depth: int, memory_stack: _Scope[type], writing: bool) -> list[_Instruction]:
     """
     Decomposes input string into text and Instructions blocks by turning them into Instructions.
     :param parse_string: Input string containing variable blocks.
@@ -28,52 +170,10 @@ def _parse_top_level(parse_string: str, recursion_depth: int, memory_stack: list
     """
     if recursion_depth > MAX_RECURSION_DEPTH: raise _InstructionParseError(parse_string, reason='Maximum recursion depth exceeded. Lower the complexity of your input.')
 
-    # Trackers
-    instructions: list[_Instruction] = [] # final output for this subsection
-
-    i: int = 0 # Position in str
-    n: int = len(parse_string)
-
-    build: str = '' # currently building string output / input (for block)
-    opened: int = 0  # { Count scope; Decrease when } found
-
-    while i < n:
-        # Is this character escaped?
-        escaped: bool = i > 0 and build[i - 1] == '\\'
-
-        char: str = parse_string[i]
-
-        if char == '\\':
-            # Opened clause to preserve escape symbols until their required layer.
-            if escaped or opened > 0:
-                build += char
-        elif escaped:
-            build += char
-        elif char == '{':
-            if opened == 0 and build:
-                instructions.append(_BuildInstruction(text=build))
-                build = ''
-            opened += 1
-        elif char == '}':
-            if opened > 0:
-                opened -= 1
-                if opened == 0:
-                    # Insert build into parser
-                    instructions += _parse_instruction_block(build, memory_stack, recursion_depth, writing)
-                    build = ''
-            else:
-                raise _InstructionParseError(parse_string, reason=f'Found block-closing symbol at pos {i} before a block-opening symbol.')
-        else:
-            build += char
-
-        i += 1 # Mandatory, next char
-    if opened != 0: raise _InstructionParseError(parse_string, reason=f'Input left with {opened} unclosed scopes.')
-    if build: instructions.append(_BuildInstruction(text=build))
+    return _Parser(parse_string, _tokenize(parse_string), memory_stack, recursion_depth, writing).top_level()
 
-    return instructions
 
-
-def _parse_instruction_block(parse_string: str, memory_stack: list[dict[str, type]], recursion_depth: int, writing: bool) -> list[_Instruction]:
+def _parse_instruction_block(parse_string: str, memory_stack: _Scope[type], recursion_depth: int, writing: bool) -> list[_Instruction]:
     """
     Determines instruction type(s) and creates instructions using their parameters.
     :param parse_string: Input string
@@ -85,114 +185,7 @@ def _parse_instruction_block(parse_string: str, memory_stack: list[dict[str, typ
     if recursion_depth > MAX_RECURSION_DEPTH:
         raise _InstructionParseError(parse_string, 'Maximum recursion depth exceeded. Lower the complexity of your input.')
 
-    # region Step 1: separate into instruction subsections.
-    subsections: list[str] = [] # Top-level instructions separated by ;
-    build: str = '' # Current subsection.
-
-    layer_stack: list[str] = [] # Stack of opened layers for the current subsection.
-    # Populated with expected characters, not the bounds that placed them.
-
-    i: int = 0
-    n: int = len(parse_string)
-
-    while i < n:
-        escaped: bool = i > 0 and parse_string[i - 1] == '\\'
-        top_stack: str = '' if not layer_stack else layer_stack[-1]
-
-        char: str = parse_string[i]
-
-        if char == '\\':
-            if escaped and not layer_stack:
-                build += char
-
-        elif escaped:
-            build += char
-
-        elif char == terminator:
-            if layer_stack:
-                build += char
-            else:
-                subsections.append(build)
-                build = ''
-
-        elif char in doubles:
-            if char == top_stack:
-                layer_stack.pop()
-            else:
-                layer_stack.append(char)
-
-            build += char
-
-        elif char in bounds:
-            build += char
-            layer_stack.append(be_map[char])
-
-        elif char in escapes:
-            if char == top_stack:
-                layer_stack.pop()
-                build += char
-            else:
-                raise _InstructionParseError(build, f'Unexpected escape symbol found. Found {char}, expected {top_stack}')
-
-        else:
-            build += char
-
-        i += 1
-
-    if layer_stack: raise _InstructionParseError(build, f'Unescaped layers. Expected **{' '.join(reversed(layer_stack))}**.')
-    if build: subsections.append(build)
-
-    # Minor postprocessing
-    subsections = [i.strip() for i in subsections]
-
-    # Memory cleanup to not fudge references
-    del build, layer_stack, char, escaped, i, n
-    # endregion
-
-    # todo: how the FUCK is the memory stack going to work.
-    local_scope: dict[str, type] = {} if memory_stack else INITIAL_MEMORY_TYPES.copy()
-    memory_stack.append(local_scope)
-
-    # region Step 2: Instruction recognition
-    instructions: list[_Instruction] = []
-
-    n: int = len(subsections) # To keep track of if stuff is still required to be done.
-
-    # Go over each subsection and determine containing Instruction based on Signature.
-    for i, subsection in enumerate(subsections):
-        found: bool = False # Keep track of if an Instruction was found.
-        for inst_type in _parse_order:
-            for sig, ident in inst_type.signatures():
-                match: _Match | None = _re.match(sig, subsection)
-                if match:
-                    try:
-                        instructions.append(inst_type.from_match(match, ident, memory_stack, recursion_depth, writing))
-                    except _CustomDiscordException as e:
-                        raise e
-                    except Exception as e:
-                        err = _InstructionParseError(subsection, f'Error occurred when trying to parse input for input ({inst_type.__name__} signature ID {ident})')
-                        err.cause = e
-                        raise err
-
-                    found = True
-                    break
-            if found: break
-
-        if not found:
-            # Perform memory call;
-            # 1. If not at the end, cannot perform a memory call for an instruction block
-            # 2. See if the key exists
-            # 3. See if resulting type is compatible for output.
-            if i < n:
-                raise _InstructionParseError(parse_string, reason=f'Found memory print instruction **{subsection}** at section {i} before end of input.')
-            res_type: type | None = _fetch(memory_stack, subsection)
-            if res_type is None:
-                raise _InstructionParseError(subsection, f'Key {subsection} not found.')
-            # todo: supported output memory type?
-            instructions.append(_MemoryInstruction(key=subsection))
-
-    return instructions
-    # endregion
+    return _Parser(parse_string, _tokenize(parse_string, block=True), memory_stack, recursion_depth, writing).block()
 
 
 def parse_instructions_from_string(txt: str, ) -> list[_Instruction]:
@@ -201,6 +194,6 @@ def parse_instructions_from_string(txt: str, ) -> list[_Instruction]:
     return _parse_top_level(
         parse_string=txt,
         recursion_depth=0,
-        memory_stack=[],
+        memory_stack=INITIAL_MEMORY_SCOPE,
         writing=False,
     )
\ No newline at end of file
@@ -0,0 +1,153 @@
+import re as _re
+from enum import Enum as _Enum
+from typing import NamedTuple as _NamedTuple
+
+from piss.exceptions import InstructionParseError as _InstructionParseError
+# noinspection protected-member
+from piss._utils.symbols import be_map
+
+"""
+Single-pass lexer for PISS source. Splits the source into token spans without copying it; the parser slices the
+source only where it needs text.
+
+Outside of blocks the source is text, escapes and block bounds. Inside a block, it is the statement syntax:
+identifiers, numbers, quoted strings (escapes kept as written), brackets and `;`. Brackets and strings are matched
+here, so a `}` inside a string or brackets never closes the block.
+"""
+
+
+class TokenType(_Enum):
+    # Text
+    TEXT = 'text'
+    BLOCK_OPEN = 'block_open'
+    BLOCK_CLOSE = 'block_close'
+
+    # Blocks
+    SPACE = 'space'
+    IDENT = 'ident'
+    NUMBER = 'number'
+    STRING = 'string'
+    OPEN = 'open'
+    CLOSE = 'close'
+    TERMINATOR = 'terminator'
+    OTHER = 'other'
+
+    # Both: a backslash and the character it escapes.
+    ESCAPE = 'escape'
+
+
+class Token(_NamedTuple):
+    type: TokenType
+    start: int
+    end: int
+
+
+_TEXT = _re.compile(r'[^{}\\]+')
+_ESCAPE = _re.compile(r'\\.?', _re.S)
+_BLOCK = _re.compile(r'''
+    (?P<SPACE>\s+)
+    |(?P<IDENT>[A-Za-z_][\w.]*)
+    |(?P<NUMBER>\d[\w.]*)
+    |(?P<STRING>'(?:[^'\\]|\\.)*'|"(?:[^"\\]|\\.)*")
+    |(?P<ESCAPE>\\.?)
+    |(?P<OPEN>[(\[{])
+    |(?P<CLOSE>[)\]}])
+    |(?P<TERMINATOR>;)
+    |(?P<UNCLOSED>['"])
+    |(?P<OTHER>[^\s\w'"\\()\[\]{};]+)
+''', _re.X | _re.S)
+_TYPES: dict[str, TokenType] = {t.name: t for t in TokenType}
+
+
+def tokenize(source: str, block: bool = False) -> list[Token]:
+    """
+    Splits PISS source into tokens in one pass.
+    :param source: PISS source.
+    :param block: Lex `source` as the inside of a block (the contents of `writing(...)`, for example) instead of as text.
+    :return: Tokens, covering all of `source` in order.
+    :raises InstructionParseError: Unmatched bounds or quotes.
+    """
+    tokens: list[Token] = []
+    append = tokens.append
+    new = tuple.__new__  # Token(...) without the generated __new__ in between; this loop runs once per token.
+    match_block = _BLOCK.match
+    i: int = 0
+    n: int = len(source)
+
+    in_block: bool = block
+    closers: list[str] = []  # Expected closing symbols of the open brackets in the current block.
+
+    while i < n:
+        char: str = source[i]
+
+        if not in_block:
+            if char == '{':
+                append(new(Token, (TokenType.BLOCK_OPEN, i, i + 1)))
+                in_block = True
+                i += 1
+            elif char == '}':
+                raise _InstructionParseError(source, reason=f'Found block-closing symbol at pos {i} before a '
+                                                            f'block-opening symbol.')
+            elif char == '\\':
+                end: int = _ESCAPE.match(source, i).end()
+                append(new(Token, (TokenType.ESCAPE, i, end)))
+                i = end
+            else:
+                end: int = _TEXT.match(source, i).end()
+                append(new(Token, (TokenType.TEXT, i, end)))
+                i = end
+            continue
+
+        match: _re.Match = match_block(source, i)
+        kind: str = match.lastgroup
+        end: int = match.end()
+
+        if kind == 'OPEN':
+            closers.append(be_map[char])
+        elif kind == 'CLOSE':
+            if closers:
+                if char != closers[-1]:
+                    raise _InstructionParseError(source, f'Unexpected closing symbol found at pos {i}. '
+                                                         f'Found {char}, expected {closers[-1]}')
+                closers.pop()
+            elif char == '}' and not block:
+                append(new(Token, (TokenType.BLOCK_CLOSE, i, end)))
+                in_block = False
+                i = end
+                continue
+            else:
+                raise _InstructionParseError(source, reason=f'Found closing symbol {char} at pos {i} before its '
+                                                            f'opening symbol.')
+        elif kind == 'UNCLOSED':
+            raise _InstructionParseError(source, f'Unclosed string starting at pos {i}. Expected **{char}**.')
+
+        append(new(Token, (_TYPES[kind], i, end)))
+        i = end
+
+    if closers:
+        raise _InstructionParseError(source, f'Unclosed brackets. Expected **{' '.join(reversed(closers))}**.')
+    if in_block and not block:
+        raise _InstructionParseError(source, reason='Input left with an unclosed block.')
+    return tokens
+
+
+def statement_text(source: str, tokens: list[Token], start: int, end: int) -> str:
+    """
+    Text of a statement, with escapes outside of strings resolved to the character they escape.
+    :param source: Source the tokens were lexed from.
+    :param tokens: Tokens of the source.
+    :param start: Index of the statement's first token.
+    :param end: Index past the statement's last token.
+    """
+    if start >= end:
+        return ''
+    parts: list[str] = []
+    last: int = tokens[start].start
+    for token in tokens[start:end]:
+        if token.type is TokenType.ESCAPE:
+            parts.append(source[last:token.start])
+            parts.append(source[token.start + 1:token.end])
+            last = token.end
+    parts.append(source[last:tokens[end - 1].end])
+    return ''.join(parts).strip()
+
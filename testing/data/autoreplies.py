@@ -2,6 +2,7 @@ from typing import get_args
 
 from data.interfaces.autoreplies import GlobalTextAutoreplyInterface, reply_types, trigger_types, \
     SimpleReplyData, SimpleTriggerData, SimpleAliasData
+from data.interfaces.utilities.triggers import TriggerMatcher
 
 
 class TestAutoreplyDatabase(GlobalTextAutoreplyInterface):
@@ -41,7 +42,8 @@ class TestAutoreplyDatabase(GlobalTextAutoreplyInterface):
 
         return SimpleAliasData(name=name, rate=256)
 
-    def add_trigger(self, alias: str, trigger_type: trigger_types, data: str, rate: int | None) -> None:
+    def add_trigger(self, alias: str, trigger_type: trigger_types, data: str, rate: int | None,
+                    case_insensitive: bool = False) -> None:
         if not self.alias_exists(alias):
             raise ValueError('invalid alias name')
         if not trigger_type in get_args(trigger_types):
@@ -49,18 +51,18 @@ class TestAutoreplyDatabase(GlobalTextAutoreplyInterface):
         if rate is not None and not (1 <= rate <= 256):
             raise Exception('rate out of bounds')
 
-    def edit_trigger(self, alias: str, index: int, trigger_type: trigger_types, data: str | None,
-                     rate: int | None) -> None:
+    def edit_trigger(self, alias: str, index: int, trigger_type: trigger_types | None, data: str | None,
+                     rate: int | None, case_insensitive: bool | None = None) -> None:
         if not self.alias_exists(alias):
             raise ValueError('invalid alias name')
         if not index == 1:
             raise IndexError('index out of bounds')
-        if not trigger_type in get_args(trigger_types):
+        if trigger_type is not None and not trigger_type in get_args(trigger_types):
             raise Exception('invalid trigger type')
         if rate is not None and not (1 <= rate <= 256):
             raise Exception('rate out of bounds')
-        if data is None and rate is None:
-            raise AttributeError('both inputs None')
+        if trigger_type is None and data is None and rate is None and case_insensitive is None:
+            raise AttributeError('all inputs None')
 
     def remove_trigger(self, alias: str, index: int) -> SimpleTriggerData:
         if not self.alias_exists(alias):
@@ -97,7 +99,11 @@ class TestAutoreplyDatabase(GlobalTextAutoreplyInterface):
         return SimpleReplyData(reply_type='text', data=f'Reply from alias {alias} at index {index}', weight=1)
 
     def __init__(self):
-        ...
+        # Sample pool is static, so one snapshot does.
+        self._trigger_matcher: TriggerMatcher = TriggerMatcher(self.get_triggers_by_alias())
+
+    def get_trigger_matcher(self) -> TriggerMatcher:
+        return self._trigger_matcher
 
     def get_reply(self, alias: str) -> SimpleReplyData | None:
         if not self.alias_exists(alias):
@@ -124,7 +130,7 @@ class TestAutoreplyDatabase(GlobalTextAutoreplyInterface):
                 SimpleTriggerData(trigger_type='regex', data=r'^number_(\d)+$', rate=None)
             ],
             SimpleAliasData(name='error_test', rate=256): [
-                SimpleTriggerData(trigger_type='regex', data=r'^error_test$', rate=None)
+                SimpleTriggerData(trigger_type='exact', data='error_test', rate=None)
             ]
         }
 
@@ -147,7 +153,7 @@ class TestAutoreplyDatabase(GlobalTextAutoreplyInterface):
         elif alias == 'text':
             return SimpleTriggerData(trigger_type='regex', data=r'^text_autoreply_test$', rate=None)
         elif alias == 'error_test':
-            return SimpleTriggerData(trigger_type='regex', data=r'^error_test$', rate=None)
+            return SimpleTriggerData(trigger_type='exact', data='error_test', rate=None)
         else:
             return SimpleTriggerData(trigger_type='regex', data=r'^number_(\d)+$', rate=None)
 
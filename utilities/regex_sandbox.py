@@ -0,0 +1,134 @@
+import asyncio
+import multiprocessing as _mp
+import re as _re
+from multiprocessing.connection import Connection
+from time import time
+from typing import Awaitable, Callable
+
+# Per evaluation budget in seconds, including the round trip to the worker (tens of microseconds).
+# A sane pattern on a Discord-sized message finishes orders of magnitude faster.
+DEFAULT_TIMEOUT: float = 0.1
+_START_TIMEOUT: float = 30.0
+
+
+def _worker(conn: Connection) -> None:
+    """
+    Worker process loop. Receives (pattern, flags, content) and answers whether the pattern matches the content.
+    """
+    compiled: dict[tuple[str, int], _re.Pattern] = {}
+    conn.send(True)  # Ready; interpreter start-up must not count against the first evaluation.
+    while True:
+        try:
+            pattern, flags, content = conn.recv()
+        except (EOFError, OSError):
+            return  # Parent went away.
+
+        try:
+            key: tuple[str, int] = (pattern, flags)
+            if key not in compiled:
+                compiled[key] = _re.compile(pattern, flags)
+            conn.send(compiled[key].match(content) is not None)
+        except _re.error:
+            conn.send(False)
+
+
+class RegexSandbox:
+    """
+    Evaluates regular expressions in a separate process with a hard time limit, so a catastrophically backtracking
+    pattern cannot stall the event loop.
+    Patterns that run out of time are quarantined: they are never evaluated again by this sandbox, and count as no match.
+    Quarantine is kept in memory only. After a restart, a stored pattern that ran out of time before gets one more
+    evaluation, which costs one timeout and one worker restart, before it is quarantined again.
+    """
+
+    def __init__(self, timeout: float = DEFAULT_TIMEOUT,
+                 on_quarantine: Callable[[str, int], Awaitable[None]] | None = None) -> None:
+        """
+        :param timeout: Time budget of a single evaluation, in seconds, including the round trip to the worker.
+        :param on_quarantine: Awaited with the pattern and flags of every newly quarantined pattern.
+        """
+        self.timeout: float = timeout
+        self.on_quarantine: Callable[[str, int], Awaitable[None]] | None = on_quarantine
+        # (pattern, flags) -> POSIX timestamp of quarantine.
+        self.quarantined: dict[tuple[str, int], float] = {}
+
+        # Spawned rather than forked, the parent holds sockets and an event loop the worker has no business with.
+        self._context = _mp.get_context('spawn')
+        self._process: _mp.Process | None = None
+        self._conn: Connection | None = None
+        self._lock: asyncio.Lock = asyncio.Lock()  # One evaluation in flight per worker.
+
+    # region process
+    def _start(self) -> None:
+        parent, child = self._context.Pipe()
+        self._process = self._context.Process(target=_worker, args=(child,), daemon=True,
+                                              name='regex-sandbox')
+        self._process.start()
+        child.close()
+        self._conn = parent
+        try:
+            ready: bool = parent.poll(_START_TIMEOUT) and parent.recv()
+        except (EOFError, OSError):
+            ready = False
+        if not ready:
+            self._kill()
+            raise RuntimeError('Regex sandbox worker failed to start')
+
+    def _kill(self) -> None:
+        if self._process is not None:
+            self._process.kill()
+            self._process.join()
+        if self._conn is not None:
+            self._conn.close()
+        self._process, self._conn = None, None
+
+    def close(self) -> None:
+        """
+        Stops the worker process. The sandbox restarts it on next use.
+        """
+        self._kill()
+    # endregion
+
+    def is_quarantined(self, pattern: str, flags: int = 0) -> bool:
+        return (pattern, flags) in self.quarantined
+
+    def _evaluate(self, pattern: str, flags: int, content: str) -> bool | None:
+        """
+        Blocking evaluation in the worker.
+        :return: Whether the pattern matched, or None if it ran out of time.
+        """
+        if self._process is None or not self._process.is_alive():
+            self._kill()
+            self._start()
+
+        try:
+            self._conn.send((pattern, flags, content))
+            if self._conn.poll(self.timeout):
+                return self._conn.recv()
+        except (EOFError, OSError):
+            # Worker died on its own, which says nothing about the pattern. Restart on next use.
+            self._kill()
+            return False
+
+        # The worker is stuck inside the regex engine; there is no way to interrupt it but to end it.
+        self._kill()
+        return None
+
+    async def match(self, pattern: str, flags: int, content: str) -> bool:
+        """
+        Does the pattern match the start of the content? Evaluated in the worker process, off the event loop.
+        Quarantines the pattern if it runs out of time.
+        :return: Match result. Quarantined patterns never match.
+        """
+        if self.is_quarantined(pattern, flags):
+            return False
+
+        async with self._lock:
+            result: bool | None = await asyncio.to_thread(self._evaluate, pattern, flags, content)
+
+        if result is None:
+            self.quarantined[(pattern, flags)] = time()
+            if self.on_quarantine is not None:
+                await self.on_quarantine(pattern, flags)
+            return False
+        return result